@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Benchmark suite runner
+
+Run the benchmark suite (or the benchmarks matching some patterns) and
+optionally save the results as JSON::
+
+    $ python benchmarks/run.py run -o before.json
+    $ python benchmarks/run.py run -o after.json "core.*" "web.*"
+
+Compare two result files; the exit status is 1 if any benchmark got
+significantly slower::
+
+    $ python benchmarks/run.py compare before.json after.json
+"""
+from __future__ import print_function
+
+import os
+import sys
+from argparse import ArgumentParser
+
+# Benchmark the circuits of this tree, installed or not
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+import suite  # noqa
+
+
+def parse_args():
+    parser = ArgumentParser(description="circuits benchmark suite")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="run benchmarks")
+    run.add_argument(
+        "patterns", nargs="*", metavar="PATTERN",
+        help="only run benchmarks matching these shell style patterns"
+    )
+    run.add_argument(
+        "-o", "--output", metavar="FILE", help="write the results to FILE"
+    )
+    run.add_argument(
+        "-s", "--samples", type=int, default=5,
+        help="number of samples per benchmark (default: %(default)s)"
+    )
+    run.add_argument(
+        "-w", "--warmups", type=int, default=1,
+        help="number of warmup samples (default: %(default)s)"
+    )
+    run.add_argument(
+        "-t", "--min-time", type=float, default=0.1,
+        help="minimum duration of a sample in seconds (default: %(default)s)"
+    )
+    run.add_argument(
+        "-l", "--list", action="store_true",
+        help="list the benchmarks instead of running them"
+    )
+
+    compare = commands.add_parser("compare", help="compare two results")
+    compare.add_argument("old", metavar="OLD", help="reference results")
+    compare.add_argument("new", metavar="NEW", help="results to check")
+    compare.add_argument(
+        "--threshold", type=float, default=0.05,
+        help="relative change considered significant (default: %(default)s)"
+    )
+
+    args = parser.parse_args()
+    if args.command is None:
+        parser.error("a command is required")
+    return args
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "run":
+        if args.list:
+            for name in suite.load_benchmarks():
+                print(name)
+            return 0
+
+        results = suite.run(
+            args.patterns, samples=args.samples, warmups=args.warmups,
+            min_time=args.min_time, verbose=True
+        )
+        if args.output:
+            suite.dump(results, args.output)
+        return 0
+
+    rows = suite.compare(
+        suite.load(args.old), suite.load(args.new), args.threshold
+    )
+    suite.print_comparison(rows)
+    return 1 if any(row[-1] == "slower" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""Benchmark suite
+
+A small, dependency free benchmark runner in the spirit of pyperf.
+
+Benchmarks are functions registered with :func:`benchmark` that take a
+number of *loops*, run the measured operation that many times and return
+the elapsed time (so that any setup is excluded). The runner calibrates
+the number of loops so that one sample takes at least *min_time*
+seconds, runs warmup samples and then collects the samples that make up
+the result (in seconds per loop). Benchmarks measuring something else,
+e.g. memory in bytes, are run with a fixed number of loops.
+
+Results are stored as JSON and two result files can be compared with
+:func:`compare`.
+"""
+from __future__ import division, print_function
+
+import json
+import math
+import platform
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from fnmatch import fnmatch
+from importlib import import_module
+from multiprocessing import cpu_count
+
+try:
+    from time import perf_counter as clock
+except ImportError:
+    from time import time as clock  # NOQA
+
+#: Version of the JSON result format.
+FORMAT_VERSION = 1
+
+MODULES = (
+    "core", "net", "web", "protocols", "serialization", "ipc", "imports",
+)
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name, unit="s", loops=None):
+    """
+    Register the decorated function as benchmark *name*. Unless *unit*
+    is ``"s"`` (seconds), the function returns the total for *loops*
+    loops rather than the elapsed time.
+    """
+
+    def decorate(f):
+        f.unit, f.loops = unit, loops
+        BENCHMARKS[name] = f
+        return f
+    return decorate
+
+
+def load_benchmarks():
+    for module in MODULES:
+        import_module("{0:s}.{1:s}".format(__name__, module))
+    return BENCHMARKS
+
+
+def calibrate(f, min_time):
+    loops = 1
+    while True:
+        elapsed = f(loops)
+        if elapsed >= min_time or loops >= 2 ** 32:
+            return loops
+        if elapsed <= 0:
+            loops *= 10
+        else:
+            loops = max(loops * 2, int(loops * min_time * 1.2 / elapsed))
+
+
+def stats(values):
+    values = sorted(values)
+    n = len(values)
+    mean = sum(values) / n
+    median = (values[(n - 1) // 2] + values[n // 2]) / 2
+    stdev = math.sqrt(
+        sum((x - mean) ** 2 for x in values) / (n - 1)
+    ) if n > 1 else 0.0
+    return {
+        "mean": mean, "median": median, "stdev": stdev,
+        "min": values[0], "max": values[-1],
+    }
+
+
+def metadata():
+    from circuits import __version__
+
+    return {
+        "date": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": cpu_count(),
+        "circuits": __version__,
+    }
+
+
+def run(patterns=None, samples=5, warmups=1, min_time=0.1, verbose=False):
+    """
+    Run the benchmarks whose name matches any of the shell style
+    *patterns* (all if ``None``) and return the results as a dict.
+    """
+
+    results = OrderedDict()
+    for name, f in load_benchmarks().items():
+        if patterns and not any(fnmatch(name, p) for p in patterns):
+            continue
+
+        loops = f.loops or calibrate(f, min_time)
+        for i in range(warmups):
+            f(loops)
+        values = [f(loops) / loops for i in range(samples)]
+
+        result = {"loops": loops, "unit": f.unit, "values": values}
+        result.update(stats(values))
+        results[name] = result
+
+        if verbose:
+            print("{0:36s} {1:>12s} +- {2:s}".format(
+                name, format_value(result["median"], f.unit),
+                format_value(result["stdev"], f.unit)
+            ))
+
+    return {
+        "version": FORMAT_VERSION,
+        "metadata": metadata(),
+        "benchmarks": results,
+    }
+
+
+def dump(results, filename):
+    with open(filename, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(filename):
+    with open(filename) as f:
+        results = json.load(f)
+    if results.get("version") != FORMAT_VERSION:
+        raise ValueError(
+            "{0:s}: unsupported result format".format(filename)
+        )
+    return results
+
+
+def compare(old, new, threshold=0.05):
+    """
+    Compare the benchmark results *new* to *old*. Returns a list of
+    ``(name, unit, old median, new median, ratio, verdict)`` for all
+    benchmarks present in both, where *verdict* is ``"slower"``,
+    ``"faster"`` or ``"same"`` (for other units than seconds too, e.g.
+    "slower" meaning more bytes). A change is only significant if the
+    medians differ by more than *threshold* (relative) and by more than
+    twice the larger standard deviation.
+    """
+
+    rows = []
+    for name, a in old["benchmarks"].items():
+        b = new["benchmarks"].get(name)
+        if b is None:
+            continue
+
+        ratio = b["median"] / a["median"]
+        delta = b["median"] - a["median"]
+        noise = 2 * max(a["stdev"], b["stdev"])
+        if abs(ratio - 1) <= threshold or abs(delta) <= noise:
+            verdict = "same"
+        elif delta > 0:
+            verdict = "slower"
+        else:
+            verdict = "faster"
+
+        rows.append((
+            name, b.get("unit", "s"), a["median"], b["median"], ratio,
+            verdict
+        ))
+    return rows
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds >= 1 / scale:
+            return "{0:.2f} {1:s}".format(seconds * scale, unit)
+    return "{0:.0f} ns".format(seconds * 1e9)
+
+
+def format_value(value, unit):
+    if unit == "s":
+        return format_time(value)
+    return "{0:.1f} {1:s}".format(value, unit)
+
+
+def print_comparison(rows, file=sys.stdout):
+    for name, unit, a, b, ratio, verdict in rows:
+        print("{0:36s} {1:>12s} -> {2:>12s} {3:6.2f}x {4:s}".format(
+            name, format_value(a, unit), format_value(b, unit), ratio,
+            verdict
+        ), file=file)
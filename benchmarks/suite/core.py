@@ -0,0 +1,402 @@
+"""Core benchmarks: event dispatch, call/wait, timers, tasks and workers"""
+from threading import Event as Flag
+
+from circuits import (
+    Component, ComponentPool, Event, Manager, Metrics, Recorder, Timer,
+    Worker, handler, sleep, task,
+)
+
+from . import benchmark, clock
+from .net import start_manager, wait
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+class ping(Event):
+
+    """ping Event"""
+
+
+class run(Event):
+
+    """run Event"""
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+class heartbeat(Event):
+
+    """heartbeat Event"""
+
+
+class Pinger(Component):
+
+    channel = "ping"
+
+    def ping(self):
+        pass
+
+
+class Caller(Component):
+
+    @handler("run")
+    def _on_run(self, n):
+        for i in range(n):
+            yield self.call(hello())
+        yield n
+
+    @handler("hello")
+    def _on_hello(self):
+        return "Hello World!"
+
+
+def flush(m):
+    while len(m):
+        m.flush()
+
+
+def setup(threadsafe=True, instrument=None):
+    m = Manager()
+    m.threadsafe = threadsafe
+    Pinger().register(m)
+    if instrument is not None:
+        instrument().register(m)
+    flush(m)
+    return m
+
+
+@benchmark("core.fire_flush")
+def fire_flush(loops, batch=100, threadsafe=True, instrument=None):
+    m = setup(threadsafe, instrument)
+    fire = m.fire
+
+    start = clock()
+    for i in range(loops // batch):
+        for j in range(batch):
+            fire(ping(), "ping")
+        m.flush()
+    for j in range(loops % batch):
+        fire(ping(), "ping")
+    m.flush()
+    return clock() - start
+
+
+@benchmark("core.fire_flush_single_threaded")
+def fire_flush_single_threaded(loops):
+    return fire_flush(loops, threadsafe=False)
+
+
+@benchmark("core.fire")
+def fire(loops, batch=100, threadsafe=True):
+    # Only the firing is timed, the events are flushed in between
+    m = setup(threadsafe)
+    fire = m.fire
+
+    elapsed = 0
+    for i in range(0, loops, batch):
+        start = clock()
+        for j in range(min(batch, loops - i)):
+            fire(ping(), "ping")
+        elapsed += clock() - start
+        m.flush()
+    return elapsed
+
+
+@benchmark("core.fire_single_threaded")
+def fire_single_threaded(loops):
+    return fire(loops, threadsafe=False)
+
+
+@benchmark("core.fire_flush_metrics")
+def fire_flush_metrics(loops):
+    return fire_flush(loops, instrument=Metrics)
+
+
+@benchmark("core.fire_flush_recorder")
+def fire_flush_recorder(loops):
+    return fire_flush(loops, instrument=Recorder)
+
+
+@benchmark("core.fire_flush_priorities")
+def fire_flush_priorities(loops, batch=100, priorities=(0, 0, 0, 1, -1)):
+    m = setup()
+    fire = m.fire
+    n = len(priorities)
+
+    start = clock()
+    for i in range(loops):
+        fire(ping(), "ping", priority=priorities[i % n])
+        if not i % batch:
+            m.flush()
+    m.flush()
+    return clock() - start
+
+
+class Connection(Component):
+
+    """What is typically created per connection"""
+
+    def read(self, data):
+        pass
+
+    def write(self, data):
+        pass
+
+    @handler("disconnect")
+    def _on_disconnect(self):
+        self.unregister()
+
+
+def queued_memory(loops, fire):
+    # Bytes held by the queue per event fired and not dispatched yet
+    m = Manager()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        fire(m, loops)
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+if tracemalloc is not None:
+    @benchmark("core.event_memory", unit="B", loops=10000)
+    def event_memory(loops):
+        def fire(m, loops):
+            for i in range(loops):
+                m.fire(ping(i), "ping")
+        return queued_memory(loops, fire)
+
+    @benchmark("core.event_memory_internal", unit="B", loops=10000)
+    def event_memory_internal(loops):
+        # Events fired by the core (e.g. pollers), whose Value nobody
+        # asks for
+        def fire(m, loops):
+            for i in range(loops):
+                m._fireEvent(ping(i), ("ping",))
+        return queued_memory(loops, fire)
+
+
+@benchmark("core.create_register")
+def create_register(loops, batch=1000):
+    # One tree; with -t 5 or so this creates 100k+ components
+    m = setup()
+
+    start = clock()
+    for i in range(loops):
+        Connection().register(m)
+        if not i % batch:
+            m.flush()
+    m.flush()
+    return clock() - start
+
+
+class Socket(Component):
+
+    """Listens for unregistering like the socket components do"""
+
+    @handler("prepare_unregister", channel="*")
+    def _on_prepare_unregister(self, event, c):
+        pass
+
+
+def server():
+    m = setup()
+    for i in range(10):
+        Socket().register(m)
+    flush(m)
+    return m
+
+
+@benchmark("core.register_unregister")
+def register_unregister(loops):
+    m = server()
+
+    start = clock()
+    for i in range(loops):
+        c = Connection().register(m)
+        flush(m)
+        c.unregister()
+        flush(m)
+    return clock() - start
+
+
+@benchmark("core.attach_detach")
+def attach_detach(loops):
+    m = server()
+
+    start = clock()
+    for i in range(loops):
+        c = Connection().attach(m)
+        flush(m)
+        c.detach()
+        flush(m)
+    return clock() - start
+
+
+@benchmark("core.pool")
+def pool(loops):
+    m = server()
+    connections = ComponentPool(Connection)
+
+    start = clock()
+    for i in range(loops):
+        c = connections.acquire(m)
+        flush(m)
+        connections.release(c)
+        flush(m)
+    return clock() - start
+
+
+@benchmark("core.dispatch_churn")
+def dispatch_churn(loops, size=10000, churn=100):
+    # A large tree whose connections keep coming and going
+    m = setup()
+    for i in range(size):
+        Connection(channel="conn-{0:d}".format(i)).register(m)
+    flush(m)
+
+    start = clock()
+    for i in range(loops):
+        m.fire(ping(), "ping")
+        if not i % churn:
+            c = Connection(channel="conn-x").register(m)
+            flush(m)
+            c.unregister()
+        flush(m)
+    return clock() - start
+
+
+@benchmark("core.cache_miss")
+def cache_miss(loops):
+    m = setup()
+    fire, cache = m.fire, m.handler_cache
+
+    start = clock()
+    for i in range(loops):
+        cache.clear()
+        fire(ping(), "ping")
+        m.flush()
+    return clock() - start
+
+
+@benchmark("core.cache_churn")
+def cache_churn(loops):
+    # Events on per-connection channels, each one a miss that evicts an
+    # entry once the cache is full
+    m = setup()
+    m.handler_cache.size = 256
+    fire = m.fire
+    channels = ["conn-{0:d}".format(i) for i in range(loops)]
+
+    start = clock()
+    for channel in channels:
+        fire(ping(), channel)
+        m.flush()
+    return clock() - start
+
+
+@benchmark("core.call_wait")
+def call_wait(loops):
+    app = Caller()
+    flush(app)
+
+    start = clock()
+    x = app.fire(run(loops))
+    while not x.result:
+        app.tick()
+    return clock() - start
+
+
+@benchmark("core.timer_reset")
+def timer_reset(loops, size=1000):
+    m = Manager()
+    timers = [
+        Timer(3600, heartbeat(), persist=True).register(m)
+        for i in range(size)
+    ]
+    flush(m)
+
+    start = clock()
+    for i in range(loops):
+        timers[i % size].reset()
+    return clock() - start
+
+
+@benchmark("core.tick_timers")
+def tick_timers(loops, size=10000):
+    m = Manager()
+    for i in range(size):
+        Timer(3600, heartbeat(), persist=True).register(m)
+    flush(m)
+
+    # What run() does, minus the thread and the poller
+    m._running = True
+
+    start = clock()
+    for i in range(loops):
+        m.tick(0)
+    return clock() - start
+
+
+class nap(Event):
+
+    """nap Event"""
+
+
+class Sleeper(Component):
+
+    def nap(self):
+        yield sleep(3600)
+
+
+@benchmark("core.tick_parked_tasks")
+def tick_parked_tasks(loops, size=10000):
+    app = Sleeper()
+    for i in range(size):
+        app.fire(nap())
+    for i in range(5):
+        app.tick()
+
+    start = clock()
+    for i in range(loops):
+        app.tick()
+    return clock() - start
+
+
+def noop():
+    pass
+
+
+class Waiter(Component):
+
+    channel = "worker"
+
+    def init(self):
+        self.done = Flag()
+
+    @handler("task_success")
+    def _on_task_success(self, *args):
+        self.done.set()
+
+
+@benchmark("core.worker_task")
+def worker_task(loops):
+    waiter = Waiter()
+    m = start_manager(Worker(), waiter)
+    try:
+        start = clock()
+        for i in range(loops):
+            waiter.done.clear()
+            m.fire(task(noop), "worker")
+            wait(waiter.done)
+        return clock() - start
+    finally:
+        m.stop()
@@ -0,0 +1,42 @@
+"""Import time benchmarks: importing circuits in a fresh interpreter"""
+import os
+import subprocess
+import sys
+
+from . import benchmark
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+
+CODE = """\
+from time import time
+start = time()
+{0:s}
+print(time() - start)
+"""
+
+
+def import_time(loops, statement):
+    # Only the import is measured, not the interpreter startup
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    code = CODE.format(statement)
+    return sum(
+        float(subprocess.check_output([sys.executable, "-c", code], env=env))
+        for i in range(loops)
+    )
+
+
+@benchmark("imports.circuits")
+def circuits(loops):
+    return import_time(loops, "import circuits")
+
+
+@benchmark("imports.component")
+def component(loops):
+    return import_time(loops, "from circuits import Component")
+
+
+@benchmark("imports.web_server")
+def web_server(loops):
+    return import_time(loops, "from circuits.web import Server")
@@ -0,0 +1,109 @@
+"""IPC benchmarks: ipc events between a parent and a child process
+
+Each benchmark runs over a :func:`~circuits.net.sockets.Pipe` and, where
+available, over a shared memory :func:`~circuits.net.ring.RingPipe`
+(the ``_ring`` variants).
+"""
+from threading import Event as Flag
+
+from circuits import Component, Event, ipc
+from circuits.net import ring
+
+from . import benchmark, clock
+from .net import start_manager, wait
+
+
+class echo(Event):
+
+    """echo Event"""
+
+
+class roundtrips(Event):
+
+    """roundtrips Event"""
+
+
+class stream(Event):
+
+    """stream Event"""
+
+
+class Child(Component):
+
+    def echo(self, data):
+        return data
+
+
+class Driver(Component):
+
+    """Sends an ipc event, waits for the result and sends the next"""
+
+    def init(self):
+        self.done = Flag()
+
+    def roundtrips(self, loops, data):
+        for i in range(loops):
+            value = yield self.call(ipc(echo(data)))
+            if len(value.value) != len(data):
+                raise RuntimeError("echo mismatch")
+        self.done.set()
+
+    def stream(self, loops, data):
+        # Fire all events at once, the child handles them in order so
+        # only the result of the last one is waited for
+        for i in range(loops - 1):
+            self.fire(ipc(echo(data)))
+        yield self.call(ipc(echo(data)))
+        self.done.set()
+
+
+def run(loops, size, event=roundtrips, transport=None):
+    driver = Driver()
+    m = start_manager(driver)
+    child = Child()
+    child.start(process=True, link=m, transport=transport)
+    try:
+        data = b"x" * size
+
+        # The first round trip waits for the child to come up
+        driver.fire(roundtrips(1, data))
+        wait(driver.done)
+        driver.done.clear()
+
+        start = clock()
+        driver.fire(event(loops, data))
+        wait(driver.done)
+        return clock() - start
+    finally:
+        child.stop()
+        m.stop()
+        m.join()
+
+
+@benchmark("ipc.roundtrip_1k")
+def roundtrip_1k(loops):
+    return run(loops, 1024)
+
+
+@benchmark("ipc.roundtrip_10m")
+def roundtrip_10m(loops):
+    return run(loops, 10 * 1024 * 1024)
+
+
+@benchmark("ipc.stream_small")
+def stream_small(loops):
+    return run(loops, 16, stream)
+
+
+if ring.AVAILABLE:
+    @benchmark("ipc.roundtrip_1k_ring")
+    def roundtrip_1k_ring(loops):
+        return run(loops, 1024, transport=ring.RingPipe)
+
+    @benchmark("ipc.roundtrip_10m_ring")
+    def roundtrip_10m_ring(loops):
+        return run(loops, 10 * 1024 * 1024, transport=ring.RingPipe)
+
+    @benchmark("ipc.stream_small_ring")
+    def stream_small_ring(loops):
+        return run(loops, 16, stream, ring.RingPipe)
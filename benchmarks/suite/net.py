@@ -0,0 +1,239 @@
+"""Networking benchmarks: loopback TCP echo, bulk transfer and polling"""
+import select
+from socket import AF_INET, SOCK_DGRAM, socket, socketpair
+from threading import Event as Flag
+
+from circuits import Component, Manager, handler
+from circuits.core.pollers import EPoll, Poll, Poller
+from circuits.net.events import connect, write
+from circuits.net.sockets import TCPClient, TCPServer
+
+from . import benchmark, clock
+
+TIMEOUT = 30
+
+
+class Echo(Component):
+
+    channel = "server"
+
+    def init(self):
+        self.bound = Flag()
+        self.port = None
+
+    def ready(self, server, bind):
+        self.port = bind[1]
+        self.bound.set()
+
+    def read(self, sock, data):
+        self.fire(write(sock, data))
+
+
+class PingPong(Component):
+
+    """Sends a message, waits for it to be echoed and sends the next"""
+
+    channel = "client"
+
+    def init(self, size):
+        self.message = b"x" * size
+        self.connected = Flag()
+        self.done = Flag()
+        self.loops = self.count = self.received = 0
+
+    @handler("connected")
+    def _on_connected(self, host, port):
+        self.connected.set()
+
+    def begin(self, loops):
+        self.loops, self.count, self.received = loops, 0, 0
+        self.done.clear()
+        self.fire(write(self.message))
+
+    def read(self, data):
+        self.received += len(data)
+        if self.received < (self.count + 1) * len(self.message):
+            return
+        self.count += 1
+        if self.count < self.loops:
+            self.fire(write(self.message))
+        else:
+            self.done.set()
+
+
+def start_manager(*components, **kwargs):
+    m = Manager()
+    kwargs.get("poller", Poller)().register(m)
+    for component in components:
+        component.register(m)
+    m.start()
+    return m
+
+
+def wait(flag):
+    if not flag.wait(TIMEOUT):
+        raise RuntimeError("benchmark timed out")
+
+
+def echo(loops, size, direct=False):
+    server = Echo() + TCPServer(("127.0.0.1", 0), direct=direct)
+    client = PingPong(size) + TCPClient(direct=direct)
+    m = start_manager(server, client)
+    try:
+        wait(server.bound)
+        client.fire(connect("127.0.0.1", server.port))
+        wait(client.connected)
+
+        start = clock()
+        client.begin(loops)
+        wait(client.done)
+        return clock() - start
+    finally:
+        m.stop()
+        m.join()
+
+
+@benchmark("net.tcp_echo_64")
+def tcp_echo_64(loops):
+    return echo(loops, 64)
+
+
+@benchmark("net.tcp_echo_64_direct")
+def tcp_echo_64_direct(loops):
+    return echo(loops, 64, direct=True)
+
+
+@benchmark("net.tcp_echo_64k")
+def tcp_echo_64k(loops):
+    return echo(loops, 65536)
+
+
+@benchmark("net.tcp_echo_64k_direct")
+def tcp_echo_64k_direct(loops):
+    return echo(loops, 65536, direct=True)
+
+
+class Sink(Component):
+
+    """Counts the bytes it receives"""
+
+    channel = "server"
+
+    def init(self):
+        self.bound = Flag()
+        self.done = Flag()
+        self.port = None
+        self.expected = self.received = 0
+
+    def ready(self, server, bind):
+        self.port = bind[1]
+        self.bound.set()
+
+    def read(self, sock, data):
+        self.received += len(data)
+        if self.received >= self.expected:
+            self.done.set()
+
+
+class Source(Component):
+
+    channel = "client"
+
+    def init(self):
+        self.connected = Flag()
+
+    @handler("connected")
+    def _on_connected(self, host, port):
+        self.connected.set()
+
+
+def bulk(loops, Poller=Poller, size=1024 * 1024):
+    # Sends *size* bytes per loop from the client to the server in 64KB
+    # writes, so that most wakeups find more than a buffer pending
+    chunk = b"x" * 65536
+    server = Sink() + TCPServer(("127.0.0.1", 0))
+    client = Source() + TCPClient()
+    m = start_manager(server, client, poller=Poller)
+    try:
+        wait(server.bound)
+        client.fire(connect("127.0.0.1", server.port))
+        wait(client.connected)
+
+        server.expected = loops * size
+        start = clock()
+        for i in range(loops * size // len(chunk)):
+            client.fire(write(chunk))
+        wait(server.done)
+        return clock() - start
+    finally:
+        m.stop()
+        m.join()
+
+
+@benchmark("net.tcp_bulk_1m")
+def tcp_bulk_1m(loops):
+    return bulk(loops)
+
+
+if hasattr(select, "epoll"):
+    @benchmark("net.tcp_bulk_1m_epoll")
+    def tcp_bulk_1m_epoll(loops):
+        return bulk(loops, EPoll)
+
+    @benchmark("net.tcp_bulk_1m_epoll_edge")
+    def tcp_bulk_1m_epoll_edge(loops):
+        return bulk(loops, lambda: EPoll(edge=True))
+
+
+class Active(Component):
+
+    channel = "active"
+
+    @handler("_write")
+    def _on_write(self, sock):
+        pass
+
+
+def poll(loops, idle, Poller=Poller, active=100):
+    # idle sockets that never become ready (one descriptor each) and
+    # active ones that always are, a tick handles the active ones
+    m = Manager()
+    m._running = True  # Have tick() poll
+    poller = Poller().register(m)
+    source = Active().register(m)
+    while len(m):
+        m.flush()
+
+    idle = [socket(AF_INET, SOCK_DGRAM) for i in range(idle)]
+    pairs = [socketpair() for i in range(active)]
+    try:
+        for sock in idle:
+            poller.addReader(m, sock)
+        for sock, _ in pairs:
+            poller.addWriter(source, sock)
+
+        start = clock()
+        for i in range(loops):
+            m.tick()
+        return clock() - start
+    finally:
+        for sock in idle:
+            sock.close()
+        for a, b in pairs:
+            a.close()
+            b.close()
+
+
+@benchmark("net.poll_100_active")
+def poll_100_active(loops):
+    return poll(loops, 0)
+
+
+@benchmark("net.poll_100_active_10k_idle")
+def poll_100_active_10k_idle(loops):
+    return poll(loops, 10000)
+
+
+@benchmark("net.poll_100_active_10k_idle_poll")
+def poll_100_active_10k_idle_poll(loops):
+    return poll(loops, 10000, Poll)
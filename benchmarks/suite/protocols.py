@@ -0,0 +1,94 @@
+"""Protocol benchmarks: HTTP and multipart parsing, WebSocket framing"""
+from io import BytesIO
+
+from circuits.protocols.websocket import WebSocketCodec
+from circuits.web.parsers import HttpParser, MultipartParser
+
+from . import benchmark, clock
+
+REQUEST = (
+    b"GET /index.html?x=1&y=2 HTTP/1.1\r\n"
+    b"Host: localhost:8000\r\n"
+    b"User-Agent: Mozilla/5.0 (X11; Linux x86_64) Firefox/60.0\r\n"
+    b"Accept: text/html,application/xhtml+xml;q=0.9,*/*;q=0.8\r\n"
+    b"Accept-Language: en-US,en;q=0.5\r\n"
+    b"Accept-Encoding: gzip, deflate\r\n"
+    b"Cookie: session=0123456789abcdef; theme=dark\r\n"
+    b"Connection: keep-alive\r\n"
+    b"\r\n"
+)
+
+BOUNDARY = "8f2a5d3c1b"
+
+MULTIPART = b"".join(
+    b"--" + BOUNDARY.encode() + b"\r\n"
+    b"Content-Disposition: form-data; name=\"field" + str(i).encode() +
+    b"\"; filename=\"file" + str(i).encode() + b".txt\"\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"\r\n" + b"x" * 4096 + b"\r\n"
+    for i in range(8)
+) + b"--" + BOUNDARY.encode() + b"--\r\n"
+
+
+@benchmark("protocols.http_parse")
+def http_parse(loops):
+    start = clock()
+    for i in range(loops):
+        parser = HttpParser(0, True)
+        parser.execute(REQUEST, len(REQUEST))
+    elapsed = clock() - start
+
+    if not parser.is_headers_complete():
+        raise RuntimeError("request not parsed")
+    return elapsed
+
+
+@benchmark("protocols.multipart_parse")
+def multipart_parse(loops):
+    start = clock()
+    for i in range(loops):
+        parser = MultipartParser(BytesIO(MULTIPART), BOUNDARY, len(MULTIPART))
+        parts = parser.parts()
+    elapsed = clock() - start
+
+    if len(parts) != 8:
+        raise RuntimeError("multipart body not parsed")
+    return elapsed
+
+
+def frames(mask):
+    # The codec is used without being registered, so nothing is fired
+    codec = WebSocketCodec()
+    message = bytearray(b"x" * 1024)
+    frame = bytearray(b"\x82") + codec._encode_tail(message, mask)
+    return codec, message, frame
+
+
+@benchmark("protocols.websocket_encode")
+def websocket_encode(loops):
+    codec, message, frame = frames(False)
+
+    start = clock()
+    for i in range(loops):
+        codec._encode_tail(message, False)
+    return clock() - start
+
+
+@benchmark("protocols.websocket_encode_masked")
+def websocket_encode_masked(loops):
+    codec, message, frame = frames(True)
+
+    start = clock()
+    for i in range(loops):
+        codec._encode_tail(message, True)
+    return clock() - start
+
+
+@benchmark("protocols.websocket_decode_masked")
+def websocket_decode_masked(loops):
+    codec, message, frame = frames(True)
+
+    start = clock()
+    for i in range(loops):
+        codec._parse_messages(frame)
+    return clock() - start
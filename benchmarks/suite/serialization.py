@@ -0,0 +1,39 @@
+"""Serialization benchmarks: Bridge (process) and node (network) events"""
+from circuits import Event
+from circuits.core import bridge
+from circuits.node.utils import dump_event, load_event
+
+from . import benchmark, clock
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+def event():
+    return hello("Hello World!", 42, {"a": [1, 2, 3]}, user="circuits")
+
+
+@benchmark("serialization.bridge_event")
+def bridge_event(loops):
+    # What the two ends of a Bridge do: frame the pickled (id, event)
+    # pair and split the stream back into packets
+    e = event()
+    decoder = bridge._Decoder()
+
+    start = clock()
+    for i in range(loops):
+        for chunk in bridge._encode((i, e)):
+            decoder.feed(chunk)
+    return clock() - start
+
+
+@benchmark("serialization.node_event")
+def node_event(loops):
+    e = event()
+
+    start = clock()
+    for i in range(loops):
+        load_event(dump_event(e, i))
+    return clock() - start
@@ -0,0 +1,67 @@
+"""Web benchmarks: requests per second of circuits.web.Server"""
+import os
+import shutil
+import tempfile
+from io import BytesIO
+
+from circuits.six.moves.http_client import HTTPConnection
+from circuits.web import Controller, Server, Static
+
+from . import benchmark, clock
+from .net import start_manager
+
+
+class Root(Controller):
+
+    def index(self):
+        return "Hello World!"
+
+    def chunked(self):
+        # File-like bodies are streamed, chunked (no Content-Length)
+        return BytesIO(b"x" * 16384)
+
+
+def requests(loops, path):
+    docroot = tempfile.mkdtemp()
+    with open(os.path.join(docroot, "static.txt"), "wb") as f:
+        f.write(b"x" * 16384)
+
+    server = Server(("127.0.0.1", 0), display_banner=False)
+    Root().register(server)
+    Static("/static", docroot).register(server)
+    m = start_manager(server)
+    try:
+        conn = HTTPConnection("127.0.0.1", server.port)
+
+        start = clock()
+        for i in range(loops):
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError("GET {0:s}: {1:d}".format(
+                    path, response.status
+                ))
+        elapsed = clock() - start
+
+        conn.close()
+        return elapsed
+    finally:
+        m.stop()
+        m.join()
+        shutil.rmtree(docroot)
+
+
+@benchmark("web.small")
+def small(loops):
+    return requests(loops, "/")
+
+
+@benchmark("web.static")
+def static(loops):
+    return requests(loops, "/static/static.txt")
+
+
+@benchmark("web.chunked")
+def chunked(loops):
+    return requests(loops, "/chunked")
@@ -17,26 +17,43 @@ try:
 except ImportError:
     __version__ = "unknown"
 
-from .core import (
-    BaseComponent, Bridge, Component, Debugger, Event, Loader, Manager,
-    TimeoutError, Timer, Worker, handler, ipc, reprhandler, sleep, task,
+from ._lazy import lazy
+
+# The core is only imported when one of these is first used
+lazy(globals(), {
+    "BaseComponent": ".core.components",
+    "Bridge": ".core.bridge",
+    "Component": ".core.components",
+    "ComponentPool": ".core.components",
+    "Debugger": ".core.debugger",
+    "Event": ".core.events",
+    "Loader": ".core.loader",
+    "Manager": ".core.manager",
+    "Metrics": ".core.metrics",
+    "Recorder": ".core.debugger",
+    "TimeoutError": ".core.manager",
+    "Timer": ".core.timers",
+    "Worker": ".core.workers",
+    "handler": ".core.handlers",
+    "ipc": ".core.bridge",
+    "reprhandler": ".core.handlers",
+    "sleep": ".core.manager",
+    "task": ".core.workers",
+})
+del lazy
+
+__all__ = (
+    "BaseComponent", "Bridge", "Component", "ComponentPool", "Debugger",
+    "Event", "Loader", "Manager", "Metrics", "Recorder", "TimeoutError",
+    "Timer", "Worker", "handler", "ipc", "reprhandler", "sleep", "task",
 )
 
-# See http://peak.telecommunity.com/DevCenter/setuptools#namespace-packages
-try:
-    __import__('pkg_resources').declare_namespace(__name__)
-except ImportError:
-    from pkgutil import extend_path
-    __path__ = extend_path(__path__, __name__)
-    import os
-    from .six import exec_
-    fd = None
-    for _path in __path__:
-        _path = os.path.join(_path, '__init__.py')
-        if _path != __file__ and os.path.exists(_path):
-            with open(_path) as fd:
-                exec_(fd, globals())
-    del os, extend_path, _path, fd, exec_
+# Namespace package, see the pkgutil documentation (importing
+# pkg_resources for declare_namespace() alone takes longer than
+# importing all of circuits)
+from pkgutil import extend_path
+__path__ = extend_path(__path__, __name__)
+del extend_path
 
 # flake8: noqa
 # pylama:skip=1
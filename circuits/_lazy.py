@@ -0,0 +1,78 @@
+"""Lazy package attributes
+
+Packages of circuits export the classes and functions of their modules
+without importing all of these modules on import of the package:
+:func:`lazy` makes the exported attributes import their module on first
+access (using the module level ``__getattr__`` of :pep:`562`). On Python
+versions without :pep:`562` (before 3.7), the modules are imported right
+away.
+
+Their subpackages and modules are attributes of the packages too, the
+first access imports them (like ``import circuits.core`` would).
+"""
+import sys
+from importlib import import_module
+
+
+def lazy(namespace, attributes, optional=()):
+    """
+    Export *attributes* (a dict mapping an attribute name to the name
+    of the module, relative to the package, defining it) from the
+    package whose globals are *namespace*. The attributes in *optional*
+    are left out if their module can't be imported (e.g. due to a
+    missing dependency).
+
+    Unless the package defines its own, its ``__all__`` lists the
+    attributes that can be imported.
+    """
+
+    package = namespace["__name__"]
+
+    def load(name):
+        module = import_module(attributes[name], package)
+        value = namespace[name] = getattr(module, name)
+        return value
+
+    def available():
+        names = []
+        for name in attributes:
+            try:
+                load(name)
+            except ImportError:
+                if name not in optional:
+                    raise
+            else:
+                names.append(name)
+        return names
+
+    if sys.version_info < (3, 7):
+        namespace.setdefault("__all__", tuple(available()))
+        return
+
+    def __getattr__(name):
+        if name in attributes:
+            try:
+                return load(name)
+            except ImportError:
+                if name not in optional:
+                    raise
+        elif name == "__all__":
+            # Only looked up by "from package import *", which imports
+            # everything anyway
+            value = namespace[name] = tuple(available())
+            return value
+        elif not name.startswith("__"):
+            try:
+                return import_module("." + name, package)
+            except ImportError as e:
+                if getattr(e, "name", None) != package + "." + name:
+                    raise
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(package, name)
+        )
+
+    def __dir__():
+        return sorted(set(namespace) | set(attributes))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
@@ -2,20 +2,36 @@
 
 This package contains the essential core parts of the circuits framework.
 """
-from .bridge import Bridge, ipc
-from .components import BaseComponent, Component
-from .debugger import Debugger
-from .events import Event
-from .handlers import handler, reprhandler
-from .loader import Loader
-from .manager import Manager, TimeoutError, sleep
-from .timers import Timer
-from .values import Value
-from .workers import Worker, task
+from .._lazy import lazy
+
+lazy(globals(), {
+    "Bridge": ".bridge",
+    "ipc": ".bridge",
+    "BaseComponent": ".components",
+    "Component": ".components",
+    "ComponentPool": ".components",
+    "Debugger": ".debugger",
+    "Recorder": ".debugger",
+    "Event": ".events",
+    "handler": ".handlers",
+    "reprhandler": ".handlers",
+    "Loader": ".loader",
+    "Manager": ".manager",
+    "TimeoutError": ".manager",
+    "sleep": ".manager",
+    "Metrics": ".metrics",
+    "Timer": ".timers",
+    "Value": ".values",
+    "Worker": ".workers",
+    "task": ".workers",
+})
+del lazy
 
 __all__ = (
-    "handler", "BaseComponent", "Component", "Event", "task",
-    "Worker", "ipc", "Bridge", "Debugger", "Timer", "Manager", "TimeoutError",
+    "handler", "BaseComponent", "Component", "ComponentPool", "Event",
+    "task", "Worker",
+    "ipc", "Bridge", "Debugger", "Metrics", "Recorder", "Timer", "Manager",
+    "TimeoutError",
 )
 
 # flake8: noqa
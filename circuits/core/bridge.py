@@ -5,22 +5,125 @@ processes. Bridge is used internally when a Component is started in
 "process mode" via :meth:`circuits.core.manager.start`. Typically a
 Pipe is used as the socket transport between two sides of a Bridge
 (*there must be a :class:`~Bridge` instnace on both sides*).
+
+Objects are sent as length prefixed frames: a header giving the size of
+the pickle and the number of out-of-band buffers, the pickle and then
+the out-of-band buffers, each prefixed with its size. Large buffers of
+objects supporting pickle protocol 5 (Python 3.8+) are sent out-of-band,
+i.e. without being copied into the pickle.
 """
 import traceback
+from struct import Struct
 
-from ..six import b
+from ..six import PY3
 from .components import BaseComponent
 from .events import Event, exception
 from .handlers import handler
 from .values import Value
 
 try:
-    from cPickle import dumps, loads
+    from cPickle import HIGHEST_PROTOCOL, dumps, loads
 except ImportError:
-    from pickle import dumps, loads  # NOQA
-
+    from pickle import HIGHEST_PROTOCOL, dumps, loads  # NOQA
 
-_sentinel = b('~~~')
+try:
+    from pickle import PickleBuffer
+except ImportError:
+    PickleBuffer = None
+
+
+#: Buffers at least this large are sent out-of-band (if supported)
+OUT_OF_BAND = 64 * 1024
+
+_header = Struct("!QI")  # size of the pickle, number of out-of-band buffers
+_length = Struct("!Q")  # size of an out-of-band buffer
+
+
+def _encode(obj):
+    # Return the chunks making up the frame of obj
+    if PickleBuffer is None:
+        data = dumps(obj, HIGHEST_PROTOCOL)
+        buffers = ()
+    else:
+        buffers = []
+
+        def in_band(buffer):
+            try:
+                raw = buffer.raw()
+            except BufferError:
+                return True  # Not contiguous
+            if raw.nbytes < OUT_OF_BAND:
+                return True
+            buffers.append(raw)
+            return False
+
+        data = dumps(obj, 5, buffer_callback=in_band)
+
+    header = _header.pack(len(data), len(buffers))
+    if len(data) < OUT_OF_BAND:
+        chunks = [header + data]
+    else:
+        chunks = [header, data]
+    for raw in buffers:
+        chunks.append(_length.pack(raw.nbytes))
+        chunks.append(raw)
+    return chunks
+
+
+if PY3:
+    def _load(buffer, start, size, buffers):
+        # Unpickle from the receive buffer without copying the pickle;
+        # out-of-band buffers are copied as the unpickled objects may
+        # keep them while the receive buffer is reused.
+        with memoryview(buffer) as view:
+            with view[start:start + size] as data:
+                if not buffers:
+                    return loads(data)
+                return loads(data, buffers=[
+                    bytearray(view[offset:offset + n]) for offset, n in buffers
+                ])
+else:
+    def _load(buffer, start, size, buffers):
+        return loads(bytes(buffer[start:start + size]))
+
+
+class _Decoder(object):
+
+    """Split a stream of frames back into objects"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """Add *data* and return the objects of all complete frames"""
+
+        buffer = self._buffer
+        buffer += data
+        end = len(buffer)
+
+        objs, offset = [], 0
+        while end - offset >= _header.size:
+            size, count = _header.unpack_from(buffer, offset)
+            start = offset + _header.size
+            position = start + size
+
+            buffers = []
+            while len(buffers) < count and end - position >= _length.size:
+                n, = _length.unpack_from(buffer, position)
+                position += _length.size
+                buffers.append((position, n))
+                position += n
+
+            if position > end or len(buffers) < count:
+                break  # Incomplete, wait for more data
+
+            objs.append(_load(buffer, start, size, buffers))
+            offset = position
+
+        # Consumed frames are dropped at once, not per frame
+        if offset:
+            del buffer[:offset]
+        return objs
 
 
 class ipc(Event):
@@ -46,7 +149,7 @@ class Bridge(BaseComponent):
     channel = "bridge"
 
     def init(self, socket, channel=channel):
-        self._buffer = b("")
+        self._decoder = _Decoder()
         self._socket = socket
         self._values = dict()
 
@@ -83,14 +186,8 @@ class Bridge(BaseComponent):
 
     @handler("read")
     def _on_read(self, data):
-        self._buffer += data
-        items = self._buffer.split(_sentinel)
-
-        if items[-1] != "":
-            self._buffer = items.pop()
-
-        for item in filter(None, items):
-            self._process_packet(*loads(item))
+        for packet in self._decoder.feed(data):
+            self._process_packet(*packet)
 
     def __send(self, eid, event):
         try:
@@ -102,7 +199,8 @@ class Bridge(BaseComponent):
             pass
 
     def __write(self, eid, data):
-        self._socket.write(dumps((eid, data)) + _sentinel)
+        for chunk in _encode((eid, data)):
+            self._socket.write(chunk)
 
     @handler("ipc")
     def _on_ipc(self, event, ipc_event, channel=None):
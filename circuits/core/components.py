@@ -2,7 +2,6 @@
 This module defines the BaseComponent and its subclass Component.
 """
 from collections import Callable
-from inspect import getmembers
 from itertools import chain
 from types import MethodType
 
@@ -45,6 +44,60 @@ class prepare_unregister(Event):
             component = component.parent
 
 
+def _members(cls):
+    """
+    Return the table of the members of the component class *cls* that
+    are relevant when creating an instance, computed on first use and
+    then cached on the class. The table is a tuple of:
+
+    - the sorted names of the class attributes that are handlers or
+      components, and of the aliases of the handlers of the bases,
+    - the ``(alias, function)`` pairs of the handlers of the bases,
+    - the set of all these names.
+
+    Handlers or components set on the class after it has been
+    instantiated are not found; add handlers with
+    :meth:`~.manager.Manager.addHandler` instead.
+    """
+
+    table = cls.__dict__.get("_component_members")
+    if table is not None:
+        return table
+
+    handlers = dict(
+        [(k, v) for k, v in list(cls.__dict__.items())
+            if getattr(v, "handler", False)]
+    )
+
+    def overridden(x):
+        return x in handlers and handlers[x].override
+
+    aliases = []
+    for base in cls.__bases__:
+        if issubclass(cls, base):
+            for k, v in list(base.__dict__.items()):
+                p1 = isinstance(v, Callable)
+                p2 = getattr(v, "handler", False)
+                p3 = overridden(k)
+                if p1 and p2 and not p3:
+                    aliases.append(("%s_%s" % (base.__name__, k), v))
+
+    names = set(name for name, f in aliases)
+    for k in dir(cls):
+        try:
+            v = getattr(cls, k)
+        except AttributeError:
+            continue
+        if getattr(v, "handler", False) is True or \
+                isinstance(v, BaseComponent):
+            names.add(k)
+
+    table = (sorted(names), aliases, frozenset(names))
+    # Not inherited by subclasses, see the lookup in cls.__dict__ above
+    cls._component_members = table
+    return table
+
+
 class BaseComponent(Manager):
 
     """
@@ -75,7 +128,11 @@ class BaseComponent(Manager):
         see :class:`~circuits.core.events.Event`, :meth:`~.fireEvent` and
         :func:`~circuits.core.handlers.handler`). By default, the channel
         attribute is set to "*", meaning that events are fired on all
-        channels and received from all channels.
+        channels and received from all channels. The handlers are
+        indexed by the channel the component has once it has been
+        initialized (which includes its ``init()`` method), setting
+        the attribute later on does not change the channel they
+        receive events from.
     """
 
     channel = "*"
@@ -83,24 +140,10 @@ class BaseComponent(Manager):
     def __new__(cls, *args, **kwargs):
         self = super(BaseComponent, cls).__new__(cls)
 
-        handlers = dict(
-            [(k, v) for k, v in list(cls.__dict__.items())
-                if getattr(v, "handler", False)]
-        )
-
-        def overridden(x):
-            return x in handlers and handlers[x].override
-
-        for base in cls.__bases__:
-            if issubclass(cls, base):
-                for k, v in list(base.__dict__.items()):
-                    p1 = isinstance(v, Callable)
-                    p2 = getattr(v, "handler", False)
-                    p3 = overridden(k)
-                    if p1 and p2 and not p3:
-                        name = "%s_%s" % (base.__name__, k)
-                        method = MethodType(v, self)
-                        setattr(self, name, method)
+        # Handlers of the bases are also registered under an alias, so
+        # that methods of the same name in cls don't hide them
+        for name, f in _members(cls)[1]:
+            setattr(self, name, MethodType(f, self))
 
         return self
 
@@ -111,21 +154,55 @@ class BaseComponent(Manager):
 
         self.channel = kwargs.get("channel", self.channel) or "*"
 
-        for k, v in getmembers(self):
+        # Only the members that can be handlers or child components
+        # are looked at (in the order of the names, as getmembers()
+        # used to): those of the class, which are looked up once per
+        # class, and what has been set on the instance so far.
+        names, _, known = _members(self.__class__)
+        extra = [
+            k for k, v in self.__dict__.items() if k not in known and (
+                isinstance(v, BaseComponent) or
+                callable(v) and getattr(v, "handler", False) is True
+            )
+        ]
+        if extra:
+            names = sorted(chain(names, extra))
+
+        # addHandler() sets attributes, so look them all up first
+        for v in [getattr(self, k) for k in names]:
             if getattr(v, "handler", False) is True:
                 self.addHandler(v)
             # TODO: Document this feature. See Issue #88
-            if v is not self and isinstance(v, BaseComponent) \
-                    and v not in ('parent', 'root'):
+            if v is not self and isinstance(v, BaseComponent):
                 v.register(self)
 
         if hasattr(self, "init") and isinstance(self.init, Callable):
+            channel = self.channel
             self.init(*args, **kwargs)
+            if self.channel != channel:
+                self._reindexHandlers()
 
-        @handler("prepare_unregister_complete", channel=self)
         def _on_prepare_unregister_complete(self, event, e, value):
             self._do_prepare_unregister_complete(event.parent, value)
-        self.addHandler(_on_prepare_unregister_complete)
+        # Known to take the event, handler() needn't inspect the signature
+        _on_prepare_unregister_complete.event = True
+        self.addHandler(handler(
+            "prepare_unregister_complete", channel=self
+        )(_on_prepare_unregister_complete))
+
+    def _reindexHandlers(self):
+        # The handlers that listen on the component's channel were
+        # indexed with the previous one
+        methods = {}
+        for name, handlers in self._handlers.items():
+            for method in handlers:
+                if method.channel is None:
+                    methods.setdefault(method, []).append(name)
+
+        index = self.root._index
+        for method, names in methods.items():
+            index.remove(method, names)
+            index.add(method, names)
 
     def register(self, parent):
         """
@@ -174,7 +251,6 @@ class BaseComponent(Manager):
 
         # tick shouldn't be called anymore, although component is still in tree
         self._unregister_pending = True
-        self.root._cache_needs_refresh = True
 
         # Give components a chance to prepare for unregister
         evt = prepare_unregister(self)
@@ -183,6 +259,56 @@ class BaseComponent(Manager):
 
         return self
 
+    def attach(self, parent):
+        """
+        Lightweight :meth:`register` for short lived components (e.g.
+        one per connection). Only the handlers of this component (and
+        its children) are added to the tree and the
+        :class:`~.events.registered` event is only fired if a handler
+        listens for it by name on this component's channel (global
+        handlers like the :class:`~.debugger.Debugger` and handlers on
+        all channels, e.g. those of the :mod:`~circuits.net.sockets`
+        components, don't count).
+
+        Remove the component with :meth:`detach`.
+        """
+
+        self.parent = parent
+        self.root = root = parent.root
+
+        parent.registerChild(self)
+        self._updateRoot(root)
+        if root._index.subscribed("registered", self.channel):
+            self.fire(registered(self, parent))
+
+        return self
+
+    def detach(self):
+        """
+        Remove this component from the component tree immediately.
+
+        Unlike :meth:`unregister`, no
+        :class:`~.components.prepare_unregister` event is fired and the
+        :class:`~.events.unregistered` event is only fired if a handler
+        listens for it by name on this component's channel (see
+        :meth:`attach`). Once
+        detached, the component may be attached again (see
+        :class:`ComponentPool`).
+        """
+
+        parent = self.parent
+        if parent is self:
+            return self
+
+        if self.root._index.subscribed("unregistered", self.channel):
+            self.fire(unregistered(self, parent))
+
+        parent.unregisterChild(self)
+        self.parent = self
+        self._updateRoot(self)
+
+        return self
+
     @property
     def unregister_pending(self):
         return getattr(self, "_unregister_pending", False)
@@ -234,6 +360,62 @@ class BaseComponent(Manager):
         return all(name in cls.events() for name in names)
 
 
+class ComponentPool(object):
+
+    """
+    A pool of detached components for reuse, to save the cost of
+    creating a component per connection, request, etc.
+
+    :meth:`acquire` attaches a pooled component (or a new one created
+    by calling *factory*) to a parent and :meth:`release` detaches it
+    and keeps it for reuse, up to *size* components.
+
+    A reused component is not created again: if it has an ``init()``
+    method, that is called with the arguments given to :meth:`acquire`
+    instead, so components that are pooled should (re)set their per use
+    state there.
+    """
+
+    def __init__(self, factory, size=64):
+        self.factory = factory
+        self.size = size
+
+        self.created = 0
+        self.reused = 0
+
+        self._free = []
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, parent, *args, **kwargs):
+        """Attach a pooled or new component to *parent* and return it"""
+
+        if self._free:
+            component = self._free.pop()
+            self.reused += 1
+            init = getattr(component, "init", None)
+            if isinstance(init, Callable):
+                init(*args, **kwargs)
+        else:
+            component = self.factory(*args, **kwargs)
+            self.created += 1
+
+        return component.attach(parent)
+
+    def release(self, component):
+        """Detach *component* and keep it for reuse if there is room"""
+
+        component.detach()
+        if len(self._free) < self.size:
+            self._free.append(component)
+
+    def clear(self):
+        """Drop all pooled components"""
+
+        del self._free[:]
+
+
 Component = HandlerMetaClass("Component", (BaseComponent,), {})
 """
 If you use Component instead of BaseComponent as base class for your own
@@ -1,14 +1,20 @@
 """
 Debugger component used to debug each event in a system by printing
-each event to sys.stderr or to a Logger Component instance.
+each event to sys.stderr or to a Logger Component instance, and
+Recorder component that keeps a trace of the latest events in memory
+for post-mortem debugging.
 """
 import os
 import sys
-from signal import SIGINT, SIGTERM
+from collections import deque
+from datetime import datetime
+from signal import SIGINT, SIGTERM, signal as set_signal_handler
+from time import time
 from traceback import format_exc, format_exception_only
 
 from .components import BaseComponent
 from .handlers import handler, reprhandler
+from .manager import monotonic
 
 
 class Debugger(BaseComponent):
@@ -130,3 +136,132 @@ class Debugger(BaseComponent):
         except Exception as e:
             sys.stderr.write("ERROR (Debugger): {}".format(e))
             sys.stderr.write("{}".format(format_exc()))
+
+
+class Recorder(BaseComponent):
+
+    """Create a new Recorder Component
+
+    A flight recorder: once registered, the root manager's dispatcher
+    records every handler invocation as a tuple of::
+
+        (timestamp, event name, channels, handler, duration, error)
+
+    in a ring buffer holding the latest *size* entries. *error* is the
+    type of the exception raised by the handler or ``None``. Nothing is
+    formatted until the buffer is dumped (with :meth:`dump`, on the
+    signal *signo* or, if *errors* is set, whenever a handler raises),
+    so tracing can be left on permanently.
+
+    Unlike the :class:`Debugger`, the Recorder has no event handlers and
+    does not show up in any handler list.
+
+    :param size: number of handler invocations to keep
+    :param errors: dump the buffer when a handler raises an exception
+    :param signo: signal that dumps the buffer (e.g. ``SIGUSR1``),
+                  default ``None``: its handler is process-wide, so it
+                  is only installed on request
+    :param file: file (name) to dump to, default ``sys.stderr``
+    :param logger: Logger to dump to (instead of *file*)
+    """
+
+    def __init__(self, size=4096, errors=False, signo=None, file=None,
+                 logger=None, **kwargs):
+        "initializes x; see x.__class__.__doc__ for signature"
+
+        self._instrumented = None
+
+        super(Recorder, self).__init__(**kwargs)
+
+        self.errors = errors
+
+        if isinstance(file, str):
+            self.file = open(os.path.abspath(os.path.expanduser(file)), "a")
+        elif hasattr(file, "write"):
+            self.file = file
+        else:
+            self.file = sys.stderr
+
+        self.logger = logger
+
+        self._buffer = deque(maxlen=size)
+
+        if signo is not None:
+            try:
+                set_signal_handler(signo, self._on_dump_signal)
+            except ValueError:
+                # Not the main thread
+                pass
+
+        self._instrument(self.root)
+
+    def _instrument(self, root):
+        if self._instrumented is not None \
+                and self._instrumented._recorder is self:
+            self._instrumented._recorder = None
+        self._instrumented = root
+        root._recorder = self
+
+    def _updateRoot(self, root):
+        super(Recorder, self)._updateRoot(root)
+
+        if self._instrumented is not None:
+            self._instrument(root)
+
+    def _record(self, event, handler, started, now, err):
+        # Called by the dispatcher after each handler with the (monotonic)
+        # times the handler was called at and returned at
+        self._buffer.append((
+            started, event.name, event.channels, handler, now - started,
+            err and err[0]
+        ))
+        if err is not None and self.errors:
+            self.dump()
+
+    def _on_dump_signal(self, signo, stack):
+        self.dump()
+
+    def clear(self):
+        """Discard all recorded entries"""
+
+        self._buffer.clear()
+
+    def entries(self):
+        """
+        Return the recorded entries, oldest first, with the timestamps
+        converted to seconds since the epoch.
+        """
+
+        offset = time() - monotonic()
+        return [
+            (entry[0] + offset,) + entry[1:] for entry in list(self._buffer)
+        ]
+
+    def format(self):
+        """Return the recorded entries formatted as lines of text"""
+
+        lines = []
+        for timestamp, name, channels, event_handler, duration, error in \
+                self.entries():
+            lines.append("{0:s} {1:10.6f}s {2:s} {3:s} {4:s}{5:s}\n".format(
+                datetime.fromtimestamp(timestamp).isoformat(), duration,
+                name, repr(channels), reprhandler(event_handler),
+                "" if error is None else " ERROR {0:s}".format(
+                    getattr(error, "__name__", repr(error))
+                )
+            ))
+        return lines
+
+    def dump(self):
+        """Write the recorded entries to the file or Logger"""
+
+        s = "".join(self.format())
+
+        if self.logger is not None:
+            self.logger.debug(s)
+        else:
+            try:
+                self.file.write(s)
+                self.file.flush()
+            except IOError:
+                pass
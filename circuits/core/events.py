@@ -1,14 +1,84 @@
 """
 This module defines the basic event class and common events.
 """
+from collections import OrderedDict
 from inspect import ismethod
+from threading import Lock
 from traceback import format_tb
 
+MAX_EVENT_CLASSES = 1024
+
+# Guards the lazy creation of Event.value
+_value_lock = Lock()
+
+
+class EventClasses(object):
+
+    """Bounded registry of dynamically created event classes
+
+    :meth:`Event.create` and :meth:`Event.child` look up the event class
+    for a given base class and name here instead of creating a new class
+    for every event. The least recently used classes are discarded once
+    *maxsize* classes are registered.
+
+    :ivar hits: number of lookups that found an existing class
+    :ivar misses: number of lookups that had to create a new class
+    """
+
+    def __init__(self, maxsize=MAX_EVENT_CLASSES):
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = Lock()
+        self._classes = OrderedDict()
+
+    def __len__(self):
+        return len(self._classes)
+
+    def __repr__(self):
+        format = "<EventClasses (hits=%d misses=%d size=%d/%d)>"
+        return format % (self.hits, self.misses, len(self), self.maxsize)
+
+    def get(self, cls, name):
+        """Return the event class named *name* derived from *cls*"""
+
+        key = (cls, name)
+        with self._lock:
+            try:
+                # Re-insert to mark the class as most recently used
+                klass = self._classes[key] = self._classes.pop(key)
+                self.hits += 1
+                return klass
+            except KeyError:
+                self.misses += 1
+
+            klass = self._classes[key] = type(cls)(name, (cls,), {})
+            while len(self._classes) > self.maxsize:
+                self._classes.popitem(last=False)
+
+        return klass
+
+    def clear(self):
+        with self._lock:
+            self._classes.clear()
+            self.hits = self.misses = 0
+
+
+event_classes = EventClasses()
+
 
 class Event(object):
 
-    channels = ()
-    "The channels this message is sent to."
+    # Attributes set for every event are kept in slots. Any other
+    # attribute (e.g. cause, effects, success_channels, peer_cert, ...)
+    # lives in the instance dict, which is only allocated when needed.
+    __slots__ = (
+        "args", "kwargs", "uid", "handler", "stopped", "cancelled", "name",
+        "_channels", "_value", "_manager", "_queued", "__dict__",
+        "__weakref__",
+    )
 
     parent = None
     notify = False
@@ -20,7 +90,7 @@ class Event(object):
 
     @classmethod
     def create(cls, _name, *args, **kwargs):
-        return type(cls)(_name, (cls,), {})(*args, **kwargs)
+        return event_classes.get(cls, _name)(*args, **kwargs)
 
     def child(self, name, *args, **kwargs):
         e = Event.create(
@@ -83,20 +153,68 @@ class Event(object):
         self.kwargs = kwargs
 
         self.uid = None
-        self.value = None
         self.handler = None
         self.stopped = False
         self.cancelled = False
         if not hasattr(self, 'name'):
             self.name = self.__class__.__name__
 
+        self._value = None
+        self._manager = None
+
+    @property
+    def channels(self):
+        "The channels this message is sent to."
+
+        try:
+            return self._channels
+        except AttributeError:
+            return ()
+
+    @channels.setter
+    def channels(self, channels):
+        self._channels = channels
+
+    @property
+    def value(self):
+        """
+        The :class:`circuits.core.values.Value` holding the results of
+        the handlers invoked for this event. It is created on first
+        access once the event has been fired and is ``None`` before.
+        """
+
+        value = self._value
+        if value is None and self._manager is not None:
+            # Handlers and other threads (waitEvent, ...) may get here
+            # at the same time, only one of them creates it.
+            with _value_lock:
+                value = self._value
+                if value is None:
+                    # Imported here, values imports this module
+                    from .values import Value
+                    value = self._value = Value(self, self._manager)
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
     def __getstate__(self):
-        odict = self.__dict__.copy()
-        del odict["handler"]
+        odict = dict(
+            (k, getattr(self, k)) for k in Event.__slots__
+            if k not in (
+                "handler", "_manager", "_queued", "__dict__", "__weakref__"
+            )
+            and hasattr(self, k)
+        )
+        odict.update(getattr(self, "__dict__", {}))
         return odict
 
     def __setstate__(self, dict):
-        self.__dict__.update(dict)
+        self.handler = None
+        self._manager = None
+        for k, v in dict.items():
+            setattr(self, k, v)
 
     def __le__(self, other):
         return False
@@ -271,6 +389,49 @@ class unregistered(Event):
     """
 
 
+class high_watermark(Event):
+
+    """high_watermark Event
+
+    This Event is sent by the root manager when the number of queued
+    events covered by a watermark (see
+    :meth:`~.manager.Manager.setWatermark`) reaches its high mark.
+    Components that generate events from external sources (e.g. sockets
+    or files) should stop reading until the matching
+    :class:`low_watermark` event is sent.
+
+    :param channel: The channel of the watermark (None: all channels)
+    :type  channel: str or None
+
+    :param name: The event name of the watermark (None: all events)
+    :type  name: str or None
+
+    :param depth: The number of queued events
+    :type  depth: int
+    """
+
+    def __init__(self, channel, name, depth):
+        super(high_watermark, self).__init__(channel, name, depth)
+
+    def affects(self, channel, name):
+        """
+        Return True if events with the given *name* fired on *channel*
+        are covered by the watermark.
+        """
+
+        return self.args[0] in (None, channel) and self.args[1] in (None, name)
+
+
+class low_watermark(high_watermark):
+
+    """low_watermark Event
+
+    This Event is sent by the root manager when the number of queued
+    events covered by a watermark has dropped to its low mark again after
+    a :class:`high_watermark` event.
+    """
+
+
 class generate_events(Event):
 
     """generate_events Event
@@ -292,6 +453,8 @@ class generate_events(Event):
     that interrupts waiting for events.
     """
 
+    __slots__ = ("_time_left", "_lock")
+
     def __init__(self, lock, max_wait):
         super(generate_events, self).__init__()
 
@@ -73,11 +73,12 @@ def handler(*names, **kwargs):
         f.channel = kwargs.get("channel", None)
         f.override = kwargs.get("override", False)
 
-        args = getargspec(f)[0]
+        if not hasattr(f, "event"):
+            args = getargspec(f)[0]
 
-        if args and args[0] == "self":
-            del args[0]
-        f.event = getattr(f, "event", bool(args and args[0] == "event"))
+            if args and args[0] == "self":
+                del args[0]
+            f.event = bool(args and args[0] == "event")
 
         return f
 
@@ -3,10 +3,9 @@ This module defines the Manager class.
 """
 import atexit
 from collections import deque
-from heapq import heappop, heappush
+from heapq import heapify, heappop, heappush
 from inspect import isfunction
 from itertools import chain, count
-from multiprocessing import Process, current_process
 from operator import attrgetter
 from os import getpid, kill
 from signal import SIGINT, SIGTERM, signal as set_signal_handler
@@ -19,8 +18,10 @@ from uuid import uuid4 as uuid
 
 from ..six import Iterator, create_bound_method, next
 from ..tools import tryimport
-from .events import Event, exception, generate_events, signal, started, stopped
-from .handlers import handler
+from .events import (
+    Event, exception, generate_events, high_watermark, low_watermark, signal,
+    started, stopped,
+)
 from .values import Value
 
 try:
@@ -28,12 +29,20 @@ try:
 except ImportError:
     SIGKILL = SIGTERM
 
+try:
+    from time import monotonic
+except ImportError:
+    monotonic = time
+
 
 thread = tryimport(("thread", "_thread"))
 
 
 TIMEOUT = 0.1  # 100ms timeout when idle
 
+#: Default bound of the number of entries of the handler cache
+CACHE_SIZE = 4096
+
 
 class UnregistrableError(Exception):
 
@@ -94,6 +103,40 @@ class Sleep(Iterator):
         self._task = task
 
 
+def _isfuture(obj):
+    return callable(getattr(obj, "add_done_callback", None)) \
+        and callable(getattr(obj, "result", None))
+
+
+try:
+    from inspect import iscoroutine as _iscoroutine
+except ImportError:
+    def _iscoroutine(obj):
+        return False
+
+
+def _ensureFuture(coro):
+    # Schedules an asyncio coroutine on the running asyncio event loop
+    # (see pollers.AsyncIO). Without one nobody would ever run it.
+    from asyncio import ensure_future
+    from asyncio.events import _get_running_loop
+
+    loop = _get_running_loop()
+    if loop is None:
+        coro.close()
+        raise RuntimeError(
+            "{0!r} needs a running asyncio event loop, run the manager "
+            "with the AsyncIO poller".format(coro)
+        )
+    return ensure_future(coro, loop=loop)
+
+
+def _coroutineTask(coro):
+    # Schedules an asyncio coroutine returned by a handler and resumes
+    # with (yields) its result.
+    yield (yield _ensureFuture(coro))
+
+
 def sleep(seconds):
     """
     Delay execution of a coroutine for a given number of seconds.
@@ -114,56 +157,474 @@ del Dummy
 
 class _State(object):
 
-    __slots__ = ('task', 'run', 'flag', 'event', 'timeout', 'parent', 'task_event', 'tick_handler')
+    __slots__ = (
+        'task', 'event', 'name', 'channels', 'manager', 'deadline', 'timer',
+        'parent', 'task_event'
+    )
 
-    def __init__(self, timeout):
+    def __init__(self, name, event, channels, manager):
         self.task = None
-        self.run = False
-        self.flag = False
-        self.event = None
-        self.timeout = timeout
+        self.event = event
+        self.name = name
+        self.channels = channels
+        self.manager = manager
+        self.deadline = None
+        self.timer = None
         self.parent = None
         self.task_event = None
-        self.tick_handler = None
+
+    def matches(self, channels):
+        for channel in channels:
+            if channel == "*" or channel is self.manager or channel in self.channels:
+                return True
+        return "*" in self.channels
+
+
+class _Watermark(object):
+
+    __slots__ = ('channel', 'name', 'high', 'low', 'depth', 'paused', 'pauses')
+
+    def __init__(self, channel, name, high, low):
+        self.channel = channel
+        self.name = name
+        self.high = high
+        self.low = low
+        self.depth = 0
+        self.paused = False
+        self.pauses = 0
+
+    def matches(self, event, channels):
+        return (self.name is None or self.name == event.name) \
+            and (self.channel is None or self.channel in channels)
 
 
 class _EventQueue(object):
-    __slots__ = ('_queue', '_priority_queue', '_counter', '_flush_batch')
+    """
+    The event queue of a root manager.
+
+    Events fired with the default priority (0) are kept in a plain FIFO
+    lane; only prioritized events are ordered through a heap. Dispatching
+    a batch yields the events in the same order as a single heap ordered
+    by ``(priority, arrival)`` would: negative priorities first, then the
+    default lane, then positive priorities.
+
+    :meth:`append` may be called from any thread. Default lane entries are
+    ``(event, channels)`` pairs: an event may be fired more than once, on
+    different channels, before it is dispatched.
+    """
+
+    __slots__ = ('_queue', '_incoming', '_priority_queue', '_counter', '_flush_batch', '_fifo_batch')
 
     def __init__(self):
         self._queue = deque()
+        self._incoming = deque()
         self._priority_queue = []
         self._counter = count()
         self._flush_batch = 0
+        self._fifo_batch = 0
 
     def __len__(self):
-        return len(self._queue) + len(self._priority_queue)
+        return len(self._queue) + len(self._incoming) + len(self._priority_queue)
 
     def drainFrom(self, other_queue):
         self._queue.extend(other_queue._queue)
         other_queue._queue.clear()
+        for priority, _, event, channel in other_queue._incoming:
+            self.append(event, channel, priority)
+        other_queue._incoming.clear()
         # Queue is currently flushing events /o\
         assert not len(other_queue._priority_queue)
 
     def append(self, event, channel, priority):
-        self._queue.append((priority, next(self._counter), (event, channel)))
+        if priority:
+            self._incoming.append((priority, next(self._counter), event, channel))
+        else:
+            self._queue.append((event, channel))
 
     def dispatchEvents(self, dispatcher):
         if self._flush_batch == 0:
-            # FIXME: Might be faster to use heapify instead of pop +
-            # heappush. Though, with regards to thread safety this
-            # appears to be the better approach.
-            self._flush_batch = count = len(self._queue)
+            # Only events queued up to now make up this batch; popping
+            # from the incoming lane keeps appends from other threads safe.
+            self._fifo_batch = len(self._queue)
+            count = len(self._incoming)
             while count:
                 count -= 1
-                heappush(self._priority_queue, self._queue.popleft())
+                heappush(self._priority_queue, self._incoming.popleft())
+            self._flush_batch = self._fifo_batch + len(self._priority_queue)
 
+        queue, priority_queue = self._queue, self._priority_queue
         while self._flush_batch > 0:
             self._flush_batch -= 1  # Decrement first!
-            (event, channels) = heappop(self._priority_queue)[2]
+            if priority_queue and (priority_queue[0][0] < 0 or not self._fifo_batch):
+                _, _, event, channels = heappop(priority_queue)
+            else:
+                self._fifo_batch -= 1
+                event, channels = queue.popleft()
             dispatcher(event, channels, self._flush_batch)
 
 
+def _handler_channel(method):
+    channel = method.channel
+    if channel is None:
+        channel = getattr(
+            getattr(method, "im_self", getattr(method, "__self__", _dummy)),
+            "channel", None
+        )
+    return channel
+
+
+class HandlerCache(dict):
+    """
+    The handlers of the events fired in a component tree, keyed by
+    ``(event name, channels)``. Shared by all managers of the tree, see
+    :attr:`Manager.handler_cache`.
+
+    The cache holds at most :attr:`size` entries (``None``: no bound)
+    and evicts the least recently used ones. To keep a hit as cheap as
+    a dict lookup, recency is tracked per generation rather than per
+    hit: new entries go to the young generation, which becomes the old
+    generation (evicting the previous one) once it holds half of
+    :attr:`size` entries. A hit in the old generation moves the entry
+    back to the young one, so only entries that haven't been hit for a
+    whole generation are evicted.
+
+    :attr:`hits`, :attr:`misses` and :attr:`evictions` count the
+    lookups and evictions since the cache was created.
+    """
+
+    __slots__ = ('_size', '_old', '_keys', 'hits', 'misses', 'evictions')
+
+    def __init__(self, size=CACHE_SIZE):
+        super(HandlerCache, self).__init__()
+
+        self._old = {}
+        self._keys = {}  # name -> set(keys)
+        self.hits = self.misses = self.evictions = 0
+        self.size = size
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._old
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._old)
+
+    @property
+    def size(self):
+        """The maximum number of entries (``None``: no bound)"""
+
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        if size is not None and size < 2:
+            raise ValueError("size must be at least 2")
+        self._size = size
+        if size is not None:
+            if dict.__len__(self) >= size // 2:
+                self._rotate()
+            if len(self._old) > size // 2:
+                self._evict(self._old)
+                self._old = {}
+
+    def stats(self):
+        """Return the size, number of entries and counters as a dict"""
+
+        return {
+            "size": self._size,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        dict.clear(self)
+        self._old.clear()
+        self._keys.clear()
+
+    def _put(self, key, handlers):
+        self[key] = handlers
+        self._keys.setdefault(key[0], set()).add(key)
+        if self._size is not None and dict.__len__(self) >= self._size // 2:
+            self._rotate()
+
+    def _promote(self, key):
+        # Look up key in the old generation (after missing the young one)
+        handlers = self._old.pop(key, None)
+        if handlers is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._put(key, handlers)
+        return handlers
+
+    def _rotate(self):
+        self._evict(self._old)
+        self._old = dict(self)
+        dict.clear(self)
+
+    def _evict(self, entries):
+        self.evictions += len(entries)
+        for key in entries:
+            self._discardKey(key)
+
+    def _discardKey(self, key):
+        keys = self._keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[key[0]]
+
+    def _invalidate(self, name, matches):
+        # Drop the entries for name whose channels match
+        for key in list(self._keys.get(name, ())):
+            if matches(key[1]):
+                self.pop(key, None)
+                self._old.pop(key, None)
+                self._discardKey(key)
+
+
+class _HandlerIndex(object):
+    """
+    Flat index of all handlers of a component tree, maintained by the root
+    manager of the tree. Handlers are indexed by event name and by the
+    channel they listen on, so that finding the handlers for an event does
+    not need to visit every component of the tree.
+
+    The index also owns the :class:`HandlerCache` of the tree and
+    invalidates only the cache entries affected by a change.
+    """
+
+    __slots__ = ('_names', '_globals', '_channels', '_lock', 'cache', 'version')
+
+    def __init__(self):
+        self._names = {}     # name -> {channel -> set(handlers)}
+        self._globals = set()
+        self._channels = {}  # handler -> channel it was indexed with
+        self._lock = RLock()
+
+        self.cache = HandlerCache()
+        self.version = 0
+
+    def add(self, method, names=None):
+        with self._lock:
+            if not method.names and method.channel == "*":
+                self._globals.add(method)
+                self._invalidate(None, "*", None)
+            else:
+                channel = self._channels.setdefault(method, _handler_channel(method))
+                names = names or method.names or ("*",)
+                for name in names:
+                    self._names.setdefault(name, {}).setdefault(channel, set()).add(method)
+                self._invalidate(names, channel, method)
+            self.version += 1
+
+    def remove(self, method, names=None):
+        with self._lock:
+            if method in self._globals:
+                self._globals.discard(method)
+                self._invalidate(None, "*", None)
+                self.version += 1
+                return
+
+            channel = self._channels.get(method)
+            names = names or method.names or ("*",)
+            for name in names:
+                channels = self._names.get(name)
+                if channels is None or channel not in channels:
+                    continue
+                channels[channel].discard(method)
+                if not channels[channel]:
+                    del channels[channel]
+                    if not channels:
+                        del self._names[name]
+
+            indexed = (
+                name for name in (method.names or ("*",))
+                if method in self._names.get(name, {}).get(channel, ())
+            )
+            if next(indexed, None) is None:
+                self._channels.pop(method, None)
+
+            self._invalidate(names, channel, method)
+            self.version += 1
+
+    def lookup(self, name, channel, exclude_globals=False):
+        """Return the set of indexed handlers for *name* on *channel*"""
+
+        handlers = set()
+        with self._lock:
+            for key in (name, "*"):
+                channels = self._names.get(key)
+                if not channels:
+                    continue
+                if channel == "*":
+                    for _handlers in channels.values():
+                        handlers.update(_handlers)
+                else:
+                    handlers.update(channels.get("*", ()))
+                    try:
+                        handlers.update(channels.get(channel, ()))
+                    except TypeError:
+                        # Unhashable channel: no handler can listen on it
+                        pass
+
+            if not exclude_globals:
+                handlers.update(self._globals)
+
+        return handlers
+
+    def subscribed(self, name, channel):
+        """
+        Return True if a handler listens for events named *name* (by
+        that name, not as a global or catch-all handler) on *channel*.
+        Handlers listening on all channels (``channel="*"``) don't count
+        unless *channel* is ``"*"``.
+        """
+
+        channels = self._names.get(name)
+        if not channels:
+            return False
+        if channel == "*":
+            return True
+        try:
+            return channel in channels
+        except TypeError:
+            return False
+
+    def store(self, key, handlers, version):
+        """Cache *handlers* under *key* unless the index changed meanwhile"""
+
+        with self._lock:
+            if version == self.version:
+                self.cache._put(key, handlers)
+
+    def cached(self, key):
+        """
+        Return the cached handlers for *key* if they are in the old
+        generation of the cache (after missing the young one), else None
+        """
+
+        with self._lock:
+            return self.cache._promote(key)
+
+    def _invalidate(self, names, channel, method):
+        if names is None or "*" in names:
+            self.cache.clear()
+            return
+
+        owner = getattr(method, "im_self", getattr(method, "__self__", None))
+
+        def matches(channels):
+            return channel == "*" or "*" in channels or channel in channels \
+                or (owner is not None and owner in channels)
+
+        for name in names:
+            self.cache._invalidate(name, matches)
+
+    def update(self, other):
+        """Move all handlers of the index *other* into this index"""
+
+        with other._lock:
+            globals_ = list(other._globals)
+            named = list(other._entries())
+            other.clear()
+
+        for method in globals_:
+            self.add(method)
+        for method, names in named:
+            self.add(method, names)
+
+    def _entries(self):
+        entries = {}
+        for name, channels in self._names.items():
+            for handlers in channels.values():
+                for method in handlers:
+                    entries.setdefault(method, []).append(name)
+        return entries.items()
+
+    def clear(self):
+        with self._lock:
+            self._names.clear()
+            self._globals.clear()
+            self._channels.clear()
+            self.cache.clear()
+            self.version += 1
+
+
+class _TimerService(object):
+    """
+    The timers of a root manager.
+
+    Deadlines are kept in a single heap of ``[expiry, seq, callback, args]``
+    entries, so scheduling costs O(log N) and cancelling is O(1): a
+    cancelled entry is only marked and dropped once it reaches the top of
+    the heap (or when cancelled entries make up more than half of it).
+    Only the earliest deadline is of interest to the main loop.
+
+    All methods may be called from any thread; callbacks are invoked by
+    :meth:`expire` outside of the service's lock.
+    """
+
+    __slots__ = ('_heap', '_counter', '_cancelled', '_lock')
+
+    def __init__(self):
+        self._heap = []
+        self._counter = count()
+        self._cancelled = 0
+        self._lock = RLock()
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, expiry, callback, *args):
+        entry = [expiry, next(self._counter), callback, args]
+        with self._lock:
+            heappush(self._heap, entry)
+        return entry
+
+    def cancel(self, entry):
+        with self._lock:
+            if entry[2] is None:
+                return
+            entry[2] = entry[3] = None
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) // 2:
+                self._heap = [e for e in self._heap if e[2] is not None]
+                heapify(self._heap)
+                self._cancelled = 0
+
+    def reset(self, entry, expiry):
+        callback, args = entry[2], entry[3]
+        self.cancel(entry)
+        return self.schedule(expiry, callback, *args)
+
+    def next_expiry(self):
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][2] is None:
+                heappop(heap)
+                self._cancelled -= 1
+            return heap[0][0] if heap else None
+
+    def expire(self, now):
+        due = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                entry = heappop(heap)
+                if entry[2] is None:
+                    self._cancelled -= 1
+                else:
+                    due.append((entry[2], entry[3]))
+                    entry[2] = entry[3] = None
+
+        for callback, args in due:
+            callback(*args)
+
+        return len(due)
+
+
 class Manager(object):
 
     """
@@ -211,7 +672,15 @@ class Manager(object):
 
     Apart from the event queue, the root manager also maintains a list of
     tasks, actually Python generators, that are updated when the event queue
-    has been flushed.
+    has been flushed. Tasks that wait for an event, a :func:`sleep` or a
+    future (any object with ``add_done_callback`` and ``result`` methods)
+    are parked and only resumed once the awaited thing has completed, so
+    they cost nothing while waiting.
+
+    The root manager also keeps all deadlines (sleeping tasks and
+    :class:`~.timers.Timer` components) in a single timer service. Only
+    the earliest deadline determines how long the main loop may wait
+    for events to be generated.
     """
 
     _currently_handling = None
@@ -225,13 +694,24 @@ class Manager(object):
         self._queue = _EventQueue()
 
         self._tasks = set()
-        self._cache = dict()
+        self._tasks_added = False
+        self._woken = deque()
+        self._waiters = {}
+        self._waiting = {}
+        self._watermarks = []
+        self._metrics = None
+        self._sampling = None
+        self._recorder = None
+        self._timers = _TimerService()
         self._globals = set()
         self._handlers = dict()
+        self._index = _HandlerIndex()
+        self._cache = self._index.cache
 
         self._flush_batch = 0
-        self._cache_needs_refresh = False
 
+        self._owner = None
+        self._inbox = deque()
         self._executing_thread = None
         self._flushing_thread = None
         self._running = False
@@ -259,7 +739,7 @@ class Manager(object):
         q = len(self._queue)
         state = "R" if self.running else "S"
 
-        pid = current_process().pid
+        pid = getpid()
 
         if pid:
             id = "%s:%s" % (pid, current_thread().getName())
@@ -352,6 +832,36 @@ class Manager(object):
 
         return self._running
 
+    @property
+    def threadsafe(self):
+        """
+        Whether events may be fired from any thread (the default).
+
+        Setting this to ``False`` on a tree that only ever fires events
+        from the thread running it makes firing cheaper: the thread
+        checks and the locking needed to accept events from other
+        threads are skipped. Other threads must then use
+        :meth:`fireThreadsafe`; firing an event from another thread
+        with :meth:`fireEvent` raises a :class:`RuntimeError`.
+
+        Only firing gets cheaper (see the ``core.fire`` benchmarks), the
+        dispatching of events costs the same. The
+        :class:`~.events.generate_events` event of every tick still
+        takes the lock when its time left is reduced, as
+        :meth:`fireThreadsafe` does that from other threads.
+        """
+
+        return self.root._owner is None
+
+    @threadsafe.setter
+    def threadsafe(self, value):
+        root = self.root
+        if value:
+            root._owner = None
+        elif root._owner is None:
+            th = root._executing_thread
+            root._owner = th.ident if th else thread.get_ident()
+
     @property
     def pid(self):
         """Return the process id of this Component/Manager"""
@@ -359,40 +869,76 @@ class Manager(object):
         return getpid() if self.__process is None else self.__process.pid
 
     def getHandlers(self, event, channel, **kwargs):
-        name = event.name
-        handlers = set()
+        """
+        Return the set of handlers of this component tree that are
+        invoked for *event* when it is fired on *channel*.
 
-        _handlers = set()
-        _handlers.update(self._handlers.get("*", []))
-        _handlers.update(self._handlers.get(name, []))
-
-        for _handler in _handlers:
-            handler_channel = _handler.channel
-            if handler_channel is None:
-                # XXX: Why do we care about the event handler's channel?
-                #      This probably costs us performance for what?
-                #      I've not ever had to rely on this in practice...
-                handler_channel = getattr(
-                    getattr(
-                        _handler, "im_self", getattr(
-                            _handler, "__self__", _dummy
-                        )
-                    ),
-                    "channel", None
-                )
+        The handlers are looked up in the flat handler index maintained by
+        the root manager. If *channel* is a component of the tree, all of
+        that component's handlers for the event are included as well.
+        """
 
-            if channel == "*" or handler_channel in ("*", channel,) \
-                    or channel is self:
-                handlers.add(_handler)
+        root = self.root
+        name = event.name
 
-        if not kwargs.get("exclude_globals", False):
-            handlers.update(self._globals)
+        handlers = root._index.lookup(
+            name, channel, kwargs.get("exclude_globals", False)
+        )
 
-        for c in self.components.copy():
-            handlers.update(c.getHandlers(event, channel, **kwargs))
+        if isinstance(channel, Manager) and channel.root is root:
+            handlers.update(channel._handlers.get(name, ()))
+            handlers.update(channel._handlers.get("*", ()))
 
         return handlers
 
+    def _buildHandlers(self, event, channels):
+        # Handlers added or removed concurrently while the
+        # list is being built must not end up in the cache.
+        version = self.root._index.version
+        h = (self.getHandlers(event, channel) for channel in channels)
+
+        event_handlers = sorted(
+            chain(*h),
+            key=attrgetter("priority"),
+            reverse=True
+        )
+
+        if isinstance(event, generate_events):
+            from .helpers import FallBackGenerator
+            event_handlers.append(FallBackGenerator()._on_generate_events)
+        elif isinstance(event, exception) and len(event_handlers) == 0:
+            from .helpers import FallBackExceptionHandler
+            event_handlers.append(FallBackExceptionHandler()._on_exception)
+        elif isinstance(event, signal) and len(event_handlers) == 0:
+            from .helpers import FallBackSignalHandler
+            event_handlers.append(FallBackSignalHandler()._on_signal)
+
+        self.root._index.store((event.name, channels), event_handlers, version)
+        return event_handlers
+
+    @property
+    def handler_cache(self):
+        """
+        The :class:`HandlerCache` of this component tree. Its ``size``
+        bounds the number of cached ``(event name, channels)`` entries
+        (:data:`CACHE_SIZE` by default) and :meth:`~HandlerCache.stats`
+        returns its hit, miss and eviction counters.
+        """
+
+        return self.root._index.cache
+
+    def cacheHandlers(self, event, *channels):
+        """
+        Build the cache entry for *event* fired on *channels* (resolved
+        like :meth:`fireEvent` does) ahead of time, e.g. for the hot
+        events of a server at startup. Returns the handlers.
+        """
+
+        if not channels:
+            channels = event.channels or (getattr(self, "channel", "*"),) or ("*",)
+
+        return self.root._buildHandlers(event, channels)
+
     def addHandler(self, f):
         method = create_bound_method(f, self) if isfunction(f) else f
 
@@ -406,7 +952,7 @@ class Manager(object):
             for name in method.names:
                 self._handlers.setdefault(name, set()).add(method)
 
-        self.root._cache_needs_refresh = True
+        self.root._index.add(method)
 
         return method
 
@@ -416,6 +962,9 @@ class Manager(object):
         else:
             names = [event]
 
+        if not names and method in self._globals:
+            self._globals.remove(method)
+
         for name in names:
             self._handlers[name].remove(method)
             if not self._handlers[name]:
@@ -426,7 +975,7 @@ class Manager(object):
                     # Handler was never part of self
                     pass
 
-        self.root._cache_needs_refresh = True
+        self.root._index.remove(method, names)
 
     def registerChild(self, component):
         if component._executing_thread is not None:
@@ -436,13 +985,51 @@ class Manager(object):
             component._executing_thread = None
         self.components.add(component)
         self.root._queue.drainFrom(component._queue)
-        self.root._cache_needs_refresh = True
+        # The component was the root of its own subtree until now
+        self.root._index.update(component._index)
 
     def unregisterChild(self, component):
         self.components.remove(component)
-        self.root._cache_needs_refresh = True
+
+        # Move the handlers of the detached subtree to its new root
+        index, stack = self.root._index, [component]
+        while stack:
+            c = stack.pop()
+            for method in list(c._globals):
+                index.remove(method)
+                component._index.add(method)
+            for name, methods in list(c._handlers.items()):
+                for method in list(methods):
+                    index.remove(method, (name,))
+                    component._index.add(method, (name,))
+            stack.extend(c.components)
 
     def _fire(self, event, channel, priority=0):
+        if self._watermarks:
+            self._countQueued(event, channel, 1)
+        if self._sampling is not None:
+            # The Metrics component times this event (see _flush)
+            self._sampling._sampled = event
+            self._sampling = None
+            event._queued = monotonic()
+
+        if self._owner is not None:
+            # Single threaded: no locking, but refuse foreign threads
+            if thread.get_ident() != self._owner:
+                raise RuntimeError(
+                    "{0:s} is not threadsafe, events from other threads "
+                    "must be fired with fireThreadsafe()".format(self.name)
+                )
+            handling = self._currently_handling
+            if handling is not None and getattr(handling, "cause", None) \
+                    and not isinstance(event, signal):
+                event.cause = handling
+                event.effects = 1
+                handling.effects += 1
+
+            self._queue.append(event, channel, priority)
+            return
+
         # check if event is fired while handling an event
         th = (self._executing_thread or self._flushing_thread)
         if thread.get_ident() == (th.ident if th else None) and \
@@ -477,6 +1064,64 @@ class Manager(object):
                 if isinstance(handling, generate_events):
                     handling.reduce_time_left(0)
 
+    def _countQueued(self, event, channels, n):
+        if isinstance(event, high_watermark):
+            return
+
+        with self._lock:
+            for mark in self._watermarks:
+                if not mark.matches(event, channels):
+                    continue
+                mark.depth = max(0, mark.depth + n)
+                if n > 0 and not mark.paused and mark.depth >= mark.high:
+                    mark.paused = True
+                    mark.pauses += 1
+                    e = high_watermark(mark.channel, mark.name, mark.depth)
+                elif n < 0 and mark.paused and mark.depth <= mark.low:
+                    mark.paused = False
+                    e = low_watermark(mark.channel, mark.name, mark.depth)
+                else:
+                    continue
+                self._fireEvent(e, ("*",), -1)
+
+    def setWatermark(self, high, low=None, channel=None, name=None):
+        """
+        Set (or with *high* ``None``, remove) a watermark on the event queue
+        of the root manager.
+
+        When the number of queued events with the given *name* fired on
+        *channel* (``None`` meaning any) reaches *high*, a
+        :class:`~.events.high_watermark` event is fired. Once it has
+        dropped to *low* (default: half of *high*) again, a
+        :class:`~.events.low_watermark` event follows. Socket and file
+        components pause reading in between.
+        """
+
+        root = self.root
+        with root._lock:
+            marks = [
+                mark for mark in root._watermarks
+                if (mark.channel, mark.name) != (channel, name)
+            ]
+            if high is not None:
+                low = high // 2 if low is None else low
+                marks.append(_Watermark(channel, name, high, low))
+            root._watermarks = marks
+
+    def getWatermarks(self):
+        """
+        Return the watermarks of the root manager's event queue as a list
+        of dicts with the number of queued events covered (``depth``),
+        whether readers are currently paused and how often they have
+        been paused.
+        """
+
+        with self.root._lock:
+            return [
+                dict((k, getattr(mark, k)) for k in _Watermark.__slots__)
+                for mark in self.root._watermarks
+            ]
+
     def fireEvent(self, event, *channels, **kwargs):
         """Fire an event into the system.
 
@@ -490,28 +1135,126 @@ class Manager(object):
            channels ("*").
         """
 
+        # The Value is created before the event is queued, once queued the
+        # event may be handled by another thread right away.
+        return self._fireEvent(event, channels, value=True, **kwargs)
+
+    fire = fireEvent
+
+    def fireThreadsafe(self, event, *channels, **kwargs):
+        """
+        Like :meth:`fireEvent` but may be invoked from any thread, also
+        when the tree is not :attr:`threadsafe`. Events fired from other
+        threads are put in an inbox that the main loop empties on its
+        next tick; the main loop is woken up if it is waiting.
+        """
+
+        root = self.root
+        owner = root._owner
+        if owner is None or owner == thread.get_ident():
+            return self.fireEvent(event, *channels, **kwargs)
+
         if not channels:
             channels = event.channels or (getattr(self, "channel", "*"),) or ("*",)
 
         event.channels = channels
+        event._value = value = Value(event, self)
+        event._manager = self
+
+        # Append before looking at the handled event, _generateEvents()
+        # does it the other way round, so one of us sees the other.
+        root._inbox.append((event, channels, kwargs.get("priority", 0)))
+        handling = root._currently_handling
+        if isinstance(handling, generate_events):
+            handling.reduce_time_left(0)
+
+        return value
+
+    def _fireEvent(self, event, channels, priority=0, value=False):
+        # Like fireEvent() but, unless *value*, leaves the creation of the
+        # event's Value to whoever accesses it first (a handler returning
+        # a result, success/failure/complete handling, waitEvent, ...).
+        if not channels:
+            channels = event.channels or (getattr(self, "channel", "*"),) or ("*",)
 
-        event.value = Value(event, self)
-        self.root._fire(event, channels, **kwargs)
+        event.channels = channels
 
-        return event.value
+        event._value = Value(event, self) if value else None
+        event._manager = self
+        self.root._fire(event, channels, priority)
 
-    fire = fireEvent
+        return event._value
 
     def registerTask(self, g):
-        self.root._tasks.add(g)
+        root = self.root
+        root._tasks.add(g)
+        root._tasks_added = True
 
     def unregisterTask(self, g):
         if g in self.root._tasks:
             self.root._tasks.remove(g)
 
-    def waitEvent(self, event, *channels, **kwargs):  # noqa
-        # XXX: C901: This has a high McCabe complexity score of 16.
-        # TODO: Refactor this method.
+    def _scheduleTimer(self, expiry, callback, *args):
+        # Have callback(*args) invoked by the root's main loop once expiry
+        # (a time() value) has passed. Returns a handle for _cancelTimer().
+        root = self.root
+        timers = root._timers
+        entry = timers.schedule(expiry, callback, *args)
+        if timers.next_expiry() == expiry:
+            # The main loop may be waiting for a later deadline
+            with root._lock:
+                handling = root._currently_handling
+                if isinstance(handling, generate_events):
+                    handling.reduce_time_left(0)
+        return entry
+
+    def _cancelTimer(self, entry):
+        self.root._timers.cancel(entry)
+
+    def _sleepTask(self, g, expiry):
+        # Park the task until expiry instead of polling it every tick
+        self.root._timers.schedule(expiry, self.root._tasks.add, g)
+
+    def _wakeTask(self, g):
+        # Make a parked task ready again. May be called from any thread.
+        root = self.root
+        with root._lock:
+            root._woken.append(g)
+            handling = root._currently_handling
+            if isinstance(handling, generate_events):
+                handling.reduce_time_left(0)
+
+    def _awaitFuture(self, event, task, future):
+        # Park the task until the future completes and resume it with
+        # the future's result (or throw the future's exception into it)
+        # through the same paths as callEvent results.
+        event.waitingHandlers += 1
+
+        def done(future):
+            try:
+                value = CallValue(future.result())
+            except BaseException as e:
+                value = ExceptionWrapper(e)
+            self._wakeTask((event, (v for v in (value,)), task))
+
+        future.add_done_callback(done)
+
+    def waitEvent(self, event, *channels, **kwargs):
+        """
+        Suspend execution until an event has been dispatched and all its
+        handlers have completed. This method may only be invoked as
+        argument to a ``yield`` on the top execution level of a handler
+        (e.g. "``yield self.waitEvent('foo')``").
+
+        :param event: the event (name) to wait for. If an event name is
+            given, the first such event dispatched on one of *channels*
+            (default: this component's channel) is waited for.
+
+        :param timeout: an optional keyword argument giving the maximum
+            number of seconds to wait. When it expires, a
+            :class:`TimeoutError` is raised in the waiting handler.
+        :type timeout: float
+        """
 
         if isinstance(event, Event):
             event_object = event
@@ -521,57 +1264,64 @@ class Manager(object):
             event_object = None
             event_name = event
 
-        state = _State(timeout=kwargs.get("timeout", -1))
-
-        def _on_event(self, event, *args, **kwargs):
-            if not state.run and (
-                    event_object is None or event is event_object
-            ):
-                self.removeHandler(_on_event_handler, event_name)
-                event.alert_done = True
-                state.run = True
-                state.event = event
-
-        def _on_done(self, event, *args, **kwargs):
-            if state.event == event.parent:
-                state.flag = True
-                self.registerTask((state.task_event, state.task, state.parent))
-                if state.timeout > 0:
-                    self.removeHandler(state.tick_handler, "generate_events")
-
-        def _on_tick(self):
-            if state.timeout == 0:
-                self.registerTask(
-                    (
-                        state.task_event,
-                        (e for e in (ExceptionWrapper(TimeoutError()),)),
-                        state.parent
-                    )
-                )
-                self.removeHandler(_on_done_handler, "%s_done" % event_name)
-                self.removeHandler(_on_tick_handler, "generate_events")
-            elif state.timeout > 0:
-                state.timeout -= 1
-
         if not channels:
-            channels = (None,)
+            channels = (getattr(self, "channel", None) or "*",)
+        else:
+            channels = tuple(
+                getattr(self, "channel", None) or "*" if channel is None else channel
+                for channel in channels
+            )
 
-        for channel in channels:
-            _on_event_handler = self.addHandler(
-                handler(event_name, channel=channel)(_on_event))
-            _on_done_handler = self.addHandler(
-                handler("%s_done" % event_name, channel=channel)(_on_done))
-            if state.timeout >= 0:
-                _on_tick_handler = state.tick_handler = self.addHandler(
-                    handler("generate_events", channel=channel)(_on_tick))
+        state = _State(event_name, event_object, channels, self)
 
-        yield state
+        root = self.root
+        if event_object is None:
+            # Matched by the dispatcher against the events of that name
+            root._waiters.setdefault(event_name, []).append(state)
+        else:
+            # Known already: woken up once it is done, no matching needed
+            root._waiting.setdefault(event_object, []).append(state)
+
+        timeout = kwargs.get("timeout", -1)
+        if timeout is not None and timeout >= 0:
+            state.deadline = time() + timeout
+            state.timer = root._timers.schedule(
+                state.deadline, root._waitTimeout, state
+            )
 
-        self.removeHandler(_on_done_handler, "%s_done" % event_name)
+        yield state
 
         if state.event is not None:
             yield CallValue(state.event.value)
 
+    def _waitTimeout(self, state):
+        if state.event is None:
+            registry, key = self._waiters, state.name
+        else:
+            registry, key = self._waiting, state.event
+        waiters = registry.get(key, ())
+        if state in waiters:
+            waiters.remove(state)
+            if not waiters:
+                del registry[key]
+
+        self.registerTask((
+            state.task_event,
+            (e for e in (ExceptionWrapper(TimeoutError()),)),
+            state.parent
+        ))
+
+    def _matchWaiters(self, event, channels, waiters):
+        # Called by the dispatcher: the first matching event is the one
+        # the waiter waits to be done.
+        for state in list(waiters):
+            if state.matches(channels):
+                waiters.remove(state)
+                state.event = event
+                self._waiting.setdefault(event, []).append(state)
+        if not waiters:
+            del self._waiters[event.name]
+
     wait = waitEvent
 
     def callEvent(self, event, *channels, **kwargs):
@@ -594,6 +1344,9 @@ class Manager(object):
     def _flush(self):
         # Handle events currently on queue, but none of the newly generated
         # events. Note that _flush can be called recursively.
+        if self._metrics is not None:
+            self._metrics._flushing()
+
         old_flushing = self._flushing_thread
         try:
             self._flushing_thread = current_thread()
@@ -616,9 +1369,25 @@ class Manager(object):
         # XXX: C901: This has a high McCabe complexity score of 22.
         # TODO: Refactor this method.
 
+        if self._watermarks:
+            self._countQueued(event, channels, -1)
+
         if event.cancelled:
             return
 
+        # One clock reading per handler (and one at the start), shared
+        # by the Metrics and Recorder components
+        metrics = self._metrics
+        if metrics is not None:
+            metrics._counts[event.name] += 1
+            if event is not metrics._sampled:
+                metrics = None  # Not sampled (see _fire), only counted
+        recorder = self._recorder
+        timed = metrics is not None or recorder is not None
+        if timed:
+            dispatched = started = monotonic()
+            handled = []
+
         if event.complete:
             if not getattr(event, "cause", None):
                 event.cause = event
@@ -626,47 +1395,29 @@ class Manager(object):
         eargs = event.args
         ekwargs = event.kwargs
 
-        if self._cache_needs_refresh:
-            # Don't call self._cache.clear() from other threads,
-            # this may interfere with cache rebuild.
-            self._cache.clear()
-            self._cache_needs_refresh = False
+        cache = self._cache
         try:  # try/except is fastest if successful in most cases
-            event_handlers = self._cache[(event.name, channels)]
+            event_handlers = cache[(event.name, channels)]
+            cache.hits += 1
         except KeyError:
-            h = (self.getHandlers(event, channel) for channel in channels)
-
-            event_handlers = sorted(
-                chain(*h),
-                key=attrgetter("priority"),
-                reverse=True
-            )
-
-            if isinstance(event, generate_events):
-                from .helpers import FallBackGenerator
-                event_handlers.append(FallBackGenerator()._on_generate_events)
-            elif isinstance(event, exception) and len(event_handlers) == 0:
-                from .helpers import FallBackExceptionHandler
-                event_handlers.append(FallBackExceptionHandler()._on_exception)
-            elif isinstance(event, signal) and len(event_handlers) == 0:
-                from .helpers import FallBackSignalHandler
-                event_handlers.append(FallBackSignalHandler()._on_signal)
-
-            self._cache[(event.name, channels)] = event_handlers
+            event_handlers = self._index.cached((event.name, channels))
+            if event_handlers is None:
+                event_handlers = self._buildHandlers(event, channels)
 
         if isinstance(event, generate_events):
-            with self._lock:
-                self._currently_handling = event
-                if remaining > 0 or len(self._queue) or not self._running:
-                    event.reduce_time_left(0)
-                elif self._tasks:
-                    event.reduce_time_left(TIMEOUT)
-                # From now on, firing an event will reduce time left
-                # to 0, which prevents event handlers from waiting (or wakes
-                # them up with resume if they should be waiting already)
+            if self._owner is None:
+                with self._lock:
+                    self._generateEvents(event, remaining)
+            else:
+                self._generateEvents(event, remaining)
         else:
             self._currently_handling = event
 
+        if self._waiters:
+            waiters = self._waiters.get(event.name)
+            if waiters:
+                self._matchWaiters(event, channels, waiters)
+
         value = None
         err = None
 
@@ -685,15 +1436,34 @@ class Manager(object):
                 value = err = _exc_info()
                 event.value.errors = True
 
+                if self._metrics is not None:
+                    self._metrics._failed(event_handler)
+
                 if event.failure:
-                    self.fire(
-                        event.child("failure", event, err),
-                        *event.channels
+                    self._fireEvent(
+                        event.child("failure", event, err), event.channels
                     )
 
-                self.fire(exception(*err, handler=event_handler, fevent=event))
+                self._fireEvent(
+                    exception(*err, handler=event_handler, fevent=event), ()
+                )
+
+            if timed:
+                now = monotonic()
+                failed = err is not None and value is err
+                if metrics is not None:
+                    handled.append((event_handler, now - started))
+                if recorder is not None:
+                    recorder._record(
+                        event, event_handler, started, now,
+                        err if failed else None
+                    )
+                # The end of one handler is the start of the next
+                started = now
 
             if value is not None:
+                if _iscoroutine(value):
+                    value = _coroutineTask(value)
                 if isinstance(value, GeneratorType):
                     event.waitingHandlers += 1
                     event.value.promise = True
@@ -709,24 +1479,59 @@ class Manager(object):
             if event.stopped:
                 break  # Stop further event processing
 
+        if metrics is not None:
+            metrics._dispatched(event, dispatched, handled)
+
         self._currently_handling = None
         self._eventDone(event, err)
 
+    def _generateEvents(self, event, remaining):
+        self._currently_handling = event
+        if remaining > 0 or len(self._queue) or self._woken or self._inbox \
+                or self._tasks_added or not self._running:
+            event.reduce_time_left(0)
+        elif self._tasks:
+            event.reduce_time_left(TIMEOUT)
+        expiry = self._timers.next_expiry()
+        if expiry is not None:
+            event.reduce_time_left(max(0, expiry - time()))
+        # From now on, firing an event will reduce time left
+        # to 0, which prevents event handlers from waiting (or wakes
+        # them up with resume if they should be waiting already)
+
     def _eventDone(self, event, err=None):
         if event.waitingHandlers:
             return
 
-        # The "%s_done" event is for internal use by waitEvent only.
-        # Use the "%s_success" event in your application if you are
+        if event._value is not None:
+            event._value._setDone()
+
+        if self._waiting:
+            for state in self._waiting.pop(event, ()):
+                if state.timer is None:
+                    self.registerTask((state.task_event, state.task, state.parent))
+                elif state.deadline < time():
+                    # Done too late, the timer just didn't get to run yet
+                    self._timers.cancel(state.timer)
+                    self._waitTimeout(state)
+                else:
+                    self._timers.cancel(state.timer)
+                    self.registerTask((state.task_event, state.task, state.parent))
+
+        # The "%s_done" event is for internal use only. Use the
+        # "%s_success" event in your application if you are
         # interested in being notified about the last handler for
         # an event having been invoked.
         if event.alert_done:
-            self.fire(event.child("done", event.value.value), *event.channels)
+            self._fireEvent(
+                event.child("done", event.value.value), event.channels
+            )
 
         if err is None and event.success:
             channels = getattr(event, "success_channels", event.channels)
-            self.fire(
-                event.child("success", event, event.value.value), *channels
+            self._fireEvent(
+                event.child("success", event, event.value.value),
+                tuple(channels)
             )
 
         while True:
@@ -739,9 +1544,9 @@ class Manager(object):
             if event.effects > 0:
                 break  # some nested events remain to be completed
             if event.complete:  # does this event want signaling?
-                self.fire(
+                self._fireEvent(
                     event.child("complete", event, event.value.value),
-                    *getattr(event, "complete_channels", event.channels)
+                    tuple(getattr(event, "complete_channels", event.channels))
                 )
 
             # this event and nested events are done now
@@ -751,23 +1556,32 @@ class Manager(object):
             event = cause
 
     def _signal_handler(self, signo, stack):
-        self.fire(signal(signo, stack))
+        self.fireThreadsafe(signal(signo, stack))
 
-    def start(self, process=False, link=None):
+    def start(self, process=False, link=None, transport=None):
         """
         Start a new thread or process that invokes this manager's
         ``run()`` method. The invocation of this method returns
         immediately after the task or process has been started.
+
+        A process is connected to the manager *link* (if given) by a
+        pair of :class:`~.bridge.Bridge` components, communicating over
+        the two ends returned by *transport* (by default
+        :func:`~circuits.net.sockets.Pipe`, see also
+        :func:`~circuits.net.ring.RingPipe`).
         """
 
         if process:
+            from multiprocessing import Process
+
             # Parent<->Child Bridge
             if link is not None:
-                from circuits.net.sockets import Pipe
                 from circuits.core.bridge import Bridge
+                if transport is None:
+                    from circuits.net.sockets import Pipe as transport
 
                 channels = (uuid(),) * 2
-                parent, child = Pipe(*channels)
+                parent, child = transport(*channels)
                 bridge = Bridge(parent, channel=channels[0]).register(link)
 
                 args = (child,)
@@ -781,6 +1595,13 @@ class Manager(object):
             self.__process.daemon = True
             self.__process.start()
 
+            if bridge is not None:
+                # The child's end is only used by the child process (see
+                # circuits.net.ring.RingClient.release)
+                release = getattr(child, "release", None)
+                if release is not None:
+                    release()
+
             return self.__process, bridge
         else:
             self.__thread = Thread(target=self.run, name=self.name)
@@ -802,19 +1623,23 @@ class Manager(object):
         an invocation of ``run()`` to return.
         """
 
-        if self.__process not in (None, current_process()) and self.__process.is_alive():
-            self.__process.terminate()
-            self.__process.join(TIMEOUT)
+        process = self.__process
+        if process is not None:
+            from multiprocessing import current_process
+
+            if process is not current_process() and process.is_alive():
+                process.terminate()
+                process.join(TIMEOUT)
 
-            if self.__process.is_alive():
-                kill(self.__process.pid, SIGKILL)
+                if process.is_alive():
+                    kill(process.pid, SIGKILL)
 
         if not self.running:
             return
 
         self._running = False
 
-        self.fire(stopped(self))
+        self.fireThreadsafe(stopped(self))
 
         if self.root._executing_thread is None:
             for _ in range(3):
@@ -827,6 +1652,9 @@ class Manager(object):
         # XXX: C901: This has a high McCabe complexity score of 16.
         # TODO: Refactor this method.
 
+        if self._metrics is not None:
+            self._metrics.steps += 1
+
         value = None
         try:
             value = next(task)
@@ -846,6 +1674,10 @@ class Manager(object):
                     task_state.task_event = event
                     task_state.task = value
                     task_state.parent = parent
+                elif _isfuture(value):
+                    # Parked again, on another future
+                    event.waitingHandlers -= 1
+                    self._awaitFuture(event, parent, value)
                 else:
                     event.waitingHandlers -= 1
                     if value is not None:
@@ -870,13 +1702,20 @@ class Manager(object):
                     if value is not None:
                         value_generator = (val for val in (value,))
                         self.registerTask((event, value_generator, parent))
+                    else:
+                        event.waitingHandlers -= 1
+                        self.registerTask((event, parent, None))
                 else:
                     raise value.extract()
             elif isinstance(value, Sleep):
-                if value is not task:
-                    value.task = (event, task, parent)
-                    self.registerTask((event, value, parent))
-                    self.unregisterTask((event, task, parent))
+                self.unregisterTask((event, task, parent))
+                self._sleepTask((event, task, parent), value.expiry)
+            elif _isfuture(value):
+                self.unregisterTask((event, task, parent))
+                self._awaitFuture(event, task, value)
+            elif _iscoroutine(value):
+                self.unregisterTask((event, task, parent))
+                self._awaitFuture(event, task, _ensureFuture(value))
             elif value is not None:
                 event.value.value = value
         except StopIteration:
@@ -885,10 +1724,6 @@ class Manager(object):
 
             if parent:
                 self.registerTask((event, parent, None))
-            elif hasattr(task, "task"):
-                # XXX: The subtask is considered a "waiting handler"
-                event.waitingHandlers += 1
-                self.registerTask(task.task)
             elif event.waitingHandlers == 0:
                 event.value.inform(True)
                 self._eventDone(event)
@@ -900,15 +1735,20 @@ class Manager(object):
             self.unregisterTask((event, task, parent))
 
             err = _exc_info()
+            if self._metrics is not None:
+                self._metrics.task_errors += 1
 
             event.value.value = err
             event.value.errors = True
             event.value.inform(True)
+            event.value._setDone()
 
             if event.failure:
-                self.fire(event.child("failure", event, err), *event.channels)
+                self._fireEvent(
+                    event.child("failure", event, err), event.channels
+                )
 
-            self.fire(exception(*err, handler=None, fevent=event))
+            self._fireEvent(exception(*err, handler=None, fevent=event), ())
 
     def tick(self, timeout=-1):
         """
@@ -924,13 +1764,30 @@ class Manager(object):
             has been taken.
         :type timeout: float, measuring seconds
         """
+        if self._metrics is not None:
+            self._metrics._tick(len(self._queue), len(self._tasks))
+
+        # queue the events fired by other threads
+        inbox = self._inbox
+        while inbox:
+            self._fire(*inbox.popleft())
+
+        # wake up parked tasks that are ready to run again
+        while self._woken:
+            self._tasks.add(self._woken.popleft())
+
+        # run expired timers (this includes waking up sleeping tasks)
+        if self._timers:
+            self._timers.expire(time())
+
         # process tasks
+        self._tasks_added = False
         if self._tasks:
             for task in self._tasks.copy():
                 self.processTask(*task)
 
         if self._running:
-            self.fire(generate_events(self._lock, timeout), "*")
+            self._fireEvent(generate_events(self._lock, timeout), ("*",))
 
         if len(self._queue):
             self.flush()
@@ -962,6 +1819,9 @@ class Manager(object):
 
         self._running = True
         self.root._executing_thread = current_thread()
+        owner = self.root._owner
+        if owner is not None:
+            self.root._owner = thread.get_ident()
 
         # Setup Communications Bridge
 
@@ -987,5 +1847,7 @@ class Manager(object):
                 pass
 
         self.root._executing_thread = None
+        if owner is not None:
+            self.root._owner = owner
         self.__thread = None
         self.__process = None
@@ -0,0 +1,272 @@
+"""
+Metrics component that instruments the dispatcher of the root manager.
+
+Unlike the :class:`~.debugger.Debugger` it does not print anything: it
+keeps counters and fixed-size histograms that are cheap enough to leave
+enabled in production and can be inspected with :meth:`Metrics.snapshot`.
+"""
+from bisect import bisect_left
+from collections import defaultdict
+from time import time
+
+from .components import BaseComponent
+from .handlers import reprhandler
+
+#: Upper bounds (in seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.05, 0.1, 0.5, 1.0, 5.0,
+)
+
+#: Upper bounds of the queue length histogram buckets.
+LENGTH_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+#: Number of (bound method) handlers to remember the statistics of.
+MAX_HANDLERS = 4096
+
+#: Default sampling interval, in flushes of the event queue.
+SAMPLE = 1
+
+
+class Histogram(object):
+
+    """
+    A histogram with a fixed set of buckets. A value is counted in the
+    first bucket whose upper bound is not less than the value; values
+    above the last bound end up in an extra, unbounded bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self):
+        """
+        Return the histogram as a dict. ``buckets`` is a list of
+        ``[upper bound, count]`` pairs, the bound of the last bucket
+        is ``None``.
+        """
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / float(self.count) if self.count else 0,
+            "max": self.max,
+            "buckets": [
+                [bound, count] for bound, count in
+                zip(self.bounds + [None], self.counts)
+            ],
+        }
+
+
+class _HandlerStats(object):
+
+    __slots__ = ("name", "errors", "duration")
+
+    def __init__(self, handler):
+        self.name = reprhandler(handler)
+        self.errors = 0
+        self.duration = Histogram(LATENCY_BUCKETS)
+
+
+class Metrics(BaseComponent):
+
+    """Create a new Metrics Component
+
+    Once registered, the component instruments the root manager of the
+    tree it is part of (an unregistered Metrics component instruments
+    itself). It records:
+
+    - per event name, the number of events dispatched and the time they
+      spent in the queue (from being fired to being dispatched),
+    - per handler, the number of calls, the number of calls that raised
+      and the time spent in the handler,
+    - the length of the event queue and the number of tasks at every tick,
+    - the number of task steps processed and the number of tasks that
+      failed.
+
+    Times are measured with a monotonic clock and counted in fixed-size
+    histograms (see :data:`LATENCY_BUCKETS`). Not all events are timed:
+    every *sample* flushes of the event queue (that is, ticks) the next
+    event fired is, so that the cost of the clock readings is per tick
+    rather than per event. The queue times and the handler calls and
+    durations are those of the timed events, the event counts and the
+    handler errors are exact. Managers that are not instrumented pay no
+    more than a ``None`` check per event.
+
+    :param sample: number of flushes per timed event
+    :type sample: int
+    """
+
+    def __init__(self, *args, **kwargs):
+        "initializes x; see x.__class__.__doc__ for signature"
+
+        self._instrumented = None
+        self.sample = kwargs.pop("sample", SAMPLE)
+
+        super(Metrics, self).__init__(*args, **kwargs)
+
+        self.reset()
+        self._instrument(self.root)
+
+    def reset(self):
+        """Discard all collected metrics"""
+
+        self.started = time()
+        self.ticks = 0
+        self.steps = 0
+        self.task_errors = 0
+        self.tasks = Histogram(LENGTH_BUCKETS)
+        self.queue = Histogram(LENGTH_BUCKETS)
+        self._countdown = 1
+        self._sampled = None
+        if self._instrumented is not None:
+            self._instrumented._sampling = None
+        self._counts = defaultdict(int)
+        self._lags = {}
+        self._handlers = {}
+        self._stats = {}
+
+    def _instrument(self, root):
+        if self._instrumented is not None \
+                and self._instrumented._metrics is self:
+            self._instrumented._metrics = None
+            self._instrumented._sampling = None
+        self._instrumented = root
+        root._metrics = self
+
+    def _updateRoot(self, root):
+        super(Metrics, self)._updateRoot(root)
+
+        if self._instrumented is not None:
+            self._instrument(root)
+
+    def _tick(self, queued, tasks):
+        self.ticks += 1
+        self.queue.add(queued)
+        self.tasks.add(tasks)
+
+    def _flushing(self):
+        # Called by the root manager before every flush of its queue, the
+        # next event fired is timed (see Manager._fire)
+        self._countdown -= 1
+        if not self._countdown:
+            self._countdown = self.sample
+            self._instrumented._sampling = self
+
+    def _dispatched(self, event, dispatched, handled):
+        # Called by the dispatcher once the handlers of the timed event
+        # have been invoked, with the (monotonic) time the event has been
+        # dispatched at and a (handler, duration) pair for each handler
+        self._sampled = None
+        try:
+            lag = self._lags[event.name]
+        except KeyError:
+            lag = self._lags[event.name] = Histogram(LATENCY_BUCKETS)
+        lag.add(dispatched - event._queued)
+
+        handlers = self._handlers
+        for handler, duration in handled:
+            try:
+                stats = handlers[handler]
+            except KeyError:
+                stats = self._handlerStats(handler)
+            # Histogram.add() inlined, this is called for every handler
+            h = stats.duration
+            h.counts[bisect_left(h.bounds, duration)] += 1
+            h.count += 1
+            h.total += duration
+            if duration > h.max:
+                h.max = duration
+
+    def _failed(self, handler):
+        # Called by the dispatcher for every handler that raised
+        try:
+            stats = self._handlers[handler]
+        except KeyError:
+            stats = self._handlerStats(handler)
+        stats.errors += 1
+
+    def _handlerStats(self, handler):
+        # Handlers of all instances of a class share their statistics,
+        # so short-lived components (connections, requests) don't pile
+        # up. The handler -> statistics mapping only saves working out
+        # the class and function per call and is dropped when it grows.
+        key = (
+            getattr(handler, "__func__", handler),
+            getattr(handler, "__self__", None).__class__,
+        )
+        try:
+            stats = self._stats[key]
+        except KeyError:
+            stats = self._stats[key] = _HandlerStats(handler)
+        if len(self._handlers) >= MAX_HANDLERS:
+            self._handlers.clear()
+        self._handlers[handler] = stats
+        return stats
+
+    def snapshot(self):
+        """
+        Return the collected metrics as a dict of plain (JSON serializable)
+        values::
+
+            {
+                "uptime": ...,      # seconds since start/reset
+                "ticks": ...,
+                "queue": {...},     # queue length per tick (histogram)
+                "tasks": {
+                    "running": ..., # tasks currently registered
+                    "steps": ...,   # task steps processed
+                    "errors": ...,  # tasks that raised
+                    "length": {...} # tasks per tick (histogram)
+                },
+                "events": {name: {"count": ..., "lag": {...}}},
+                "handlers": {
+                    repr: {"calls": ..., "errors": ..., "duration": {...}}
+                },
+                "cache": {...},     # see HandlerCache.stats()
+            }
+        """
+
+        root = self._instrumented
+        return {
+            "uptime": time() - self.started,
+            "ticks": self.ticks,
+            "queue": self.queue.snapshot(),
+            "tasks": {
+                "running": len(root._tasks) if root is not None else 0,
+                "steps": self.steps,
+                "errors": self.task_errors,
+                "length": self.tasks.snapshot(),
+            },
+            "events": dict(
+                (name, {
+                    "count": count,
+                    "lag": self._lags.get(
+                        name, Histogram(LATENCY_BUCKETS)
+                    ).snapshot(),
+                })
+                for name, count in list(self._counts.items())
+            ),
+            "handlers": dict(
+                (stats.name, {
+                    "calls": stats.duration.count,
+                    "errors": stats.errors,
+                    "duration": stats.duration.snapshot(),
+                })
+                for stats in list(self._stats.values())
+            ),
+            "cache": root.handler_cache.stats() if root is not None else {},
+        }
@@ -2,24 +2,32 @@
 
 This module contains Poller components that enable polling of file or socket
 descriptors for read/write events. Pollers:
+- Selector (the default :data:`Poller` if :mod:`selectors` is available)
 - Select
 - Poll
 - EPoll
+- KQueue
+- AsyncIO
 """
 import os
-import platform
 import select
-from errno import EBADF, EINTR
+import socket as socket_module
+import sys
+from errno import EAGAIN, EBADF, EINTR, EPERM, EWOULDBLOCK
 from select import error as SelectError
 from socket import (
     AF_INET, SOCK_STREAM, create_connection, error as SocketError, socket,
 )
-from threading import Thread
+from threading import Thread, current_thread
 
 from circuits.core.handlers import handler
+from circuits.tools import tryimport
 
 from .components import BaseComponent
-from .events import Event
+from .events import Event, exception, started
+
+fcntl = tryimport("fcntl")
+selectors = tryimport(("selectors", "selectors2", "selectors34"))
 
 
 class _read(Event):
@@ -46,18 +54,39 @@ class BasePoller(BaseComponent):
 
     channel = None
 
+    #: Whether readiness is only reported when it changes (edge triggered)
+    edge = False
+
     def __init__(self, channel=channel):
         super(BasePoller, self).__init__(channel=channel)
 
-        self._read = []
-        self._write = []
+        self._read = set()
+        self._write = set()
         self._targets = {}
+        self._callbacks = {}
 
         self._ctrl_recv, self._ctrl_send = self._create_control_con()
+        self._ctrl_pending = False
 
     def _create_control_con(self):
-        if platform.system() == "Linux":
-            return os.pipe()
+        # The channel resume() wakes the poller up with: an eventfd (both
+        # ends are the same descriptor) or a pipe, a socket pair where
+        # pipes can't be polled (Windows).
+        if hasattr(os, "eventfd"):
+            fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            return fd, fd
+        if os.name == "posix":
+            fds = os.pipe()
+            if fcntl is not None:
+                for fd in fds:
+                    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                    fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            return fds
+        if hasattr(socket_module, "socketpair"):
+            recv, send = socket_module.socketpair()
+            recv.setblocking(False)
+            send.setblocking(False)
+            return recv, send
         server = socket(AF_INET, SOCK_STREAM)
         server.bind(("localhost", 0))
         server.listen(1)
@@ -71,6 +100,8 @@ class BasePoller(BaseComponent):
         at.start()
         clnt_sock = create_connection(server.getsockname())
         at.join()
+        server.close()
+        clnt_sock.setblocking(False)
         return (res_list[0], clnt_sock)
 
     @handler("generate_events", priority=-9)
@@ -87,42 +118,98 @@ class BasePoller(BaseComponent):
         self._generate_events(event)
 
     def resume(self):
-        if isinstance(self._ctrl_send, socket):
-            self._ctrl_send.send(b"\0")
-        else:
-            os.write(self._ctrl_send, b"\0")
+        # A wakeup that hasn't been read yet will do for this one too
+        if self._ctrl_pending:
+            return
+        self._ctrl_pending = True
+        try:
+            if isinstance(self._ctrl_send, socket):
+                self._ctrl_send.send(b"\0")
+            elif self._ctrl_send == self._ctrl_recv:
+                os.eventfd_write(self._ctrl_send, 1)
+            else:
+                os.write(self._ctrl_send, b"\0")
+        except (SocketError, IOError, OSError) as e:
+            # Full, so there is a wakeup pending anyway. Otherwise no
+            # wakeup has been written and the next resume() must try.
+            if e.args[0] not in (EAGAIN, EWOULDBLOCK):
+                self._ctrl_pending = False
 
     def _read_ctrl(self):
         try:
             if isinstance(self._ctrl_recv, socket):
-                return self._ctrl_recv.recv(1)
+                return self._ctrl_recv.recv(4096)
+            elif self._ctrl_send == self._ctrl_recv:
+                return os.eventfd_read(self._ctrl_recv)
             else:
-                return os.read(self._ctrl_recv, 1)
+                return os.read(self._ctrl_recv, 4096)
         except:
             return b"\0"
+        finally:
+            # Cleared once drained, or the wakeup of a resume() racing
+            # with us could be read but the flag left set, and no later
+            # resume() would write one. A resume() that finds the flag
+            # still set skips its write, but has queued its event before:
+            # the manager sees it before it polls again (see
+            # Manager._generateEvents()).
+            self._ctrl_pending = False
 
     def addReader(self, source, fd):
         channel = getattr(source, "channel", "*")
-        self._read.append(fd)
+        self._read.add(fd)
         self._targets[fd] = channel
 
     def addWriter(self, source, fd):
         channel = getattr(source, "channel", "*")
-        self._write.append(fd)
+        self._write.add(fd)
         self._targets[fd] = channel
 
     def removeReader(self, fd):
-        if fd in self._read:
-            self._read.remove(fd)
+        self._read.discard(fd)
         if not (fd in self._read or fd in self._write) and fd in self._targets:
             del self._targets[fd]
 
     def removeWriter(self, fd):
-        if fd in self._write:
-            self._write.remove(fd)
+        self._write.discard(fd)
         if not (fd in self._read or fd in self._write) and fd in self._targets:
             del self._targets[fd]
 
+    def rearm(self, fd):
+        """
+        Have *fd* reported again if it is still ready. Needed by edge
+        triggered pollers after a component stopped reading from (or
+        writing to) *fd* before it would block, e.g. when its budget for
+        the wakeup was used up. Level triggered pollers report it anyway.
+        """
+
+    def setCallbacks(self, fd, read=None, write=None, disconnect=None):
+        """
+        Have *read*, *write* and *disconnect* called (with *fd* as only
+        argument) right from the poll when *fd* is ready for reading,
+        ready for writing or disconnected, instead of firing a
+        ``_read``, ``_write`` or ``_disconnect`` event to its target.
+        This saves a trip through the event queue per readiness
+        notification. The callbacks are removed by :meth:`discard`.
+        """
+
+        self._callbacks[fd] = {_read: read, _write: write, _disconnect: disconnect}
+
+    def removeCallbacks(self, fd):
+        self._callbacks.pop(fd, None)
+
+    def _dispatch(self, event, fd):
+        callbacks = self._callbacks.get(fd)
+        callback = callbacks and callbacks[event]
+        if callback is None:
+            self._fireEvent(event(fd), (self.getTarget(fd),))
+            return
+
+        try:
+            callback(fd)
+        except Exception:
+            err = sys.exc_info()
+            self._fireEvent(exception(*err, handler=callback, fevent=event(fd)), ())
+
     def isReading(self, fd):
         return fd in self._read
 
@@ -130,17 +217,189 @@ class BasePoller(BaseComponent):
         return fd in self._write
 
     def discard(self, fd):
-        if fd in self._read:
-            self._read.remove(fd)
-        if fd in self._write:
-            self._write.remove(fd)
+        self._read.discard(fd)
+        self._write.discard(fd)
         if fd in self._targets:
             del self._targets[fd]
+        self._callbacks.pop(fd, None)
 
     def getTarget(self, fd):
         return self._targets.get(fd, self.parent)
 
 
+class Selector(BasePoller):
+
+    """Selector(...) -> new Selector Poller Component
+
+    Creates a new Selector Poller Component that uses a selector of the
+    :mod:`selectors` module, by default the most efficient one of the
+    platform (epoll, kqueue, devpoll or poll, select as a last resort).
+
+    Registration is kept by the selector only, together with the channel
+    to notify: adding, removing and looking up a descriptor take constant
+    time and a poll costs time in the number of ready descriptors (but
+    for the select based selector), not in the number registered.
+
+    :param selector: the :class:`selectors.BaseSelector` subclass to use
+                     (default: :class:`selectors.DefaultSelector`)
+    """
+
+    channel = "selector"
+
+    def __init__(self, selector=None, channel=channel):
+        if selectors is None:
+            raise RuntimeError("selectors is not available")
+
+        self._selector = (selector or selectors.DefaultSelector)()
+        self._keys = {}  # fd -> SelectorKey
+        self._files = set()
+        self._READ = selectors.EVENT_READ
+        self._WRITE = selectors.EVENT_WRITE
+
+        super(Selector, self).__init__(channel=channel)
+
+        self._selector.register(self._ctrl_recv, self._READ)
+
+    def _update(self, fd, add, remove, channel=None):
+        key = self._keys.get(fd)
+        if key is None:
+            events = add
+            if not events:
+                return
+        else:
+            events = (key.events | add) & ~remove
+            if channel is None:
+                channel = key.data
+            if events == key.events and channel == key.data:
+                return
+
+        if fd in self._files:
+            if events:
+                self._keys[fd] = key._replace(events=events, data=channel)
+            else:
+                del self._keys[fd]
+                self._files.discard(fd)
+            return
+
+        try:
+            if key is None:
+                key = self._register(fd, events, channel)
+            elif events:
+                key = self._selector.modify(fd, events, channel)
+            else:
+                self._selector.unregister(fd)
+                key = None
+        except (KeyError, ValueError):
+            # Closed (or otherwise invalid) descriptor
+            key = None
+        except (OSError, IOError) as e:
+            key = None
+            if e.args[0] == EPERM:
+                # Regular files can't be polled (by epoll), like select()
+                # does, they are reported ready on every poll.
+                fileno = fd if isinstance(fd, int) else fd.fileno()
+                key = selectors.SelectorKey(fd, fileno, events, channel)
+                self._files.add(fd)
+
+        if key is None:
+            self._keys.pop(fd, None)
+        else:
+            self._keys[fd] = key
+
+    def _register(self, fd, events, channel):
+        try:
+            return self._selector.register(fd, events, channel)
+        except KeyError:
+            # The number of a descriptor that was closed without being
+            # discarded got reused
+            stale = self._selector.get_key(fd)
+            self._keys.pop(stale.fileobj, None)
+            self._selector.unregister(stale.fileobj)
+            return self._selector.register(fd, events, channel)
+
+    def addReader(self, source, fd):
+        self._update(fd, self._READ, 0, getattr(source, "channel", "*"))
+
+    def addWriter(self, source, fd):
+        self._update(fd, self._WRITE, 0, getattr(source, "channel", "*"))
+
+    def removeReader(self, fd):
+        self._update(fd, 0, self._READ)
+
+    def removeWriter(self, fd):
+        self._update(fd, 0, self._WRITE)
+
+    def isReading(self, fd):
+        key = self._keys.get(fd)
+        return key is not None and bool(key.events & self._READ)
+
+    def isWriting(self, fd):
+        key = self._keys.get(fd)
+        return key is not None and bool(key.events & self._WRITE)
+
+    def discard(self, fd):
+        self._callbacks.pop(fd, None)
+        if self._keys.pop(fd, None) is None:
+            return
+        if fd in self._files:
+            self._files.discard(fd)
+        else:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+
+    def getTarget(self, fd):
+        key = self._keys.get(fd)
+        return self.parent if key is None else key.data
+
+    def _preenDescriptors(self):
+        # Only needed after a select() error, other selectors drop closed
+        # descriptors by themselves.
+        for fd, key in list(self._keys.items()):
+            try:
+                select.select([key.fd], [], [], 0)
+            except Exception:
+                self.discard(fd)
+
+    def _generate_events(self, event):
+        timeout = 0 if self._files else event.time_left
+        try:
+            ready = self._selector.select(None if timeout < 0 else timeout)
+        except (ValueError, TypeError):
+            return self._preenDescriptors()
+        except (SelectError, SocketError, IOError, OSError) as e:
+            if e.args[0] == EINTR:
+                return
+            elif e.args[0] == EBADF:
+                return self._preenDescriptors()
+            raise
+
+        if self._files:
+            keys = self._keys
+            ready.extend((keys[fd], keys[fd].events) for fd in self._files)
+
+        READ, WRITE, ctrl = self._READ, self._WRITE, self._ctrl_recv
+        callbacks = self._callbacks
+        for key, events in ready:
+            fd = key.fileobj
+            if fd == ctrl:
+                self._read_ctrl()
+                continue
+            if fd in callbacks:
+                if events & WRITE:
+                    self._dispatch(_write, fd)
+                # Unless discarded by the write callback
+                if events & READ and fd in self._keys:
+                    self._dispatch(_read, fd)
+                continue
+            channels = (key.data,)
+            if events & WRITE:
+                self._fireEvent(_write(fd), channels)
+            if events & READ:
+                self._fireEvent(_read(fd), channels)
+
+
 class Select(BasePoller):
 
     """Select(...) -> new Select Poller Component
@@ -156,10 +415,10 @@ class Select(BasePoller):
     def __init__(self, channel=channel):
         super(Select, self).__init__(channel=channel)
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
 
     def _preenDescriptors(self):
-        for socks in (self._read[:], self._write[:]):
+        for socks in (list(self._read), list(self._write)):
             for sock in socks:
                 try:
                     select.select([sock], [sock], [sock], 0)
@@ -200,14 +459,14 @@ class Select(BasePoller):
 
         for sock in w:
             if self.isWriting(sock):
-                self.fire(_write(sock), self.getTarget(sock))
+                self._dispatch(_write, sock)
 
         for sock in r:
             if sock == self._ctrl_recv:
                 self._read_ctrl()
                 continue
             if self.isReading(sock):
-                self.fire(_read(sock), self.getTarget(sock))
+                self._dispatch(_read, sock)
 
 
 class Poll(BasePoller):
@@ -228,7 +487,7 @@ class Poll(BasePoller):
 
         self._disconnected_flag = (select.POLLHUP | select.POLLERR | select.POLLNVAL)
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
         self._updateRegistration(self._ctrl_recv)
 
     def _updateRegistration(self, fd):
@@ -302,19 +561,19 @@ class Poll(BasePoller):
             return
 
         if event & self._disconnected_flag and not (event & select.POLLIN):
-            self.fire(_disconnect(fd), self.getTarget(fd))
+            self._dispatch(_disconnect, fd)
             self._poller.unregister(fileno)
             super(Poll, self).discard(fd)
             del self._map[fileno]
         else:
             try:
                 if event & select.POLLIN:
-                    self.fire(_read(fd), self.getTarget(fd))
+                    self._dispatch(_read, fd)
                 if event & select.POLLOUT:
-                    self.fire(_write(fd), self.getTarget(fd))
+                    self._dispatch(_write, fd)
             except Exception as e:
-                self.fire(_error(fd, e), self.getTarget(fd))
-                self.fire(_disconnect(fd), self.getTarget(fd))
+                self._fireEvent(_error(fd, e), (self.getTarget(fd),))
+                self._dispatch(_disconnect, fd)
                 self._poller.unregister(fileno)
                 super(Poll, self).discard(fd)
                 del self._map[fileno]
@@ -326,19 +585,26 @@ class EPoll(BasePoller):
 
     Creates a new EPoll Poller Component that uses the epoll poller
     implementation.
+
+    With *edge* set, descriptors are registered edge triggered
+    (``EPOLLET``): a descriptor is only reported when it becomes ready,
+    so fewer epoll_wait() calls are made for a busy connection. The
+    socket components read until the socket would block or their budget
+    for the wakeup is used up, in which case they :meth:`rearm` it.
     """
 
     channel = "epoll"
 
-    def __init__(self, channel=channel):
+    def __init__(self, edge=False, channel=channel):
         super(EPoll, self).__init__(channel=channel)
 
+        self.edge = edge
         self._map = {}
         self._poller = select.epoll()
 
         self._disconnected_flag = (select.EPOLLHUP | select.EPOLLERR)
 
-        self._read.append(self._ctrl_recv)
+        self._read.add(self._ctrl_recv)
         self._updateRegistration(self._ctrl_recv)
 
     def _updateRegistration(self, fd):
@@ -351,6 +617,14 @@ class EPoll(BasePoller):
                 for key in keys:
                     del self._map[key]
 
+        mask = self._mask(fd)
+        if mask:
+            self._poller.register(fd, mask)
+            self._map[fileno] = fd
+        else:
+            super(EPoll, self).discard(fd)
+
+    def _mask(self, fd):
         mask = 0
 
         if fd in self._read:
@@ -358,11 +632,11 @@ class EPoll(BasePoller):
         if fd in self._write:
             mask = mask | select.EPOLLOUT
 
-        if mask:
-            self._poller.register(fd, mask)
-            self._map[fileno] = fd
-        else:
-            super(EPoll, self).discard(fd)
+        # Keep the control channel level triggered
+        if mask and self.edge and fd != self._ctrl_recv:
+            mask = mask | select.EPOLLET
+
+        return mask
 
     def addReader(self, source, fd):
         super(EPoll, self).addReader(source, fd)
@@ -384,6 +658,15 @@ class EPoll(BasePoller):
         super(EPoll, self).discard(fd)
         self._updateRegistration(fd)
 
+    def rearm(self, fd):
+        # Modifying the registration of a descriptor that is ready
+        # reports it again, with a single epoll_ctl() call
+        if self.edge and (fd in self._read or fd in self._write):
+            try:
+                self._poller.modify(fd, self._mask(fd))
+            except (SocketError, IOError, ValueError):
+                self._updateRegistration(fd)
+
     def _generate_events(self, event):
         try:
             timeout = event.time_left
@@ -413,19 +696,19 @@ class EPoll(BasePoller):
             return
 
         if event & self._disconnected_flag and not (event & select.POLLIN):
-            self.fire(_disconnect(fd), self.getTarget(fd))
+            self._dispatch(_disconnect, fd)
             self._poller.unregister(fileno)
             super(EPoll, self).discard(fd)
             del self._map[fileno]
         else:
             try:
                 if event & select.EPOLLIN:
-                    self.fire(_read(fd), self.getTarget(fd))
+                    self._dispatch(_read, fd)
                 if event & select.EPOLLOUT:
-                    self.fire(_write(fd), self.getTarget(fd))
+                    self._dispatch(_write, fd)
             except Exception as e:
-                self.fire(_error(fd, e), self.getTarget(fd))
-                self.fire(_disconnect(fd), self.getTarget(fd))
+                self._fireEvent(_error(fd, e), (self.getTarget(fd),))
+                self._dispatch(_disconnect, fd)
                 self._poller.unregister(fileno)
                 super(EPoll, self).discard(fd)
                 del self._map[fileno]
@@ -446,8 +729,9 @@ class KQueue(BasePoller):
         self._map = {}
         self._poller = select.kqueue()
 
-        self._read.append(self._ctrl_recv)
-        self._map[self._ctrl_recv.fileno()] = self._ctrl_recv
+        ctrl = self._ctrl_recv
+        self._read.add(ctrl)
+        self._map[ctrl.fileno() if not isinstance(ctrl, int) else ctrl] = ctrl
         self._poller.control(
             [
                 select.kevent(
@@ -537,15 +821,192 @@ class KQueue(BasePoller):
             return
 
         if event.flags & select.KQ_EV_ERROR:
-            self.fire(_error(sock, "error"), self.getTarget(sock))
+            self._fireEvent(_error(sock, "error"), (self.getTarget(sock),))
         elif event.flags & select.KQ_EV_EOF:
-            self.fire(_disconnect(sock), self.getTarget(sock))
+            self._dispatch(_disconnect, sock)
         elif event.filter == select.KQ_FILTER_WRITE:
-            self.fire(_write(sock), self.getTarget(sock))
+            self._dispatch(_write, sock)
         elif event.filter == select.KQ_FILTER_READ:
-            self.fire(_read(sock), self.getTarget(sock))
+            self._dispatch(_read, sock)
+
+
+class AsyncIO(BasePoller):
 
+    """AsyncIO(...) -> new AsyncIO Poller Component
 
-Poller = Select
+    Creates a new AsyncIO Poller Component that hands waiting for I/O over
+    to an :mod:`asyncio` event loop (using ``loop.add_reader`` and
+    ``loop.add_writer``), so that circuits components and asyncio
+    libraries can share a single thread.
+
+    The manager is then driven by the event loop instead of
+    :meth:`~.manager.Manager.run`::
+
+        app = App()
+        poller = AsyncIO().register(app)
+        loop.run_until_complete(poller.serve())
+
+    Handlers may return asyncio coroutines (they are scheduled on the loop
+    and their result becomes the value of the event) and coroutines may
+    await the :class:`~.values.Value` of a fired event. With no event loop
+    running, the value of the event is a :class:`RuntimeError` instead.
+
+    :param loop: the event loop to use (default: the current event loop)
+    """
+
+    channel = "asyncio"
+
+    def __init__(self, loop=None, channel=channel):
+        # Imported here as importing asyncio is slow
+        asyncio = tryimport("asyncio")
+        if asyncio is None:
+            raise RuntimeError("asyncio is not available")
+
+        self._loop = loop or asyncio.get_event_loop()
+
+        super(AsyncIO, self).__init__(channel=channel)
+
+        self._readable = set()
+        self._writable = set()
+        self._event = None
+        self._handle = None
+        self._done = None
+
+    def _create_control_con(self):
+        # The event loop is woken up with call_soon_threadsafe()
+        return None, None
+
+    def resume(self):
+        self._loop.call_soon_threadsafe(self._wakeup)
 
-__all__ = ("BasePoller", "Poller", "Select", "Poll", "EPoll", "KQueue")
+    def _ready(self, fds, fd):
+        fds.add(fd)
+        self._wakeup()
+
+    def _unwatch(self, remove, fd):
+        try:
+            remove(fd)
+        except (ValueError, KeyError, OSError):
+            # Already closed
+            pass
+
+    def addReader(self, source, fd):
+        super(AsyncIO, self).addReader(source, fd)
+        self._loop.add_reader(fd, self._ready, self._readable, fd)
+
+    def addWriter(self, source, fd):
+        super(AsyncIO, self).addWriter(source, fd)
+        self._loop.add_writer(fd, self._ready, self._writable, fd)
+
+    def removeReader(self, fd):
+        super(AsyncIO, self).removeReader(fd)
+        self._readable.discard(fd)
+        self._unwatch(self._loop.remove_reader, fd)
+
+    def removeWriter(self, fd):
+        super(AsyncIO, self).removeWriter(fd)
+        self._writable.discard(fd)
+        self._unwatch(self._loop.remove_writer, fd)
+
+    def discard(self, fd):
+        super(AsyncIO, self).discard(fd)
+        self._readable.discard(fd)
+        self._writable.discard(fd)
+        self._unwatch(self._loop.remove_reader, fd)
+        self._unwatch(self._loop.remove_writer, fd)
+
+    def _generate_events(self, event):
+        # Never blocks: the event loop waits on behalf of the manager
+        # (see _tick()) once this iteration is complete.
+        writable = list(self._writable)
+        readable = list(self._readable)
+        self._writable.clear()
+        self._readable.clear()
+
+        for fd in writable:
+            if self.isWriting(fd):
+                self._dispatch(_write, fd)
+
+        for fd in readable:
+            if self.isReading(fd):
+                self._dispatch(_read, fd)
+
+        self._event = event
+
+    def serve(self):
+        """
+        Start running the manager (the root of this poller's tree) on the
+        event loop. Returns an :class:`asyncio.Future` that is done when the
+        manager has been stopped.
+        """
+
+        root = self.root
+
+        self._done = self._loop.create_future()
+        if root._owner is not None:
+            # Events are fired by the thread running the event loop
+            root._owner = current_thread().ident
+        root._running = True
+        root.fire(started(root))
+        self._wakeup()
+
+        return self._done
+
+    def _wakeup(self):
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._loop.call_soon(self._tick)
+
+    def _tick(self):
+        self._handle = None
+        root = self.root
+
+        root._executing_thread = current_thread()
+        try:
+            root.tick()
+            if not root.running:
+                # Fading out, handle remaining work from stop event
+                while len(root):
+                    root.tick()
+                for _ in range(3):
+                    root.tick()
+        except Exception as e:
+            root._running = False
+            if not self._done.done():
+                self._done.set_exception(e)
+            return
+        finally:
+            root._executing_thread = None
+
+        if not root.running:
+            if not self._done.done():
+                self._done.set_result(None)
+            return
+
+        # Wait for as long as the manager asked for in its generate_events
+        # event. Until then, the event stays the one being handled so that
+        # events fired from other threads (or from asyncio callbacks)
+        # resume us just like a blocking poller.
+        event, self._event = self._event, None
+        with root._lock:
+            if event is None or len(root) or root._woken or root._tasks_added:
+                time_left = 0
+            else:
+                root._currently_handling = event
+                time_left = event.time_left
+
+        if time_left == 0:
+            self._wakeup()
+        elif time_left > 0:
+            self._handle = self._loop.call_later(time_left, self._tick)
+
+
+if selectors is not None:
+    Poller = Selector
+else:
+    Poller = Select
+
+__all__ = (
+    "BasePoller", "Poller", "Selector", "Select", "Poll", "EPoll", "KQueue",
+    "AsyncIO",
+)
@@ -3,8 +3,6 @@
 from datetime import datetime
 from time import mktime, time
 
-from circuits.core.handlers import handler
-
 from .components import BaseComponent
 
 
@@ -14,6 +12,10 @@ class Timer(BaseComponent):
 
     A timer is a component that fires an event once after a certain
     delay or periodically at a regular interval.
+
+    Timers do not poll: their deadline is kept by the timer service of
+    the root manager, so resetting a timer is cheap and a large number
+    of idle timers does not slow down the main loop.
     """
 
     def __init__(self, interval, event, *channels, **kwargs):
@@ -38,6 +40,9 @@ class Timer(BaseComponent):
 
         super(Timer, self).__init__()
 
+        self._entry = None
+        self._service = None
+
         self.expiry = None
         self.interval = None
         self.event = event
@@ -46,25 +51,33 @@ class Timer(BaseComponent):
 
         self.reset(interval)
 
-    @handler("generate_events")
-    def _on_generate_events(self, event):
-        if self.expiry is None:
+    def _expire(self):
+        self._entry = self._service = None
+
+        if self.unregister_pending:
             return
+        self.fire(self.event, *self.channels)
 
-        now = time()
+        if self.persist:
+            self.reset()
+        else:
+            self.unregister()
 
-        if now >= self.expiry:
-            if self.unregister_pending:
-                return
-            self.fire(self.event, *self.channels)
+    def _schedule(self):
+        if self._entry is not None:
+            self._service.cancel(self._entry)
+            self._entry = self._service = None
 
-            if self.persist:
-                self.reset()
-            else:
-                self.unregister()
-            event.reduce_time_left(0)
-        else:
-            event.reduce_time_left(self.expiry - now)
+        if self.expiry is not None:
+            self._service = self.root._timers
+            self._entry = self.root._scheduleTimer(self.expiry, self._expire)
+
+    def _updateRoot(self, root):
+        super(Timer, self)._updateRoot(root)
+
+        # Move a pending deadline to the timer service of the new root
+        if self._entry is not None:
+            self._schedule()
 
     def reset(self, interval=None):
         """
@@ -86,3 +99,4 @@ class Timer(BaseComponent):
     @expiry.setter
     def expiry(self, seconds):
         self._expiry = seconds
+        self._schedule()
@@ -23,10 +23,19 @@ class Value(object):
     :ivar result: True if this value has been changed.
     :ivar errors: True if while setting this value an exception occured.
     :ivar notify: True or an event name  to notify of changes to this value
+    :ivar done: True once the event has been handled completely.
 
-    This is a Future/Promise implementation.
+    This is a Future/Promise implementation. A value can be awaited in
+    :mod:`asyncio` coroutines (``result = await self.fire(event)``); this
+    requires the manager to be driven by an asyncio event loop
+    (see :class:`~.pollers.AsyncIO`).
     """
 
+    __slots__ = (
+        "event", "manager", "notify", "promise", "result", "errors", "parent",
+        "handled", "done", "_callbacks", "_value", "__dict__",
+    )
+
     def __init__(self, event=None, manager=None):
         self.event = event
         self.manager = manager
@@ -38,14 +47,56 @@ class Value(object):
         self.errors = False
         self.parent = self
         self.handled = False
+        self.done = False
 
+        self._callbacks = None
         self._value = None
 
     def __getstate__(self):
-        odict = self.__dict__.copy()
-        del odict["manager"]
+        odict = dict(
+            (k, getattr(self, k)) for k in Value.__slots__
+            if k not in ("manager", "_callbacks", "__dict__")
+        )
+        odict.update(self.__dict__)
         return odict
 
+    def __setstate__(self, dict):
+        self.manager = None
+        self._callbacks = None
+        for k, v in dict.items():
+            setattr(self, k, v)
+
+    def __await__(self):
+        from asyncio import get_event_loop
+
+        loop = get_event_loop()
+        future = loop.create_future()
+
+        def done(value):
+            loop.call_soon_threadsafe(_resolve, future, value)
+
+        self.add_done_callback(done)
+        return future.__await__()
+
+    def add_done_callback(self, fn):
+        """
+        Arrange for *fn* to be called with this value once its event
+        has been handled completely (immediately if it already has).
+        """
+
+        if self.done:
+            fn(self)
+        elif self._callbacks is None:
+            self._callbacks = [fn]
+        else:
+            self._callbacks.append(fn)
+
+    def _setDone(self):
+        self.done = True
+        callbacks, self._callbacks = self._callbacks, None
+        for fn in callbacks or ():
+            fn(self)
+
     def __contains__(self, y):
         value = self.value
         return y in value if isinstance(value, list) else y == value
@@ -131,3 +182,13 @@ class Value(object):
         update(self, value)
 
     value = property(getValue, setValue, None, "Value of this Value")
+
+
+def _resolve(future, value):
+    # Completes an asyncio future awaiting a Value
+    if future.cancelled():
+        return
+    if value.errors and isinstance(value.value, tuple) and len(value.value) == 3:
+        future.set_exception(value.value[1])
+    else:
+        future.set_result(value.value)
@@ -8,11 +8,14 @@ to create a pool of workers using sub-processes for CPU-bound work or `False`
 Then fire `task()` events with a function and *args and **kwargs to pass
 to the function when called from within the workers.
 """
+from collections import deque
 from multiprocessing import Pool as ProcessPool, cpu_count
 from multiprocessing.pool import ThreadPool
-from threading import current_thread
+from threading import Lock, current_thread
+from time import time
 from weakref import WeakKeyDictionary
 
+from ..six import PY3
 from .components import BaseComponent
 from .events import Event
 from .handlers import handler
@@ -45,6 +48,56 @@ class task(Event):
         super(task, self).__init__(f, *args, **kwargs)
 
 
+class BacklogFull(Exception):
+
+    """The task did not fit in the Worker's backlog (see *backlog*)"""
+
+
+def _call(f, args, kwargs):
+    # Runs in the pool. Exceptions are returned rather than raised so that
+    # a single (Python 2 compatible) completion callback sees every outcome.
+    start = time()
+    try:
+        return True, f(*args, **kwargs), time() - start
+    except Exception as e:
+        return False, e, time() - start
+
+
+class _Completion(object):
+
+    """A minimal future resolved from a pool's result handler thread
+
+    Handlers that yield a :class:`_Completion` are parked by the manager
+    and resumed as soon as it is resolved.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._callbacks = []
+        self._done = False
+        self._ok = True
+        self._value = None
+
+    def add_done_callback(self, fn):
+        with self._lock:
+            if not self._done:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def result(self):
+        if not self._ok:
+            raise self._value
+        return self._value
+
+    def resolve(self, ok, value):
+        with self._lock:
+            self._done, self._ok, self._value = True, ok, value
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+
 class Worker(BaseComponent):
 
     """A thread/process Worker Component
@@ -57,13 +110,33 @@ class Worker(BaseComponent):
     and `task_failure` if it failed and threw an exception. The `task()` event
     can also be "waited" upon by using the `.call()` and `.wait()` primitives.
 
+    Waiting for a task does not keep the main loop busy: the pool hands the
+    result back through a completion callback which wakes up the loop.
+
     :param process: True to start this Worker as a process (Thread otherwise)
     :type process: bool
+
+    :param workers: the number of threads or processes in the pool
+    :type workers: int
+
+    :param queue: the maximum number of tasks submitted to the pool at any
+                  time. Further tasks wait (without blocking the main loop)
+                  until a previous task has completed. ``0`` (the default)
+                  means unbounded.
+    :type queue: int
+
+    :param backlog: the maximum number of tasks waiting for a slot (only
+                    with *queue*). Further tasks fail right away with
+                    :class:`BacklogFull` (``task_failure`` is fired), so
+                    that producers can back off. ``0`` (the default) means
+                    unbounded.
+    :type backlog: int
     """
 
     channel = "worker"
 
-    def init(self, process=False, workers=None, channel=channel):
+    def init(self, process=False, workers=None, channel=channel, queue=0,
+             backlog=0):
         if not hasattr(current_thread(), "_children"):
             current_thread()._children = WeakKeyDictionary()
 
@@ -71,6 +144,40 @@ class Worker(BaseComponent):
         Pool = ProcessPool if process else ThreadPool
         self.pool = Pool(self.workers)
 
+        self.queue = queue
+        self.backlog = backlog
+        self._backlog = deque()
+        self._lock = Lock()
+        self._started = time()
+        self._submitted = self._completed = self._failed = self._pending = 0
+        self._busy_time = 0.0
+
+    @property
+    def stats(self):
+        """
+        Utilization metrics of this worker as a ``dict``:
+
+        - ``submitted``, ``completed`` and ``failed`` task counters
+        - ``pending``: tasks submitted to the pool and not yet completed
+        - ``queued``: tasks waiting for a free slot (see *queue*)
+        - ``busy_time``: seconds spent executing tasks
+        - ``utilization``: ``busy_time`` relative to the capacity of the
+          pool since the worker was created
+        """
+
+        with self._lock:
+            elapsed = (time() - self._started) * self.workers
+            return {
+                "workers": self.workers,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "pending": self._pending,
+                "queued": len(self._backlog),
+                "busy_time": self._busy_time,
+                "utilization": self._busy_time / elapsed if elapsed else 0.0,
+            }
+
     @handler("stopped", "unregistered", channel="*")
     def _on_stopped(self, event, *args):
         if event.name == "unregistered" and args[0] is not self:
@@ -81,7 +188,53 @@ class Worker(BaseComponent):
 
     @handler("task")
     def _on_task(self, f, *args, **kwargs):
-        result = self.pool.apply_async(f, args, kwargs)
-        while not result.ready():
-            yield
-        yield result.get()
+        # Take a slot (or a place in the backlog) right away so that
+        # tasks are submitted in the order they have been fired.
+        with self._lock:
+            slot = None
+            if self.queue and self._pending >= self.queue:
+                if self.backlog and len(self._backlog) >= self.backlog:
+                    raise BacklogFull(
+                        "{0:d} tasks waiting".format(len(self._backlog))
+                    )
+                slot = _Completion()
+                self._backlog.append(slot)
+            else:
+                self._pending += 1
+
+        return self._run(slot, f, args, kwargs)
+
+    def _run(self, slot, f, args, kwargs):
+        if slot is not None:
+            yield slot  # resumed once a slot has been handed over
+
+        completion = _Completion()
+
+        def done(outcome):
+            ok, value, duration = outcome
+            with self._lock:
+                self._completed += 1
+                self._failed += not ok
+                self._busy_time += duration
+                if self._backlog:
+                    slot = self._backlog.popleft()
+                else:
+                    slot = None
+                    self._pending -= 1
+            if slot is not None:
+                slot.resolve(True, None)
+            completion.resolve(ok, value)
+
+        options = {}
+        if PY3:
+            # The pool's own errors, e.g. a result that can't be pickled
+            # (in process mode), don't go through _call()
+            options["error_callback"] = lambda e: done((False, e, 0.0))
+
+        with self._lock:
+            self._submitted += 1
+        self.pool.apply_async(
+            _call, (f, args, kwargs), callback=done, **options
+        )
+
+        yield (yield completion)
@@ -48,6 +48,7 @@ class File(Component):
         self._poller = None
         self._buffer = deque()
         self._closeflag = False
+        self._paused = None
 
     @property
     def closed(self):
@@ -88,7 +89,10 @@ class File(Component):
             fcntl.fcntl(self._fd, fcntl.F_SETFL, flag)
 
         if "r" in self.mode or "+" in self.mode:
-            self._poller.addReader(self, self._fd)
+            if self._paused is not None:
+                self._paused = True
+            else:
+                self._poller.addReader(self, self._fd)
 
         self.fire(opened(self.filename, self.mode))
 
@@ -113,6 +117,31 @@ class File(Component):
     def _on_stopped(self, component):
         self.fire(close())
 
+    @handler("high_watermark", "low_watermark", channel="*")
+    def _on_watermark(self, event, *args):
+        if event.affects(self.channel, "read"):
+            if event.name == "high_watermark":
+                self.pause_reading()
+            else:
+                self.resume_reading()
+
+    def pause_reading(self):
+        """Stop reading from the file until :meth:`resume_reading`"""
+
+        if self._paused is not None:
+            return
+
+        self._paused = not self.closed and self._poller.isReading(self._fd)
+        if self._paused:
+            self._poller.removeReader(self._fd)
+
+    def resume_reading(self):
+        """Resume reading from the file after :meth:`pause_reading`"""
+
+        paused, self._paused = self._paused, None
+        if paused and not self.closed:
+            self._poller.addReader(self, self._fd)
+
     @handler("prepare_unregister", channel="*")
     def _on_prepare_unregister(self, event, c):
         if event.in_subtree(self):
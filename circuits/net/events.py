@@ -261,3 +261,21 @@ class starttls(Event):
 
     def __init__(self, sock):
         super(starttls, self).__init__(sock)
+
+
+class adopt(Event):
+
+    """adopt Event
+
+    This event can be fired to have a server handle a client connection
+    that has been accepted elsewhere (see :mod:`circuits.net.reactors`).
+
+    .. note::
+        This event is for Server Components.
+
+    :param sock: The accepted client socket.
+    :type sock: socket.socket
+    """
+
+    def __init__(self, sock):
+        super(adopt, self).__init__(sock)
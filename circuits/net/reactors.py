@@ -0,0 +1,258 @@
+"""Multi-reactor Components
+
+This module contains :class:`Reactors`, a server that spreads its
+connections over several reactors to make use of several CPU cores. A
+reactor is a manager of its own, with its own poller and event queue,
+running in a thread or process of its own. One acceptor accepts the
+connections and hands them off to the reactors, round-robin or to the
+least loaded one. Everything that happens on a connection, including its
+protocol components (e.g. the HTTP parser of :mod:`circuits.web`), then
+happens on the reactor that owns it.
+
+The components of a reactor are created by a factory that is given the
+listening socket and returns them. They must include a
+:class:`~circuits.net.sockets.Server` created with this socket and
+``accept=False``, which is given the connections by ``adopt`` events.
+A web server with a reactor per CPU::
+
+    from circuits import Manager
+    from circuits.net.reactors import Reactors
+    from circuits.web import Controller, Server
+
+    class Root(Controller):
+
+        def index(self):
+            return "Hello World!"
+
+    def reactor(sock):
+        return Server(sock, accept=False) + Root()
+
+    (Manager() + Reactors(8000, reactor)).run()
+
+Reactors are threads on free-threaded Python builds, where threads run
+in parallel, and processes otherwise. Like ``Manager.start(process=True)``
+processes are forked once the reactors have been set up. They are given
+the connections over a UNIX socket pair, so they are only
+:data:`PROCESSES` on POSIX systems.
+"""
+import os
+import sys
+from array import array
+from ctypes import c_ulong
+from errno import EAGAIN, EWOULDBLOCK
+from multiprocessing import cpu_count
+from operator import attrgetter
+from socket import error as SocketError, socket
+
+from circuits.core import BaseComponent, Manager, handler
+from circuits.core.pollers import BasePoller, Poller
+from circuits.core.utils import findcmp
+from circuits.six import string_types
+
+from .events import adopt, error
+from .sockets import Server, TCPServer, UNIXServer
+
+try:
+    from socket import (
+        AF_UNIX, CMSG_LEN, SCM_RIGHTS, SOCK_DGRAM, SOL_SOCKET, socketpair,
+    )
+except ImportError:
+    AF_UNIX = None
+
+#: Whether threads run Python code in parallel (a free-threaded build)
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+#: Whether reactors can be processes
+PROCESSES = AF_UNIX is not None and hasattr(os, "fork") \
+    and hasattr(socket, "sendmsg")
+
+ROUND_ROBIN = "round-robin"
+LEAST_LOADED = "least-loaded"
+
+_FD_SIZE = array("i").itemsize
+
+
+class Reactor(BaseComponent):
+
+    """Reactor(server, process=False) -> new Reactor Component
+
+    The part of a reactor that is registered to its manager by
+    :class:`Reactors`. Hands the connections given to it by :meth:`give`
+    to *server* and keeps count of the reactor's :attr:`load`.
+    """
+
+    def __init__(self, server, process=False):
+        super(Reactor, self).__init__(channel=server.channel)
+
+        self.server = server
+
+        # Each count is changed by one side only: given by the acceptor,
+        # closed by the reactor.
+        self.given = 0
+        if process:
+            from multiprocessing.sharedctypes import RawValue
+            self._closed = RawValue("L", 0)
+            self._send, self._recv = socketpair(AF_UNIX, SOCK_DGRAM)
+            self._recv.setblocking(False)
+        else:
+            self._closed = c_ulong(0)
+            self._send = self._recv = None
+
+    @property
+    def load(self):
+        """Number of connections given to the reactor and not closed yet"""
+
+        return self.given - self._closed.value
+
+    def give(self, sock):
+        """Hand *sock*, an accepted connection, to the reactor"""
+
+        # Counted first, the reactor may be done with it before we are
+        self.given += 1
+
+        if self._send is None:
+            self.fireThreadsafe(adopt(sock), self.server.channel)
+            return
+
+        fds = array("i", [sock.fileno()])
+        try:
+            self._send.sendmsg([b"\0"], [(SOL_SOCKET, SCM_RIGHTS, fds)])
+        except SocketError:
+            self.given -= 1
+            raise
+
+        # The reactor has a descriptor of its own now
+        sock.close()
+
+    @handler("started", channel="*")
+    def _on_started(self, component):
+        # Only started in the reactor process (or thread)
+        if component is not self.root or self._recv is None:
+            return
+
+        poller = findcmp(self.root, BasePoller)
+        poller.setCallbacks(self._recv, read=self._receive)
+        poller.addReader(self, self._recv)
+
+    @handler("disconnect")
+    def _on_disconnect(self, sock):
+        self._closed.value += 1
+
+    def _receive(self, fd):
+        while True:
+            try:
+                _, ancdata, _, _ = fd.recvmsg(1, CMSG_LEN(_FD_SIZE))
+            except SocketError as e:
+                if e.args[0] in (EAGAIN, EWOULDBLOCK):
+                    return
+                raise
+
+            for level, type, data in ancdata:
+                if level == SOL_SOCKET and type == SCM_RIGHTS:
+                    fds = array("i")
+                    fds.frombytes(data[:len(data) - len(data) % _FD_SIZE])
+                    for fileno in fds:
+                        sock = socket(fileno=fileno)
+                        self.fire(adopt(sock), self.server.channel)
+
+
+class Reactors(BaseComponent):
+
+    """Reactors(bind, factory, ...) -> new Reactors Component
+
+    Creates a server accepting connections on *bind* (like
+    :class:`~circuits.web.servers.BaseServer`: a TCP server unless *bind*
+    is a path) and *n* reactors handling them.
+
+    :param factory: called with the listening socket for each reactor,
+                    returns the reactor's components (see
+                    :mod:`circuits.net.reactors`)
+    :param n: number of reactors (default: the number of CPUs)
+    :param process: whether the reactors are processes rather than
+                    threads (default: unless :data:`FREE_THREADED`)
+    :param balance: :data:`ROUND_ROBIN` or :data:`LEAST_LOADED`, the
+                    reactor with the fewest open connections
+    :param poller: the poller (class) of each reactor
+
+    Other keyword arguments are passed to the accepting server.
+    """
+
+    channel = "reactors"
+
+    def __init__(self, bind, factory, n=None, process=None,
+                 balance=ROUND_ROBIN, poller=Poller, channel=channel,
+                 **kwargs):
+        super(Reactors, self).__init__(channel=channel)
+
+        if balance not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError("Unknown balance: {0!r}".format(balance))
+
+        if process is None:
+            process = PROCESSES and not FREE_THREADED
+        elif process and not PROCESSES:
+            raise RuntimeError("Reactor processes are not available")
+
+        self._process = process
+        self._balance = balance
+        self._next = 0
+        self._started = False
+
+        if isinstance(bind, string_types) and ":" not in bind:
+            SocketType = UNIXServer
+        else:
+            SocketType = TCPServer
+
+        self.server = SocketType(
+            bind, handoff=self._handoff, channel=channel, **kwargs
+        ).register(self)
+
+        self.reactors = []
+        for i in range(n or cpu_count()):
+            manager = Manager()
+            poller().register(manager)
+            factory(self.server._sock).register(manager)
+
+            server = findcmp(manager, Server)
+            if server is None:
+                raise TypeError("factory returned no Server component")
+
+            self.reactors.append(Reactor(server, process).register(manager))
+
+    @property
+    def host(self):
+        return self.server.host
+
+    @property
+    def port(self):
+        return self.server.port
+
+    @handler("registered", "started", channel="*")
+    def _on_registered_or_started(self, component, manager=None):
+        if self._started or not self.root.running:
+            return
+
+        for reactor in self.reactors:
+            reactor.root.start(process=self._process)
+        self._started = True
+
+    @handler("stopped", channel="*")
+    def _on_stopped(self, component):
+        if component is not self.root or not self._started:
+            return
+
+        self._started = False
+        for reactor in self.reactors:
+            reactor.root.stop()
+
+    def _handoff(self, sock):
+        if self._balance == LEAST_LOADED:
+            reactor = min(self.reactors, key=attrgetter("load"))
+        else:
+            reactor = self.reactors[self._next]
+            self._next = (self._next + 1) % len(self.reactors)
+
+        try:
+            reactor.give(sock)
+        except SocketError as e:
+            self.fire(error(sock, e))
+            sock.close()
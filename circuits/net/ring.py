@@ -0,0 +1,398 @@
+"""Shared Memory Ring Components
+
+This module contains a shared memory alternative to
+:func:`~circuits.net.sockets.Pipe` for connecting a process to a child
+process it forks (e.g. the two :class:`~circuits.core.bridge.Bridge`
+components of ``Manager.start(process=True, link=..., transport=RingPipe)``).
+
+Each direction is a single producer, single consumer ring buffer in an
+anonymous shared memory mapping (inherited by the forked child), so
+data is written and read without any system calls. A pipe per side is
+only used to wake up the reading side: at most one byte is written per
+batch of writes (once per poll of the writing side), however many
+writes the batch has.
+
+The ring relies on the stores of one process becoming visible to the
+other in program order, which holds for x86 CPUs but not for CPUs with
+weaker memory ordering (e.g. ARM), where Python can't issue the needed
+memory barriers. :data:`AVAILABLE` tells whether the ring can be used.
+"""
+import os
+from collections import deque
+from errno import EAGAIN, EPIPE
+from fcntl import F_GETFL, F_SETFL, fcntl
+from mmap import mmap
+from platform import machine
+from struct import Struct
+from time import time
+
+from circuits.core import BaseComponent, handler
+from circuits.core.pollers import BasePoller, Poller
+from circuits.core.utils import findcmp
+from circuits.six import PY3
+
+from .events import close, disconnected, read, ready
+
+#: Whether the shared memory ring can be used on this machine
+AVAILABLE = hasattr(os, "fork") and machine().lower() in (
+    "x86_64", "amd64", "i386", "i686", "x86",
+)
+
+SIZE = 4 * 1024 * 1024  # 4MB per direction
+BUFSIZE = 4096
+
+#: Seconds between retries of a writer waiting for space in a full ring
+RETRY = 0.01
+
+# Native size and alignment, so that a counter is stored with a single
+# (atomic) store instead of byte by byte.
+_counter = Struct("Q")
+_get = _counter.unpack_from
+_set = _counter.pack_into
+
+# Offsets of the header fields, each in its own cache line
+_HEAD = 0  # read position, written by the consumer
+_TAIL = 64  # write position, written by the producer
+_WAITING = 128  # set by the producer waiting for space
+_CLOSED = 192  # set by the producer once closed
+_DATA = 256
+
+
+class _Ring(object):
+
+    """A single producer, single consumer byte ring in shared memory"""
+
+    def __init__(self, size=SIZE):
+        if size <= 0 or size & (size - 1):
+            raise ValueError("size must be a power of 2")
+
+        self._mm = mmap(-1, _DATA + size)
+        self._size = size
+        self._mask = size - 1
+
+        # Each side only needs its own position, the other one is read
+        # from the header. The producer only reads the consumer's
+        # position again once the space it last saw is used up.
+        self._head = 0
+        self._tail = 0
+        self._limit = size
+
+    @property
+    def waiting(self):
+        return bool(_get(self._mm, _WAITING)[0])
+
+    @waiting.setter
+    def waiting(self, value):
+        _set(self._mm, _WAITING, int(value))
+
+    @property
+    def closed(self):
+        return bool(_get(self._mm, _CLOSED)[0])
+
+    @closed.setter
+    def closed(self, value):
+        _set(self._mm, _CLOSED, int(value))
+
+    def write(self, data):
+        """Write as much of *data* as fits, return the number of bytes"""
+
+        mm, tail, n = self._mm, self._tail, len(data)
+        if tail + n > self._limit:
+            self._limit = _get(mm, _HEAD)[0] + self._size
+            if tail + n > self._limit:
+                n = self._limit - tail
+                if not n:
+                    return 0
+                data = data[:n]
+
+        pos = tail & self._mask
+        end = pos + n
+        if end <= self._size:
+            mm[_DATA + pos:_DATA + end] = data
+        else:
+            first = self._size - pos
+            mm[_DATA + pos:_DATA + self._size] = data[:first]
+            mm[_DATA:_DATA + n - first] = data[first:]
+
+        # Publish the data only once it has been written
+        self._tail = tail = tail + n
+        _set(mm, _TAIL, tail)
+        return n
+
+    def read(self):
+        """Read and return all available data"""
+
+        mm, head = self._mm, self._head
+        n = _get(mm, _TAIL)[0] - head
+        if not n:
+            return b""
+
+        pos = head & self._mask
+        end = pos + n
+        if end <= self._size:
+            data = mm[_DATA + pos:_DATA + end]
+        else:
+            data = mm[_DATA + pos:_DATA + self._size]
+            data += mm[_DATA:_DATA + end - self._size]
+
+        self._head = head = head + n
+        _set(mm, _HEAD, head)
+        return data
+
+
+def _pipe():
+    r, w = os.pipe()
+    for fd in (r, w):
+        fcntl(fd, F_SETFL, fcntl(fd, F_GETFL) | os.O_NONBLOCK)
+    return r, w
+
+
+class RingClient(BaseComponent):
+
+    """
+    One end of a :func:`RingPipe`.
+
+    Has the interface of a connected :class:`~circuits.net.sockets.Client`:
+    fires :class:`~.events.read` events with the data written by the other
+    end and handles :class:`~.events.write` and :class:`~.events.close`
+    events.
+    """
+
+    channel = "ring"
+
+    def __init__(self, tx, rx, rfd, wfd, channel=channel):
+        super(RingClient, self).__init__(channel=channel)
+
+        self._tx = tx
+        self._rx = rx
+        self._rfd = rfd  # woken up by the other end
+        self._wfd = wfd  # wakes up the other end
+
+        self._pid = os.getpid()
+        self._peer = None  # the other end, see RingPipe()
+
+        self._poller = None
+        self._pending = deque()
+        self._notifying = False
+        self._retry = None
+        self._closeflag = False
+        self._connected = True
+
+    @property
+    def connected(self):
+        return getattr(self, "_connected", None)
+
+    @handler("registered", "started", channel="*")
+    def _on_registered_or_started(self, component, manager=None):
+        if self._poller is None:
+            # In a forked process, the other end is only used by the
+            # process it was created in
+            peer = self._peer
+            if peer is not None and self._pid != os.getpid():
+                peer.release()
+
+            if isinstance(component, BasePoller):
+                self._poller = component
+            else:
+                if component is not self:
+                    return
+                component = findcmp(self.root, BasePoller)
+                if component is not None:
+                    self._poller = component
+                else:
+                    self._poller = Poller().register(self)
+
+            if self._connected:
+                self._poller.addReader(self, self._rfd)
+            self.fire(ready(self))
+
+    @handler("stopped", channel="*")
+    def _on_stopped(self, component):
+        self.fire(close())
+
+    @handler("prepare_unregister", channel="*")
+    def _on_prepare_unregister(self, event, c):
+        if event.in_subtree(self):
+            self._close()
+
+    @handler("write")
+    def write(self, data):
+        if not self._connected:
+            return
+
+        pending = self._pending
+        if not pending:
+            n = self._tx.write(data)
+            if n and not self._notifying:
+                self._notify()
+            if n == len(data):
+                return
+            data = memoryview(data)[n:] if PY3 else data[n:]
+
+        pending.append(data)
+        self._flush()
+
+    @handler("close")
+    def close(self):
+        if not self._pending:
+            self._close()
+        else:
+            self._closeflag = True
+
+    def release(self):
+        """
+        Close the descriptors of this end in the current process only,
+        after forking the process that uses it, so that the other end
+        sees it closed once that process closes it (or exits).
+        :meth:`~circuits.core.manager.Manager.start` releases the child's
+        end in the parent, the child releases the parent's end itself.
+        """
+
+        if not self._connected:
+            return
+
+        self._connected = False
+        os.close(self._rfd)
+        os.close(self._wfd)
+
+    def _flush(self):
+        tx, pending = self._tx, self._pending
+        written = False
+        while pending:
+            data = pending[0]
+            n = tx.write(data)
+            if n == len(data):
+                pending.popleft()
+                written = True
+            elif n:
+                pending[0] = memoryview(data)[n:] if PY3 else data[n:]
+                written = True
+            elif not tx.waiting:
+                # Ask the reader for a wake up, then check again as it
+                # may have read everything in the meantime
+                tx.waiting = True
+            else:
+                # In case the wake up got lost
+                if self._retry is None:
+                    self._retry = self.root._scheduleTimer(
+                        time() + RETRY, self._on_retry
+                    )
+                break
+
+        if written:
+            self._notify()
+        if not pending and self._closeflag:
+            self._close()
+
+    def _on_retry(self):
+        self._retry = None
+        if self._connected:
+            self._flush()
+
+    def _notify(self):
+        # Wake up the other end once per batch of writes: when the
+        # poller next finds the pipe writable.
+        if not self._notifying and self._poller is not None:
+            self._notifying = True
+            self._poller.addWriter(self, self._wfd)
+
+    def _wake(self):
+        try:
+            os.write(self._wfd, b"\0")
+        except OSError as e:
+            # A full pipe wakes up the other end anyway
+            if e.errno not in (EAGAIN, EPIPE):
+                raise
+
+    @handler("_write", priority=1)
+    def _on_write(self, fd):
+        if not self._connected:
+            return
+        self._notifying = False
+        self._poller.removeWriter(self._wfd)
+        self._wake()
+
+    @handler("_read", priority=1)
+    def _on_read(self, fd):
+        if not self._connected:
+            return
+        try:
+            # End of file: the process of the other end has exited
+            # without closing it
+            eof = not os.read(self._rfd, BUFSIZE)
+        except OSError as e:
+            if e.errno != EAGAIN:
+                raise
+            eof = False
+
+        rx = self._rx
+
+        # The other end sets closed after its last write
+        closed = eof or rx.closed
+        data = rx.read()
+        if data:
+            self.fire(read(data))
+            if rx.waiting:
+                rx.waiting = False
+                self._wake()
+
+        # The wake up may have been for space in our ring
+        if self._pending:
+            self._flush()
+
+        if closed:
+            self._close()
+
+    def _close(self):
+        if not self._connected:
+            return
+
+        self._connected = False
+        self._closeflag = False
+        self._pending.clear()
+        if self._retry is not None:
+            self._cancelTimer(self._retry)
+            self._retry = None
+
+        self._tx.closed = True
+        self._wake()
+
+        if self._poller is not None:
+            self._poller.discard(self._rfd)
+            self._poller.discard(self._wfd)
+        self._notifying = False
+        os.close(self._rfd)
+        os.close(self._wfd)
+
+        self.fire(disconnected())
+
+
+def RingPipe(*channels, **kwargs):
+    """Create a new full duplex shared memory ring pipe
+
+    Returns a pair of :class:`RingClient` instances connected on either
+    side of the pipe, each direction using a ring of *size* bytes (a
+    power of 2, 4MB by default). The pipe is meant to connect a process
+    to a child process forked after creating it. After forking, the
+    parent must :meth:`~RingClient.release` the child's end (the child
+    does the same with the parent's end when its end is registered).
+    """
+
+    if not AVAILABLE:
+        raise NotImplementedError(
+            "The shared memory ring is not supported on this machine"
+        )
+
+    if not channels:
+        channels = ("a", "b")
+
+    size = kwargs.get("size", SIZE)
+    ab, ba = _Ring(size), _Ring(size)
+    ra, wa = _pipe()  # wakes up a
+    rb, wb = _pipe()  # wakes up b
+
+    a = RingClient(ab, ba, ra, wb, channel=channels[0])
+    b = RingClient(ba, ab, rb, wa, channel=channels[1])
+    a._peer, b._peer = b, a
+
+    return a, b
@@ -51,6 +51,11 @@ except ImportError:
 BUFSIZE = 4096  # 4KB Buffer
 BACKLOG = 5000  # 5K Concurrent Connections
 
+# Budget for reading from a socket per wakeup, so that a busy connection
+# doesn't starve the others
+DRAIN_BYTES = 64 * 1024
+DRAIN_READS = 16
+
 
 def do_handshake(sock, on_done=None, on_error=None, extra_args=None):
     """SSL Async Handshake
@@ -91,7 +96,9 @@ class Client(BaseComponent):
     socket_protocol = IPPROTO_IP
     socket_options = []
 
-    def __init__(self, bind=None, bufsize=BUFSIZE, channel=channel, **kwargs):
+    def __init__(self, bind=None, bufsize=BUFSIZE, channel=channel,
+                 direct=False, drain_bytes=DRAIN_BYTES,
+                 drain_reads=DRAIN_READS, **kwargs):
         super(Client, self).__init__(channel=channel, **kwargs)
 
         if isinstance(bind, SocketType):
@@ -102,12 +109,16 @@ class Client(BaseComponent):
             self._sock = self._create_socket()
 
         self._bufsize = bufsize
+        self._direct = direct
+        self._drain_bytes = drain_bytes
+        self._drain_reads = drain_reads
 
         self._ssock = None
         self._poller = None
         self._buffer = deque()
         self._closeflag = False
         self._connected = False
+        self._paused = False
 
         self.host = None
         self.port = 0
@@ -149,11 +160,42 @@ class Client(BaseComponent):
         if isinstance(value, binary_type):
             self.fire(write(value))
 
+    @handler("high_watermark", "low_watermark", channel="*")
+    def _on_watermark(self, event, *args):
+        if event.affects(self.channel, "read"):
+            if event.name == "high_watermark":
+                self.pause_reading()
+            else:
+                self.resume_reading()
+
+    def pause_reading(self):
+        """Stop reading from the socket until :meth:`resume_reading`"""
+
+        self._paused = True
+        if self._poller is not None and self._poller.isReading(self._sock):
+            self._poller.removeReader(self._sock)
+
+    def resume_reading(self):
+        """Resume reading from the socket after :meth:`pause_reading`"""
+
+        self._paused = False
+        if self._connected and self._poller is not None \
+                and not self._poller.isReading(self._sock):
+            self._poller.addReader(self, self._sock)
+
     @handler("prepare_unregister", channel="*")
     def _on_prepare_unregister(self, event, c):
         if event.in_subtree(self):
             self._close()
 
+    def _watch(self, sock):
+        # Start reading from the (connected) socket
+        if self._direct:
+            self._poller.setCallbacks(
+                sock, self.__on_read, self.__on_write, self.__on_disconnect
+            )
+        self._poller.addReader(self, sock)
+
     def _close(self):
         if not self._connected:
             return
@@ -183,6 +225,26 @@ class Client(BaseComponent):
             self._closeflag = True
 
     def _read(self):
+        # Read until the socket would block, or the budget is used up
+        # and the socket has to be reported again (see BasePoller.rearm)
+        sock, nbytes = self._sock, 0
+        for _ in range(self._drain_reads):
+            n = self._recv()
+            if n is None:
+                return
+            nbytes += n
+            if n < self._bufsize and not self.secure:
+                # Drained, new data is a new wakeup
+                return
+            if nbytes >= self._drain_bytes:
+                break
+
+        if self._connected and sock is self._sock:
+            self._poller.rearm(sock)
+
+    def _recv(self):
+        # Returns the number of bytes read or None if there's nothing
+        # (more) to read
         try:
             try:
                 if self.secure and self._ssock:
@@ -196,6 +258,7 @@ class Client(BaseComponent):
 
             if data:
                 self.fire(read(data)).notify = True
+                return len(data)
             else:
                 self.close()
         except SocketError as e:
@@ -213,7 +276,8 @@ class Client(BaseComponent):
                 nbytes = self._sock.send(data)
 
             if nbytes < len(data):
-                self._buffer.appendleft(data[nbytes:])
+                # A view of the rest, copying it is quadratic for large writes
+                self._buffer.appendleft(memoryview(data)[nbytes:])
         except SocketError as e:
             if e.args[0] in (EPIPE, ENOTCONN):
                 self._close()
@@ -237,8 +301,12 @@ class Client(BaseComponent):
     @handler("_write", priority=1)
     def __on_write(self, sock):
         if self._buffer:
+            n = len(self._buffer)
             data = self._buffer.popleft()
             self._write(data)
+            if 0 < len(self._buffer) < n:
+                # All of it was written, the socket is still writable
+                self._poller.rearm(self._sock)
 
         if not self._buffer:
             if self._closeflag:
@@ -312,7 +380,7 @@ class TCPClient(Client):
             raise StopIteration()
 
         def on_done(sock):
-            self._poller.addReader(self, sock)
+            self._watch(sock)
             self.fire(connected(host, port))
 
         if self.secure:
@@ -347,7 +415,7 @@ class UNIXClient(Client):
     @handler("ready")
     def ready(self, component):
         if self._poller is not None and self._connected:
-            self._poller.addReader(self, self._sock)
+            self._watch(self._sock)
 
     @handler("connect")  # noqa
     def connect(self, path, secure=False, **kwargs):
@@ -376,7 +444,7 @@ class UNIXClient(Client):
 
         self._connected = True
 
-        self._poller.addReader(self, self._sock)
+        self._watch(self._sock)
 
         if self.secure:
             def on_done(sock):
@@ -401,7 +469,9 @@ class Server(BaseComponent):
     socket_protocol = IPPROTO_IP
 
     def __init__(self, bind, secure=False, backlog=BACKLOG,
-                 bufsize=BUFSIZE, channel=channel, **kwargs):
+                 bufsize=BUFSIZE, channel=channel, direct=False,
+                 drain_bytes=DRAIN_BYTES, drain_reads=DRAIN_READS,
+                 accept=True, handoff=None, **kwargs):
         super(Server, self).__init__(channel=channel)
 
         self.socket_options = self.socket_options[:] + kwargs.get('socket_options', [])
@@ -409,6 +479,16 @@ class Server(BaseComponent):
 
         self._backlog = backlog
         self._bufsize = bufsize
+        self._direct = direct
+        self._drain_bytes = drain_bytes
+        self._drain_reads = drain_reads
+
+        # Connections are accepted (by this server) and then either
+        # handled by this server or handed off to be handled elsewhere,
+        # e.g. by the servers of circuits.net.reactors that are given the
+        # connections with adopt events instead of accepting them.
+        self._accepting = accept
+        self._handoff = handoff
 
         if isinstance(bind, socket):
             self._sock = bind
@@ -418,6 +498,7 @@ class Server(BaseComponent):
         self._closeq = []
         self._clients = []
         self._poller = None
+        self._paused = None
         self._buffers = defaultdict(deque)
 
         self.__starttls = set()
@@ -465,7 +546,7 @@ class Server(BaseComponent):
         if self._poller is None:
             if isinstance(component, BasePoller):
                 self._poller = component
-                self._poller.addReader(self, self._sock)
+                self._watch(self._sock)
                 self.fire(ready(self, (self.host, self.port)))
             else:
                 if component is not self:
@@ -473,11 +554,11 @@ class Server(BaseComponent):
                 component = findcmp(self.root, BasePoller)
                 if component is not None:
                     self._poller = component
-                    self._poller.addReader(self, self._sock)
+                    self._watch(self._sock)
                     self.fire(ready(self, (self.host, self.port)))
                 else:
                     self._poller = Poller().register(self)
-                    self._poller.addReader(self, self._sock)
+                    self._watch(self._sock)
                     self.fire(ready(self, (self.host, self.port)))
 
     @handler("stopped", channel="*")
@@ -490,6 +571,46 @@ class Server(BaseComponent):
             sock = value.event.args[0]
             self.fire(write(sock, value.value))
 
+    @handler("high_watermark", "low_watermark", channel="*")
+    def _on_watermark(self, event, *args):
+        if event.affects(self.channel, "read"):
+            if event.name == "high_watermark":
+                self.pause_reading()
+            else:
+                self.resume_reading()
+
+    def pause_reading(self):
+        """
+        Stop reading from client sockets (and accepting new connections)
+        until :meth:`resume_reading`.
+        """
+
+        if self._paused is not None or self._poller is None:
+            return
+
+        self._paused = set()
+        for sock in [self._sock] + self._clients:
+            if sock is not None and self._poller.isReading(sock):
+                self._poller.removeReader(sock)
+                self._paused.add(sock)
+
+    def resume_reading(self):
+        """Resume reading after :meth:`pause_reading`"""
+
+        if self._paused is None:
+            return
+
+        paused, self._paused = self._paused, None
+        for sock in paused:
+            if sock is self._sock or sock in self._clients:
+                self._poller.addReader(self, sock)
+
+    def _watch(self, sock):
+        # Start accepting connections. Accepting is a task (for the TLS
+        # handshake), it is always done by _read events.
+        if self._accepting:
+            self._poller.addReader(self, sock)
+
     def _close(self, sock):
         if sock is None:
             return
@@ -526,7 +647,8 @@ class Server(BaseComponent):
         is_closed = sock is None
 
         if sock is None:
-            socks = [self._sock]
+            # The listening socket isn't ours unless we accept from it
+            socks = [self._sock] if self._accepting else []
             socks.extend(self._clients[:])
         else:
             socks = [sock]
@@ -541,6 +663,26 @@ class Server(BaseComponent):
             self.fire(closed())
 
     def _read(self, sock):
+        # Read until the socket would block, or the budget is used up
+        # and the socket has to be reported again (see BasePoller.rearm)
+        nbytes = 0
+        for _ in range(self._drain_reads):
+            n = self._recv(sock)
+            if n is None:
+                return
+            nbytes += n
+            if n < self._bufsize and not self.secure:
+                # Drained, new data is a new wakeup
+                return
+            if nbytes >= self._drain_bytes:
+                break
+
+        if sock in self._clients:
+            self._poller.rearm(sock)
+
+    def _recv(self, sock):
+        # Returns the number of bytes read or None if there's nothing
+        # (more) to read
         if sock not in self._clients:
             return
 
@@ -548,6 +690,7 @@ class Server(BaseComponent):
             data = sock.recv(self._bufsize)
             if data:
                 self.fire(read(sock, data)).notify = True
+                return len(data)
             else:
                 self.close(sock)
         except SocketError as e:
@@ -564,7 +707,7 @@ class Server(BaseComponent):
         try:
             nbytes = sock.send(data)
             if nbytes < len(data):
-                self._buffers[sock].appendleft(data[nbytes:])
+                self._buffers[sock].appendleft(memoryview(data)[nbytes:])
         except SocketError as e:
             if e.args[0] not in (EINTR, EWOULDBLOCK, ENOBUFS):
                 self.fire(error(sock, e))
@@ -607,12 +750,32 @@ class Server(BaseComponent):
             else:
                 raise
 
+        # There may be more connections to accept
+        self._poller.rearm(self._sock)
+
+        if self._handoff is not None:
+            self._handoff(newsock)
+            return
+
         if self.secure and HAS_SSL:
             for _ in self._do_handshake(newsock):
                 yield
         else:
             self._on_accept_done(newsock)
 
+    @handler("adopt")
+    def adopt(self, sock):
+        """
+        Handle *sock*, a connection accepted elsewhere, as if it had
+        been accepted by this server.
+        """
+
+        if self.secure and HAS_SSL:
+            for _ in self._do_handshake(sock):
+                yield
+        else:
+            self._on_accept_done(sock)
+
     def _do_handshake(self, sock, fire_connect_event=True):
         sslsock = ssl_socket(
             sock,
@@ -630,7 +793,14 @@ class Server(BaseComponent):
 
     def _on_accept_done(self, sock, fire_connect_event=True):
         sock.setblocking(False)
-        self._poller.addReader(self, sock)
+        if self._direct:
+            self._poller.setCallbacks(
+                sock, self._read, self._on_write, self._on_disconnect
+            )
+        if self._paused is not None:
+            self._paused.add(sock)
+        else:
+            self._poller.addReader(self, sock)
         self._clients.append(sock)
         if fire_connect_event:
             try:
@@ -651,6 +821,7 @@ class Server(BaseComponent):
             raise RuntimeError('Cannot reuse socket for already started STARTTLS.')
         self.__starttls.add(sock)
         self._poller.removeReader(sock)
+        self._poller.removeCallbacks(sock)
         self._clients.remove(sock)
         for _ in self._do_handshake(sock, False):
             yield
@@ -669,8 +840,12 @@ class Server(BaseComponent):
     @handler("_write", priority=1)
     def _on_write(self, sock):
         if self._buffers[sock]:
+            n = len(self._buffers[sock])
             data = self._buffers[sock].popleft()
             self._write(sock, data)
+            if 0 < len(self._buffers[sock]) < n:
+                # All of it was written, the socket is still writable
+                self._poller.rearm(sock)
 
         if not self._buffers[sock]:
             if sock in self._closeq:
@@ -773,6 +948,14 @@ class UDPServer(Server):
         (SOL_SOCKET, SO_REUSEADDR, 1)
     ]
 
+    def _watch(self, sock):
+        # Start reading from the socket
+        if self._direct:
+            self._poller.setCallbacks(
+                sock, self._on_read, self._on_write, self._on_disconnect
+            )
+        self._poller.addReader(self, sock)
+
     def _close(self, sock):
         self._poller.discard(sock)
 
@@ -800,15 +983,26 @@ class UDPServer(Server):
             self._close(self._sock)
 
     def _read(self):
-        try:
-            data, address = self._sock.recvfrom(self._bufsize)
+        # A datagram per read, until the socket would block or the budget
+        # is used up and the socket has to be reported again
+        sock, nbytes = self._sock, 0
+        for _ in range(self._drain_reads):
+            try:
+                data, address = sock.recvfrom(self._bufsize)
+            except SocketError as e:
+                if e.args[0] in (EWOULDBLOCK, EAGAIN):
+                    return
+                self.fire(error(sock, e))
+                self._close(sock)
+                return
+
             if data:
                 self.fire(read(address, data)).notify = True
-        except SocketError as e:
-            if e.args[0] in (EWOULDBLOCK, EAGAIN):
-                return
-            self.fire(error(self._sock, e))
-            self._close(self._sock)
+            nbytes += len(data)
+            if nbytes >= self._drain_bytes:
+                break
+
+        self._poller.rearm(sock)
 
     def _write(self, address, data):
         try:
@@ -844,6 +1038,9 @@ class UDPServer(Server):
         if self._buffers[self._sock]:
             address, data = self._buffers[self._sock].popleft()
             self._write(address, data)
+            if self._buffers[self._sock]:
+                # A datagram is sent whole (or fails)
+                self._poller.rearm(self._sock)
 
         if not self._buffers[self._sock]:
             if self._sock in self._closeq:
@@ -2,5 +2,9 @@
 
 This package contains components that implement various networking protocols.
 """
-from .irc import IRC  # noqa
-from .line import Line  # noqa
+from .._lazy import lazy
+
+lazy(globals(), {"IRC": ".irc", "Line": ".line"})
+del lazy
+
+__all__ = ("IRC", "Line")
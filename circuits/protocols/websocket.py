@@ -18,9 +18,9 @@ class WebSocketCodec(BaseComponent):
     Implements the Data Framing protocol for WebSocket.
 
     This component is used in conjunction with a parent component that
-    receives Read events on its channel. When created (after a successful
-    WebSocket setup handshake), the codec registers
-    a handler on the parent's channel that filters out these Read
+    receives Read events on its channel. When registered or attached to
+    the parent (after a successful WebSocket setup handshake), the codec
+    adds a handler on the parent's channel that filters out these Read
     events for a given socket (if used in a server) or all Read events
     (if used in a client). The data is decoded and the contained payload
     is emitted as Read events on the codec's channel.
@@ -29,6 +29,13 @@ class WebSocketCodec(BaseComponent):
     (with socket argument if used in a server) is
     encoded according to the WebSocket Data Framing protocol. The
     encoded data is then forwarded as write events on the parents channel.
+
+    When the socket disconnects, the codec is removed from the tree with
+    :meth:`~.components.BaseComponent.unregister` if a handler listens
+    for :class:`~.components.prepare_unregister` on its channel, else
+    with the cheaper :meth:`~.components.BaseComponent.detach` (which
+    still fires :class:`~.events.unregistered` if a handler listens for
+    it on the codec's channel).
     """
 
     channel = "ws"
@@ -43,6 +50,7 @@ class WebSocketCodec(BaseComponent):
         super(WebSocketCodec, self).__init__(*args, **kwargs)
 
         self._sock = sock
+        self._parent_handlers = ()
 
         self._pending_payload = bytearray()
         self._pending_type = None
@@ -57,34 +65,50 @@ class WebSocketCodec(BaseComponent):
             else:
                 self.fire(read(message))
 
-    @handler("registered")
-    def _on_registered(self, component, parent):
-        if component is self:
-            @handler("read", priority=10, channel=parent.channel)
-            def _on_read_raw(self, event, *args):
-                if self._sock is not None:
-                    if args[0] != self._sock:
-                        return
-                    data = args[1]
-                else:
-                    data = args[0]
-                messages = self._parse_messages(bytearray(data))
-                for message in messages:
-                    if self._sock is not None:
-                        self.fire(read(self._sock, message))
-                    else:
-                        self.fire(read(message))
-                event.stop()
+    def register(self, parent):
+        self._listen(parent)
+        return super(WebSocketCodec, self).register(parent)
+
+    def attach(self, parent):
+        self._listen(parent)
+        return super(WebSocketCodec, self).attach(parent)
 
-            self.addHandler(_on_read_raw)
+    def _listen(self, parent):
+        # Set up when added to the tree rather than on registered, which
+        # attach() would have to fire just for this
+        for method in self._parent_handlers:
+            self.removeHandler(method)
 
-            @handler("disconnect", channel=parent.channel)
-            def _on_disconnect(self, *args):
+        @handler("read", priority=10, channel=parent.channel)
+        def _on_read_raw(self, event, *args):
+            if self._sock is not None:
+                if args[0] != self._sock:
+                    return
+                data = args[1]
+            else:
+                data = args[0]
+            messages = self._parse_messages(bytearray(data))
+            for message in messages:
                 if self._sock is not None:
-                    if args[0] != self._sock:
-                        return
+                    self.fire(read(self._sock, message))
+                else:
+                    self.fire(read(message))
+            event.stop()
+
+        @handler("disconnect", channel=parent.channel)
+        def _on_disconnect(self, *args):
+            if self._sock is not None:
+                if args[0] != self._sock:
+                    return
+            index = self.root._index
+            if index.subscribed("prepare_unregister", self.channel):
                 self.unregister()
-            self.addHandler(_on_disconnect)
+            else:
+                self.detach()
+
+        self._parent_handlers = (
+            self.addHandler(_on_read_raw), self.addHandler(_on_disconnect)
+        )
 
     def _parse_messages(self, data):
         msgs = []  # one chunk of bytes may result in several messages
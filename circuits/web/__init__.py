@@ -3,24 +3,38 @@
 circuits.web contains the circuits full stack web server that is HTTP
 and WSGI compliant.
 """
-from .controllers import BaseController, Controller, expose
-from .dispatchers import XMLRPC, Dispatcher, Static, VirtualHosts
-from .errors import forbidden, httperror, notfound, redirect
-from .events import request, response, stream
-from .loggers import Logger
-from .servers import BaseServer, Server
-from .sessions import Sessions
-from .url import URL, parse_url
+from .._lazy import lazy
 
-try:
-    from .dispatchers import JSONRPC
-except ImportError:
-    pass
-
-try:
-    from .controllers import JSONController
-except ImportError:
-    pass
+# Only what is used gets imported, e.g. a bare Server doesn't need the
+# RPC dispatchers, sessions or the WSGI support. There's no __all__ here,
+# lazy() lists the names that are available (without the optional ones
+# that can't be imported).
+lazy(globals(), {
+    "BaseController": ".controllers",
+    "Controller": ".controllers",
+    "JSONController": ".controllers",
+    "expose": ".controllers",
+    "Dispatcher": ".dispatchers",
+    "JSONRPC": ".dispatchers",
+    "Static": ".dispatchers",
+    "VirtualHosts": ".dispatchers",
+    "XMLRPC": ".dispatchers",
+    "forbidden": ".errors",
+    "httperror": ".errors",
+    "notfound": ".errors",
+    "redirect": ".errors",
+    "request": ".events",
+    "response": ".events",
+    "stream": ".events",
+    "Logger": ".loggers",
+    "MetricsController": ".metrics",
+    "BaseServer": ".servers",
+    "Server": ".servers",
+    "Sessions": ".sessions",
+    "URL": ".url",
+    "parse_url": ".url",
+}, optional=("JSONController", "JSONRPC", "MetricsController"))
+del lazy
 
 # flake8: noqa
 # pylama: skip=1
@@ -9,7 +9,6 @@ from functools import update_wrapper
 from circuits.core import BaseComponent, handler
 from circuits.tools import getargspec
 
-from . import tools
 from .errors import forbidden, httperror, notfound, redirect
 from .wrappers import Response
 
@@ -111,16 +110,19 @@ class BaseController(BaseComponent):
         return redirect(self.request, self.response, urls, code=code)
 
     def serve_file(self, path, type=None, disposition=None, name=None):
+        from . import tools
         return tools.serve_file(
             self.request, self.response, path, type, disposition, name
         )
 
     def serve_download(self, path, name=None):
+        from . import tools
         return tools.serve_download(
             self.request, self.response, path, name
         )
 
     def expires(self, secs=0, force=False):
+        from . import tools
         tools.expires(self.request, self.response, secs, force)
 
 
@@ -4,12 +4,22 @@ This package contains various circuits.web dispatchers
 By default a ``circuits.web.Server`` Component uses the
 ``dispatcher.Dispatcher``
 """
-from ..websockets.dispatcher import WebSocketsDispatcher
-from .dispatcher import Dispatcher
-from .jsonrpc import JSONRPC
-from .static import Static
-from .virtualhosts import VirtualHosts
-from .xmlrpc import XMLRPC
+from ..._lazy import lazy
+
+lazy(globals(), {
+    "WebSocketsDispatcher": "..websockets.dispatcher",
+    "Dispatcher": ".dispatcher",
+    "JSONRPC": ".jsonrpc",
+    "Static": ".static",
+    "VirtualHosts": ".virtualhosts",
+    "XMLRPC": ".xmlrpc",
+})
+del lazy
+
+__all__ = (
+    "WebSocketsDispatcher", "Dispatcher", "JSONRPC", "Static",
+    "VirtualHosts", "XMLRPC",
+)
 
 # flake8: noqa
 # pylama: skip=1
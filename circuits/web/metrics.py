@@ -0,0 +1,25 @@
+"""Metrics
+
+This module implements a controller that serves the metrics collected
+by a :class:`circuits.core.metrics.Metrics` component as JSON.
+"""
+from .controllers import JSONController
+
+
+class MetricsController(JSONController):
+
+    """
+    Serves :meth:`~circuits.core.metrics.Metrics.snapshot` of the
+    :class:`~circuits.core.metrics.Metrics` component instrumenting
+    this controller's tree on ``/metrics`` (or the channel given).
+    Responds with 404 if no such component is registered.
+    """
+
+    channel = "/metrics"
+
+    def index(self):
+        metrics = self.root._metrics
+        if metrics is None:
+            return self.notfound("No metrics are being collected")
+
+        return metrics.snapshot()
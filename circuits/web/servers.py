@@ -2,9 +2,9 @@
 
 This module implements the several Web Server components.
 """
+from socket import socket
 from sys import stderr
 
-from circuits import io
 from circuits.core import BaseComponent, Timer, handler
 from circuits.net.events import close, read, write
 from circuits.net.sockets import TCPServer, UNIXServer
@@ -44,19 +44,23 @@ class BaseServer(BaseComponent):
     Otherwise if a str is passed and it does not contain the ':'
     character, a file path is assumed and a UNIXServer is created and
     bound to the file given by the 'bind' argument.
+
+    If a socket is passed, it is used as the listening socket. With
+    'accept' set to False connections are not accepted from it but are
+    given to the server by another component (see circuits.net.reactors).
     """
 
     channel = "web"
 
     def __init__(self, bind, encoding="utf-8", secure=False, certfile=None,
-                 channel=channel, display_banner=True):
+                 channel=channel, display_banner=True, accept=True):
         "x.__init__(...) initializes x; see x.__class__.__doc__ for signature"
 
         super(BaseServer, self).__init__(channel=channel)
 
         self._display_banner = display_banner
 
-        if isinstance(bind, (int, list, tuple,)):
+        if isinstance(bind, (int, list, tuple, socket)):
             SocketType = TCPServer
         else:
             SocketType = TCPServer if ":" in bind else UNIXServer
@@ -65,7 +69,8 @@ class BaseServer(BaseComponent):
             bind,
             secure=secure,
             certfile=certfile,
-            channel=channel
+            channel=channel,
+            accept=accept
         ).register(self)
 
         self.http = HTTP(
@@ -151,6 +156,7 @@ class StdinServer(BaseComponent):
     def __init__(self, encoding="utf-8", channel=channel):
         super(StdinServer, self).__init__(channel=channel)
 
+        from circuits import io
         self.server = (io.stdin + io.stdout).register(self)
         self.http = HTTP(
             self, encoding=encoding, channel=channel
@@ -160,6 +166,7 @@ class StdinServer(BaseComponent):
 
     @property
     def host(self):
+        from circuits import io
         return io.stdin.filename
 
     @property
@@ -89,7 +89,7 @@ class WebSocketsDispatcher(BaseComponent):
                 response.headers["Sec-WebSocket-Protocol"] = self.select_subprotocol(subprotocols)
             codec = WebSocketCodec(request.sock, channel=self._wschannel)
             self._codecs[request.sock] = codec
-            codec.register(self)
+            codec.attach(self)
             return response
         finally:
             event.stop()
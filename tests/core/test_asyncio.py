@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+from socket import AF_INET, SOCK_STREAM, socket
+from threading import Timer as Thread
+
+import pytest
+
+from circuits import Component, Event
+from circuits.core.pollers import AsyncIO
+from circuits.net.events import write
+from circuits.net.sockets import TCPServer
+
+asyncio = pytest.importorskip("asyncio")
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+class fail(Event):
+
+    """fail Event"""
+
+
+class App(Component):
+
+    def hello(self, name):
+        return asyncio.sleep(0.01, result="Hello %s!" % name)
+
+    def fail(self):
+        raise ValueError("foo")
+
+
+class Echo(Component):
+
+    channel = "server"
+
+    def init(self):
+        self.bind = None
+
+    def ready(self, server, bind):
+        self.bind = bind
+
+    def read(self, sock, data):
+        self.fire(write(sock, data))
+
+
+@pytest.fixture
+def loop(request):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    def finalizer():
+        asyncio.set_event_loop(None)
+        loop.close()
+
+    request.addfinalizer(finalizer)
+
+    return loop
+
+
+def run(loop, app):
+    poller = AsyncIO(loop).register(app)
+    return poller.serve()
+
+
+def await_value(loop, value, timeout=5):
+    return loop.run_until_complete(
+        asyncio.wait_for(asyncio.ensure_future(value), timeout)
+    )
+
+
+def test_coroutine_handler(loop):
+    app = App()
+    done = run(loop, app)
+
+    assert await_value(loop, app.fire(hello("World"))) == "Hello World!"
+
+    app.stop()
+    loop.run_until_complete(asyncio.wait_for(done, 5))
+    assert not app.running
+
+
+def test_await_error(loop):
+    app = App()
+    done = run(loop, app)
+
+    with pytest.raises(ValueError):
+        await_value(loop, app.fire(fail()))
+
+    app.stop()
+    loop.run_until_complete(asyncio.wait_for(done, 5))
+
+
+def test_no_running_loop():
+    app = App()
+    x = app.fire(hello("World"))
+    for i in range(3):
+        app.tick()
+
+    assert x.errors
+    assert x.value[0] is RuntimeError
+    assert "AsyncIO" in str(x.value[1])
+
+
+def test_fire_from_thread(loop):
+    app = App()
+    run(loop, app)
+
+    values = []
+    t = Thread(0.1, lambda: values.append(app.fire(hello("Thread"))))
+    t.start()
+    t.join()
+
+    assert await_value(loop, values[0]) == "Hello Thread!"
+    app.stop()
+
+
+def test_sockets(loop):
+    app = App()
+    echo = Echo().register(app)
+    TCPServer(0, channel="server").register(app)
+    run(loop, app)
+
+    while echo.bind is None:
+        loop.run_until_complete(asyncio.sleep(0.01))
+
+    sock = socket(AF_INET, SOCK_STREAM)
+    sock.setblocking(False)
+    loop.run_until_complete(
+        asyncio.wait_for(loop.sock_connect(sock, echo.bind), 5)
+    )
+    loop.run_until_complete(loop.sock_sendall(sock, b"Hello"))
+    data = loop.run_until_complete(
+        asyncio.wait_for(loop.sock_recv(sock, 1024), 5)
+    )
+    sock.close()
+
+    assert data == b"Hello"
+    app.stop()
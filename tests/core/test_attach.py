@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+from circuits import Component, ComponentPool, Event, Manager, handler
+from circuits.net.events import disconnect
+from circuits.net.sockets import TCPServer
+from circuits.protocols.websocket import WebSocketCodec
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+class Connection(Component):
+
+    channel = "conn"
+
+    def init(self, name="conn"):
+        self.name_ = name
+
+    def hello(self):
+        return "Hello from {0:s}".format(self.name_)
+
+
+class Listener(Component):
+
+    def init(self):
+        self.events = []
+
+    @handler("registered", "unregistered", channel="conn")
+    def _on_registered(self, event, component, manager):
+        self.events.append((event.name, component))
+
+
+def flush(m):
+    while len(m):
+        m.flush()
+
+
+def test_attach_detach():
+    m = Manager()
+    c = Connection()
+
+    c.attach(m)
+    assert c in m
+    assert c.root is m
+    # Nobody listens for registered
+    assert len(m) == 0
+
+    x = m.fire(hello(), "conn")
+    flush(m)
+    assert x.value == "Hello from conn"
+
+    c.detach()
+    assert c not in m
+    assert c.root is c
+    assert len(m) == 0
+    assert not m.getHandlers(hello(), "conn")
+
+    # Can be attached again
+    c.attach(m)
+    x = m.fire(hello(), "conn")
+    flush(m)
+    assert x.value == "Hello from conn"
+
+
+def test_attach_subscribed():
+    m = Manager()
+    listener = Listener().register(m)
+    flush(m)
+    del listener.events[:]
+
+    c = Connection().attach(m)
+    flush(m)
+    c.detach()
+    flush(m)
+
+    assert listener.events == [("registered", c), ("unregistered", c)]
+
+
+def test_attach_server():
+    m = Manager()
+    server = TCPServer(("127.0.0.1", 0)).register(m)
+    flush(m)
+
+    try:
+        # The server's handlers on all channels don't subscribe
+        c = Connection().attach(server)
+        assert c.root is m
+        assert len(m) == 0
+
+        c.detach()
+        assert c not in server
+        assert len(m) == 0
+    finally:
+        server.close()
+        flush(m)
+
+
+class Codec(WebSocketCodec):
+
+    def init(self, *args, **kwargs):
+        self.events = []
+
+    @handler("prepare_unregister")
+    def _on_prepare_unregister(self, event, component):
+        self.events.append(event.name)
+
+
+def test_codec_disconnect():
+    m = Manager()
+    parent = Component(channel="parent").register(m)
+    flush(m)
+
+    codec = WebSocketCodec("sock").attach(parent)
+    m.fire(disconnect("sock"), "parent")
+    flush(m)
+    assert codec not in parent
+
+    # Listens for prepare_unregister, is unregistered
+    codec = Codec("sock").attach(parent)
+    m.fire(disconnect("sock"), "parent")
+    flush(m)
+    assert codec not in parent
+    assert codec.events == ["prepare_unregister"]
+
+
+def test_pool():
+    m = Manager()
+    pool = ComponentPool(Connection, size=1)
+
+    a = pool.acquire(m, "a")
+    b = pool.acquire(m, "b")
+    assert pool.created == 2
+    assert a in m and b in m
+
+    pool.release(a)
+    pool.release(b)
+    assert len(pool) == 1
+    assert a not in m and b not in m
+
+    c = pool.acquire(m, "c")
+    assert c is a
+    assert pool.reused == 1
+    assert len(pool) == 0
+
+    x = m.fire(hello(), "conn")
+    flush(m)
+    assert x.value == "Hello from c"
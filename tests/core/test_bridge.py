@@ -4,6 +4,8 @@ from os import getpid
 import pytest
 
 from circuits import Component, Event, ipc
+from circuits.core.bridge import PickleBuffer, _Decoder, _encode
+from circuits.net import ring
 
 pytestmark = pytest.mark.skipif(pytest.PLATFORM == 'win32', reason='Unsupported Platform')
 
@@ -14,11 +16,18 @@ class hello(Event):
     """hello Event"""
 
 
+class echo(Event):
+    """echo Event"""
+
+
 class App(Component):
 
     def hello(self):
         return "Hello from {0:d}".format(getpid())
 
+    def echo(self, data):
+        return data
+
 
 def test(manager, watcher):
     app = App()
@@ -36,3 +45,78 @@ def test(manager, watcher):
 
     bridge.unregister()
     watcher.wait("unregistered")
+
+
+def test_large(manager, watcher):
+    app = App()
+    process, bridge = app.start(process=True, link=manager)
+    assert watcher.wait("ready")
+
+    # Used to be the frame separator
+    data = b"~~~" + b"x" * (1024 * 1024) + b"~~~"
+    x = manager.fire(ipc(echo(data)))
+
+    assert pytest.wait_for(x, "result")
+
+    assert x.value == data
+
+    app.stop()
+    app.join()
+
+    bridge.unregister()
+    watcher.wait("unregistered")
+
+
+@pytest.mark.skipif(not ring.AVAILABLE, reason="No shared memory ring")
+def test_ring(manager, watcher):
+    app = App()
+    process, bridge = app.start(
+        process=True, link=manager, transport=ring.RingPipe
+    )
+    assert watcher.wait("ready")
+
+    x = manager.fire(ipc(hello()))
+    assert pytest.wait_for(x, "result")
+    assert x.value == "Hello from {0:d}".format(app.pid)
+
+    # Larger than the ring
+    data = b"x" * (ring.SIZE + 1)
+    x = manager.fire(ipc(echo(data)))
+    assert pytest.wait_for(x, "result")
+    assert x.value == data
+
+    app.stop()
+    app.join()
+
+    bridge.unregister()
+    watcher.wait("unregistered")
+
+
+def test_framing():
+    objs = [(1, b"~~~"), (2, "x" * 100000), (3, None)]
+    stream = b"".join(
+        bytes(chunk) for obj in objs for chunk in _encode(obj)
+    )
+
+    for size in (1, 7, 4096, len(stream)):
+        decoder = _Decoder()
+        received = []
+        for i in range(0, len(stream), size):
+            received.extend(decoder.feed(stream[i:i + size]))
+        assert received == objs
+        assert not decoder._buffer
+
+
+@pytest.mark.skipif(PickleBuffer is None, reason="No pickle protocol 5")
+def test_out_of_band():
+    data = bytearray(b"x" * (1024 * 1024))
+    chunks = _encode((1, PickleBuffer(data)))
+    assert len(chunks) == 3  # header + pickle, size, buffer
+    assert chunks[-1].obj is data
+
+    decoder = _Decoder()
+    received = []
+    for chunk in chunks:
+        received.extend(decoder.feed(chunk))
+    eid, buffer = received[0]
+    assert bytes(buffer) == bytes(data)
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
+from time import time
+
 import pytest
 
-from circuits.core import Component, Event, TimeoutError, handler
+from circuits.core import Component, Event, TimeoutError, handler, sleep
 
 
 class wait(Event):
@@ -96,3 +98,82 @@ def test_call_failure(manager, watcher, app):
     value = x.value
 
     assert isinstance(value, TimeoutError)
+
+
+class slow(Event):
+
+    """slow Event"""
+    success = True
+
+
+class Slow(Component):
+
+    @handler('slow')
+    def _on_slow(self):
+        yield sleep(0.5)
+        yield 'slow'
+
+    @handler('call')
+    def _on_call(self, timeout=-1):
+        try:
+            result = yield self.call(slow(), timeout=timeout)
+        except TimeoutError as e:
+            yield e
+        else:
+            yield result
+
+
+def test_call_deadline():
+    app = Slow()
+    while len(app):
+        app.flush()
+
+    start = time()
+    x = app.fire(call(0.1))
+    while not x.result:
+        app.tick()
+
+    assert isinstance(x.value, TimeoutError)
+    assert 0.1 <= time() - start < 0.5
+    assert not app._waiters and not app._waiting
+
+
+def test_call_leaves_handler_cache():
+    app = Slow()
+    while len(app):
+        app.flush()
+
+    x = app.fire(call(10))
+    while not x.result:
+        app.tick()
+    assert x.value == 'slow'
+    while len(app):
+        app.flush()
+
+    cache = dict(app._cache)
+    x = app.fire(call(10))
+    while not x.result:
+        app.tick()
+
+    assert x.value == 'slow'
+    assert all(app._cache.get(key) is handlers for key, handlers in cache.items())
+    assert not app._waiters and not app._waiting
+    assert not app._timers
+
+
+def test_call_waits_for_event():
+    app = Slow()
+    while len(app):
+        app.flush()
+
+    # The call waits for its own event, not for any one by name
+    e = slow()
+    g = app.callEvent(e)
+    next(g)
+    assert not app._waiters
+    assert list(app._waiting) == [e]
+
+    start = time()
+    while app._waiting and time() - start < 5:
+        app.tick()
+    assert not app._waiting
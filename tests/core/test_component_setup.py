@@ -91,3 +91,41 @@ def test_subclassing_with_custom_channel():
     c = C()
 
     assert c.channel == "c"
+
+
+class Child(Component):
+
+    channel = "child"
+
+
+class Parent(Component):
+
+    child = Child()
+
+    def __init__(self, *args, **kwargs):
+        self.other = Child(channel="other")
+        super(Parent, self).__init__(*args, **kwargs)
+
+    @property
+    def evaluated(self):
+        raise AssertionError("properties must not be evaluated")
+
+
+def test_child_components():
+    parent = Parent()
+
+    assert Parent.child in parent
+    assert parent.other in parent
+    assert parent.other.parent is parent
+
+
+def test_members_cached_per_class():
+    App()
+    assert "_component_members" in App.__dict__
+    assert App._component_members is not \
+        Component.__dict__.get("_component_members")
+
+    a, b = App(), App()
+    assert a.test in a._handlers["test"]
+    assert b.test in b._handlers["test"]
+    assert a.test != b.test
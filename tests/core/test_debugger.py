@@ -1,10 +1,12 @@
 """Debugger Tests"""
 
+import os
+import signal
 import sys
 
 import pytest
 
-from circuits import Debugger
+from circuits import Debugger, Recorder
 from circuits.core import Component, Event
 
 try:
@@ -297,3 +299,70 @@ def test_Logger_error():
         app.flush()
 
     assert logger.error_msg.startswith("ERROR <handler[*][test] (App.test)> (")
+
+
+def test_recorder():
+    app = App()
+    stderr = StringIO()
+    recorder = Recorder(size=3, file=stderr)
+    recorder.register(app)
+    while len(app):
+        app.flush()
+
+    assert app._recorder is recorder
+    assert not stderr.getvalue()
+
+    for i in range(5):
+        app.fire(test())
+    app.flush()
+
+    entries = recorder.entries()
+    assert len(entries) == 3
+    timestamp, name, channels, handler, duration, error = entries[-1]
+    assert name == "test"
+    assert channels == ("*",)
+    assert handler == app.test
+    assert duration >= 0
+    assert error is None
+
+    recorder.dump()
+    lines = stderr.getvalue().splitlines()
+    assert len(lines) == 3
+    assert "App.test" in lines[-1]
+
+
+def test_recorder_errors():
+    app = App()
+    logger = Logger()
+    recorder = Recorder(errors=True, logger=logger)
+    recorder.register(app)
+    while len(app):
+        app.flush()
+
+    app.fire(test(raiseException=True))
+    app.flush()
+
+    assert recorder.entries()[-1][-1] is Exception
+    assert "ERROR Exception" in logger.debug_msg
+
+    recorder.unregister()
+    while len(app):
+        app.flush()
+    assert app._recorder is None
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="No SIGUSR1")
+def test_recorder_signal():
+    app = App()
+    stderr = StringIO()
+    old = signal.getsignal(signal.SIGUSR1)
+    try:
+        Recorder(signo=signal.SIGUSR1, file=stderr).register(app)
+        app.fire(test())
+        while len(app):
+            app.flush()
+
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert "App.test" in stderr.getvalue()
+    finally:
+        signal.signal(signal.SIGUSR1, old)
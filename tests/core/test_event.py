@@ -1,8 +1,11 @@
 """Event Tests"""
 
+from pickle import dumps, loads
+
 import py
 
-from circuits import Component, Event
+from circuits import Component, Event, Manager
+from circuits.core.events import EventClasses, event_classes
 
 
 class test(Event):
@@ -91,3 +94,96 @@ def test_subclass_looses_properties():
         success = True
     e = hello().child('success')
     assert e.success is False
+
+
+def test_create_reuses_class():
+    hits = event_classes.hits
+
+    a = Event.create("foo", 1)
+    b = Event.create("foo", 2)
+
+    assert type(a) is type(b)
+    assert a.name == b.name == "foo"
+    assert a.args == [1] and b.args == [2]
+    assert event_classes.hits == hits + 1
+
+    assert type(test.create("foo")) is not type(a)
+    assert isinstance(test.create("foo"), test)
+
+
+def test_child_reuses_class():
+    e = test()
+    # The very same class (not just a subclass), isinstance() won't do
+    assert type(e.child("success")) is type(  # noqa: E721
+        test().child("success")
+    )
+
+
+def test_event_classes_bounded():
+    classes = EventClasses(maxsize=2)
+
+    foo = classes.get(Event, "foo")
+    classes.get(Event, "bar")
+    assert classes.get(Event, "foo") is foo
+
+    classes.get(Event, "baz")
+    assert len(classes) == 2
+    assert classes.get(Event, "foo") is foo
+    assert (classes.hits, classes.misses) == (2, 3)
+
+    classes.get(Event, "bar")
+    assert classes.misses == 4
+
+
+def test_value_created_lazily():
+    app = App()
+    while len(app):
+        app.flush()
+
+    e = test()
+    assert e.value is None
+
+    app._fireEvent(e, ("*",))
+    assert e._value is None
+
+    value = e.value
+    assert value is e.value
+    assert value.event is e and value.manager is app
+
+
+def test_value_not_created_for_unused_results():
+    m = Manager()
+
+    e = test()
+    m._fireEvent(e, ("*",))
+    while len(m):
+        m.flush()
+
+    assert e._value is None
+
+
+def test_extra_attributes():
+    e = test()
+    e.cause = e
+    e.success_channels = ("foo",)
+    assert e.cause is e
+    assert e.success_channels == ("foo",)
+
+
+def test_pickle():
+    app = App()
+    while len(app):
+        app.flush()
+
+    e = test(1, 2, a="b")
+    e.success = True
+    app.fire(e, "bar")
+    e.value.value = "Hello"
+
+    x = loads(dumps(e))
+    assert x.name == "test"
+    assert x.args == [1, 2] and x.kwargs == {"a": "b"}
+    assert x.channels == ("bar",)
+    assert x.success is True
+    assert x.handler is None
+    assert x.value.value == "Hello"
@@ -46,3 +46,46 @@ def test2():
     app.run()
 
     assert app.results == [2, 1]
+
+
+def test3():
+    app = App()
+
+    # Default priority events keep their order between prioritized ones
+    app.fire(foo(1), priority=1)
+    app.fire(foo(2))
+    app.fire(foo(3), priority=-1)
+    app.fire(foo(4))
+    app.fire(foo(5), priority=1)
+    app.fire(done(), priority=2)
+
+    app.run()
+
+    assert app.results == [3, 2, 4, 1, 5]
+
+
+class Channel(Component):
+
+    def init(self, results, channel):
+        self.results = results
+
+    def foo(self, value):
+        self.results.append(self.channel)
+
+
+def test_same_event_on_two_channels():
+    results = []
+    app = App()
+    Channel(results, channel="a").register(app)
+    Channel(results, channel="b").register(app)
+    while len(app):
+        app.flush()
+
+    # Fired twice before it is dispatched
+    e = foo(1)
+    app.fire(e, "a")
+    app.fire(e, "b")
+    while len(app):
+        app.flush()
+
+    assert results == ["a", "b"]
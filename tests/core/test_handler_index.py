@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+from circuits import Component, Event, Manager, handler
+
+
+class foo(Event):
+
+    """foo Event"""
+
+
+class bar(Event):
+
+    """bar Event"""
+
+
+class A(Component):
+
+    channel = "a"
+
+    def foo(self):
+        return "a"
+
+    def bar(self):
+        return "bar"
+
+
+class B(Component):
+
+    channel = "b"
+
+    def foo(self):
+        return "b"
+
+
+class Any(Component):
+
+    @handler("foo", channel="*")
+    def _on_foo(self):
+        return "any"
+
+
+def flush(m):
+    while len(m):
+        m.flush()
+
+
+def test_channels():
+    m = Manager()
+    a = A().register(m)
+    B().register(m)
+    flush(m)
+
+    x = m.fire(foo(), "a")
+    flush(m)
+    assert x.value == "a"
+
+    x = m.fire(foo(), "*")
+    flush(m)
+    assert sorted(x.value) == ["a", "b"]
+
+    # Targeting a component selects all of its handlers
+    x = m.fire(foo(), a)
+    flush(m)
+    assert x.value == "a"
+
+
+def test_unrelated_cache_entries_survive():
+    m = Manager()
+    A().register(m)
+    flush(m)
+
+    m.fire(bar(), "a")
+    flush(m)
+    assert ("bar", ("a",)) in m._cache
+
+    b = B().register(m)
+    flush(m)
+    assert ("bar", ("a",)) in m._cache
+
+    b.unregister()
+    flush(m)
+    assert ("bar", ("a",)) in m._cache
+
+
+def test_affected_cache_entries_invalidated():
+    m = Manager()
+    A().register(m)
+    flush(m)
+
+    x = m.fire(foo(), "a")
+    flush(m)
+    assert x.value == "a"
+
+    any = Any().register(m)
+    flush(m)
+
+    x = m.fire(foo(), "a")
+    flush(m)
+    assert sorted(x.value) == ["a", "any"]
+
+    any.unregister()
+    flush(m)
+
+    x = m.fire(foo(), "a")
+    flush(m)
+    assert x.value == "a"
+
+
+def test_subtree_moves_with_component():
+    m = Manager()
+    a = A()
+    b = B().register(a)
+    a.register(m)
+    flush(m)
+
+    assert b.foo in m.getHandlers(foo(), "b")
+
+    a.unregister()
+    flush(m)
+
+    assert not m.getHandlers(foo(), "b")
+    assert b.foo in a.getHandlers(foo(), "b")
+
+
+def test_cache_bound():
+    m = Manager()
+    A().register(m)
+    flush(m)
+
+    cache = m.handler_cache
+    cache.clear()
+    cache.size = 4
+
+    for channel in ("c1", "c2", "c3", "c4", "c5"):
+        m.fire(foo(), channel)
+        flush(m)
+    assert len(cache) <= 4
+    assert cache.evictions > 0
+    assert ("foo", ("c5",)) in cache
+    assert ("foo", ("c1",)) not in cache
+
+    # A hit keeps an entry from being evicted
+    misses = cache.misses
+    for channel in ("c5", "c6", "c5", "c7", "c5"):
+        m.fire(foo(), channel)
+        flush(m)
+    assert ("foo", ("c5",)) in cache
+    assert cache.misses == misses + 2
+
+    stats = cache.stats()
+    assert stats["size"] == 4
+    assert stats["entries"] == len(cache)
+    assert stats["hits"] == cache.hits > 0
+
+    # Invalidation covers the entries of both generations
+    Any().register(m)
+    flush(m)
+    for channel in ("c5", "c6", "c7"):
+        assert ("foo", (channel,)) not in cache
+
+
+def test_cache_handlers():
+    m = Manager()
+    a = A().register(m)
+    flush(m)
+
+    m.handler_cache.clear()
+    assert m.cacheHandlers(foo(), "a") == [a.foo]
+    assert ("foo", ("a",)) in m.handler_cache
+
+    misses = m.handler_cache.misses
+    x = m.fire(foo(), "a")
+    flush(m)
+    assert x.value == "a"
+    assert m.handler_cache.misses == misses
+
+
+class C(Component):
+
+    def init(self, channel):
+        self.channel = channel
+
+    def foo(self):
+        return "c"
+
+
+def test_channel_set_in_init():
+    # Not registered to a manager, which would index the handlers anew
+    c = C("c")
+
+    x = c.fire(foo(), "c")
+    flush(c)
+    assert x.value == "c"
+
+    x = c.fire(foo(), "*")
+    flush(c)
+    assert x.value == "c"
+
+    x = c.fire(foo(), "d")
+    flush(c)
+    assert x.value is None
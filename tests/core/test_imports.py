@@ -1,4 +1,11 @@
 #!/usr/bin/env python
+import os
+import sys
+from subprocess import check_output
+
+import pytest
+
+import circuits
 from circuits.core.components import BaseComponent
 
 
@@ -8,3 +15,90 @@ def test():
         assert issubclass(BasePoller, BaseComponent)
     except ImportError:
         assert False
+
+
+def run(code):
+    # A fresh interpreter, importing circuits from this tree
+    root = os.path.dirname(os.path.dirname(circuits.__file__))
+    env = dict(os.environ, PYTHONPATH=root)
+    output = check_output([sys.executable, "-c", code], env=env)
+    return output.decode().split()
+
+
+def imported(statement):
+    return run(
+        "import sys\n{0:s}\nprint(' '.join(sys.modules))".format(statement)
+    )
+
+
+lazy = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="No module __getattr__ (PEP 562)"
+)
+
+
+@lazy
+def test_lazy_circuits():
+    modules = imported("import circuits")
+    assert "circuits.core" not in modules
+    assert "circuits.core.manager" not in modules
+
+    modules = imported("from circuits import Component")
+    assert "circuits.core.components" in modules
+    assert "circuits.core.bridge" not in modules
+    assert "circuits.core.workers" not in modules
+
+
+@lazy
+def test_lazy_web():
+    modules = imported("from circuits.web import Server")
+    assert "circuits.web.servers" in modules
+    for module in (
+        "circuits.web.wsgi", "circuits.web._httpauth", "circuits.web.tools",
+        "circuits.web.sessions", "circuits.web.dispatchers.xmlrpc",
+        "circuits.web.dispatchers.jsonrpc", "circuits.web.websockets",
+        "circuits.io", "asyncio", "multiprocessing",
+    ):
+        assert module not in modules
+
+    modules = imported("import circuits.protocols")
+    assert "circuits.protocols.irc" not in modules
+
+
+@lazy
+def test_lazy_everything():
+    everything = (
+        "import circuits.core, circuits.web, circuits.protocols\n"
+        "for p in (circuits.core, circuits.web, circuits.protocols):\n"
+        "    [getattr(p, name) for name in dir(p)]"
+    )
+    modules = set(imported("import circuits.web"))
+    assert modules < set(imported(everything))
+    assert not [
+        module for module in modules
+        if module.startswith("circuits.web.")
+    ]
+
+
+def test_import_all():
+    names = run(
+        "from circuits.web import *\nfrom circuits.protocols import *\n"
+        "print(' '.join(sorted(globals())))"
+    )
+    for name in ("Controller", "JSONRPC", "Line", "IRC", "Server", "expose"):
+        assert name in names
+
+    names = run(
+        "from circuits.web.dispatchers import *\n"
+        "print(' '.join(sorted(globals())))"
+    )
+    assert "WebSocketsDispatcher" in names
+
+
+def test_subpackages():
+    assert run(
+        "import circuits\nimport circuits.protocols\n"
+        "print(circuits.core.__name__, circuits.protocols.line.__name__)"
+    ) == ["circuits.core", "circuits.protocols.line"]
+
+    with pytest.raises(AttributeError):
+        circuits.nothing
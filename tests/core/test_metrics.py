@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+from json import dumps
+
+from circuits import Component, Event, Manager, Metrics, sleep
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+class fail(Event):
+
+    """fail Event"""
+
+
+class nap(Event):
+
+    """nap Event"""
+
+
+class App(Component):
+
+    def hello(self):
+        return "Hello World!"
+
+    def fail(self):
+        raise ValueError("foo")
+
+    def nap(self):
+        yield sleep(0)
+        raise ValueError("bar")
+
+
+def flush(m):
+    while len(m):
+        m.flush()
+
+
+def test_metrics():
+    m = Manager()
+    metrics = Metrics().register(m)
+    App().register(m)
+    flush(m)
+
+    assert m._metrics is metrics
+
+    # Every flush (sample=1) times the next event fired
+    for i in range(3):
+        m.fire(hello())
+        flush(m)
+    m.fire(fail())
+    flush(m)
+
+    snapshot = metrics.snapshot()
+    dumps(snapshot)
+
+    assert snapshot["events"]["hello"]["count"] == 3
+    assert snapshot["events"]["hello"]["lag"]["count"] == 3
+    assert snapshot["events"]["exception"]["count"] == 1
+    assert snapshot["cache"]["hits"] >= 2
+
+    handlers = snapshot["handlers"]
+    hello_handler = [v for k, v in handlers.items() if "App.hello" in k][0]
+    fail_handler = [v for k, v in handlers.items() if "App.fail" in k][0]
+    assert hello_handler["calls"] == 3
+    assert hello_handler["errors"] == 0
+    assert sum(n for _, n in hello_handler["duration"]["buckets"]) == 3
+    assert fail_handler["calls"] == 1
+    assert fail_handler["errors"] == 1
+
+
+def test_sample():
+    m = Manager()
+    metrics = Metrics(sample=2).register(m)
+    App().register(m)
+    flush(m)
+    metrics.reset()
+
+    # Only the events fired after every other flush are timed
+    for i in range(8):
+        m.fire(hello())
+        m.flush()
+    for i in range(3):
+        m.fire(fail())
+    m.flush()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["events"]["hello"]["count"] == 8
+    assert snapshot["events"]["hello"]["lag"]["count"] == 4
+
+    handlers = snapshot["handlers"]
+    hello_handler = [v for k, v in handlers.items() if "App.hello" in k][0]
+    fail_handler = [v for k, v in handlers.items() if "App.fail" in k][0]
+    assert hello_handler["calls"] == 4
+    assert fail_handler["calls"] == 0
+    assert fail_handler["errors"] == 3
+
+
+def test_tasks():
+    m = Manager()
+    metrics = Metrics().register(m)
+    App().register(m)
+    flush(m)
+
+    m.fire(nap())
+    for i in range(5):
+        m.tick()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["ticks"] == 5
+    assert snapshot["queue"]["count"] == 5
+    assert snapshot["tasks"]["steps"] == 2
+    assert snapshot["tasks"]["errors"] == 1
+    assert snapshot["tasks"]["running"] == 0
+
+    metrics.reset()
+    assert metrics.snapshot()["events"] == {}
+
+
+def test_unregister():
+    m = Manager()
+    metrics = Metrics().register(m)
+    flush(m)
+    assert m._metrics is metrics
+
+    metrics.unregister()
+    flush(m)
+
+    assert m._metrics is None
+    assert metrics._metrics is metrics
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+from threading import Thread
+from time import sleep as wait
+
+import pytest
+
+from circuits import Component, Event, sleep
+
+try:
+    from concurrent.futures import Future
+except ImportError:
+    pytestmark = pytest.mark.skip("concurrent.futures not available")
+
+
+class nap(Event):
+
+    """nap Event"""
+
+    success = True
+
+
+class get(Event):
+
+    """get Event"""
+
+    success = True
+
+
+class App(Component):
+
+    def init(self):
+        self.results = []
+
+    def nap(self, seconds):
+        yield sleep(seconds)
+        yield "Woke up"
+
+    def get(self, future):
+        try:
+            result = yield future
+        except ValueError as e:
+            result = "Error: %s" % e
+        self.results.append(result)
+        yield result
+
+
+def flush(app):
+    while len(app):
+        app.flush()
+
+
+def tick(app, n=10):
+    for _ in range(n):
+        app.tick()
+
+
+def test_sleeping_tasks_are_parked():
+    app = App()
+    flush(app)
+
+    for _ in range(100):
+        app.fire(nap(60))
+    tick(app)
+
+    assert len(app._timers) == 100
+    assert not app._tasks
+
+
+def test_sleep():
+    app = App()
+    flush(app)
+
+    x = app.fire(nap(0.1))
+    tick(app)
+    assert not app._tasks
+
+    wait(0.2)
+    tick(app)
+
+    assert x.value == "Woke up"
+    assert not app._timers
+
+
+def test_future():
+    app = App()
+    flush(app)
+
+    future = Future()
+    x = app.fire(get(future))
+    tick(app)
+    assert not app._tasks
+
+    t = Thread(target=future.set_result, args=("Hello World!",))
+    t.start()
+    t.join()
+
+    tick(app)
+
+    assert app.results == ["Hello World!"]
+    assert x.value == "Hello World!"
+    assert x.event.waitingHandlers == 0
+
+
+def test_future_exception():
+    app = App()
+    flush(app)
+
+    future = Future()
+    future.set_exception(ValueError("foo"))
+
+    x = app.fire(get(future))
+    tick(app)
+
+    assert app.results == ["Error: foo"]
+    assert x.value == "Error: foo"
+    assert x.event.waitingHandlers == 0
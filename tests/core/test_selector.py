@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+from socket import socketpair
+from tempfile import TemporaryFile
+
+import pytest
+
+from circuits import Component, Manager, handler
+from circuits.core.pollers import Poller, Selector, selectors
+
+pytestmark = pytest.mark.skipif(selectors is None, reason="No selectors")
+
+
+class Source(Component):
+
+    channel = "source"
+
+    def init(self):
+        self.events = []
+
+    @handler("_read", "_write")
+    def _on_ready(self, event, fd):
+        self.events.append((event.name, fd))
+
+
+def flush(m):
+    while len(m):
+        m.flush()
+
+
+def setup():
+    m = Manager()
+    m._running = True  # Have tick() poll
+    poller = Selector().register(m)
+    source = Source().register(m)
+    flush(m)
+    return m, poller, source
+
+
+def test_default():
+    assert Poller is Selector
+
+
+def test_registration():
+    m, poller, source = setup()
+
+    a, b = socketpair()
+    try:
+        poller.addReader(source, a)
+        assert poller.isReading(a)
+        assert not poller.isWriting(a)
+        assert poller.getTarget(a) == "source"
+
+        poller.addWriter(source, a)
+        assert poller.isReading(a) and poller.isWriting(a)
+
+        m.tick(0)
+        flush(m)
+        assert source.events == [("_write", a)]
+        del source.events[:]
+
+        b.send(b"x")
+        poller.removeWriter(a)
+        m.tick(0)
+        flush(m)
+        assert source.events == [("_read", a)]
+
+        poller.discard(a)
+        assert not poller.isReading(a)
+        assert not poller._keys
+    finally:
+        a.close()
+        b.close()
+
+    # Closed descriptors are ignored
+    poller.addReader(source, a)
+    poller.discard(a)
+
+
+def test_regular_file():
+    m, poller, source = setup()
+
+    with TemporaryFile() as f:
+        # Can't be polled (by epoll) but is always ready, like select()
+        # has it
+        poller.addReader(source, f)
+        assert poller.isReading(f)
+
+        m.tick(0)
+        flush(m)
+        assert source.events == [("_read", f)]
+
+        poller.removeReader(f)
+        assert not poller.isReading(f)
+
+
+def test_callbacks():
+    m, poller, source = setup()
+    errors = []
+
+    @handler("exception", channel="*")
+    def on_exception(self, etype, evalue, *args, **kwargs):
+        errors.append(evalue)
+
+    m.addHandler(on_exception)
+
+    ready = []
+
+    def on_write(fd):
+        ready.append(fd)
+        raise ValueError("foo")
+
+    a, b = socketpair()
+    try:
+        poller.setCallbacks(a, write=on_write)
+        poller.addWriter(source, a)
+
+        # Called right away instead of firing _write
+        m.tick(0)
+        assert ready == [a]
+        flush(m)
+        assert not source.events
+        assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+        # Events without a callback are still fired
+        b.send(b"x")
+        poller.removeWriter(a)
+        poller.addReader(source, a)
+        m.tick(0)
+        flush(m)
+        assert source.events == [("_read", a)]
+
+        poller.discard(a)
+        assert a not in poller._callbacks
+    finally:
+        a.close()
+        b.close()
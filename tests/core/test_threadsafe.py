@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+from threading import Event as Flag, Thread
+from time import time
+
+from circuits import Component, Event
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+class App(Component):
+
+    def init(self):
+        self.flag = Flag()
+        self.values = []
+
+    def hello(self, value):
+        self.values.append(value)
+        self.flag.set()
+        return value
+
+
+def run_in_thread(f):
+    result = []
+
+    def target():
+        try:
+            result.append(f())
+        except Exception as e:
+            result.append(e)
+
+    thread = Thread(target=target)
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_single_threaded():
+    app = App()
+    assert app.threadsafe
+    app.threadsafe = False
+    assert not app.threadsafe
+
+    x = app.fire(hello(1))
+    app.flush()
+    assert x.value == 1
+
+    e = run_in_thread(lambda: app.fire(hello(2)))
+    assert isinstance(e, RuntimeError)
+    assert "fireThreadsafe" in str(e)
+    assert len(app) == 0
+
+    run_in_thread(lambda: app.fireThreadsafe(hello(3)))
+    app.tick(0)
+    assert app.values == [1, 3]
+
+    app.threadsafe = True
+    run_in_thread(lambda: app.fire(hello(4)))
+    app.flush()
+    assert app.values == [1, 3, 4]
+
+
+def test_fire_threadsafe_wakes_up():
+    app = App()
+    app.threadsafe = False
+    app.start()
+    try:
+        # Let the main loop go to sleep waiting for events
+        app.flag.wait(0.5)
+        start = time()
+        x = app.fireThreadsafe(hello("World"))
+        assert app.flag.wait(5)
+        assert time() - start < 0.5
+    finally:
+        app.stop()
+        app.join()
+
+    assert x.value == "World"
+    assert not app.threadsafe
+    # The main thread owns the tree again
+    app.fire(hello("again"))
+    app.flush()
+    assert app.values == ["World", "again"]
+
+
+def test_threadsafe_subtree():
+    app = App()
+    app.threadsafe = False
+    child = App().register(app)
+    assert not child.threadsafe
+
+    e = run_in_thread(lambda: child.fire(hello(1)))
+    assert isinstance(e, RuntimeError)
@@ -4,7 +4,7 @@
 from datetime import datetime, timedelta
 from itertools import starmap
 from operator import sub
-from time import time
+from time import sleep as wait, time
 
 import pytest
 
@@ -85,3 +85,46 @@ def test_datetime(app, watcher):
     Timer(d, single()).register(app)
     assert watcher.wait("single_complete")
     assert app.flag
+
+
+def test_reset(app, watcher):
+    timer = Timer(0.2, single()).register(app)
+    for _ in range(3):
+        wait(0.1)
+        timer.reset()
+    assert not app.flag
+    assert watcher.wait("single_complete")
+    assert app.flag
+
+
+def test_unregister(app, watcher):
+    timer = Timer(0.1, single(), persist=True).register(app)
+    assert timer._service is app.root._timers
+    timer.unregister()
+    assert watcher.wait("unregistered")
+    assert timer.root is timer
+    assert timer._service is timer.root._timers
+    assert all(entry is not timer._entry for entry in app.root._timers._heap)
+
+
+def test_timer_service():
+    from circuits.core.manager import _TimerService
+
+    calls = []
+    timers = _TimerService()
+    a = timers.schedule(3, calls.append, "a")
+    b = timers.schedule(1, calls.append, "b")
+    timers.schedule(2, calls.append, "c")
+    assert len(timers) == 3
+    assert timers.next_expiry() == 1
+
+    timers.cancel(b)
+    assert len(timers) == 2
+    assert timers.next_expiry() == 2
+
+    timers.reset(a, 0)
+    assert timers.next_expiry() == 0
+    assert timers.expire(2) == 2
+    assert calls == ["a", "c"]
+    assert not timers
+    assert timers.next_expiry() is None
@@ -137,3 +137,17 @@ def test_multiple_values(app, watcher):
     assert x[0] == "foo"
     assert x[1] == "bar"
     assert x[2] == "Hello World!"
+
+
+def test_value_from_thread():
+    # Fired by this thread while the manager runs in another one, the
+    # Value must be the one the result is stored in.
+    app = App()
+    app.start()
+    try:
+        for i in range(10):
+            x = app.fire(hello())
+            assert pytest.wait_for(x, "result")
+            assert x.value == "Hello World!"
+    finally:
+        app.stop()
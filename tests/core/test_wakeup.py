@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+import os
+import select
+from threading import Event as Flag, Lock
+from time import time
+
+from circuits import Component, Event
+from circuits.core.events import generate_events
+from circuits.core.pollers import EPoll, KQueue, Poll, Select, Selector, selectors
+
+
+class hello(Event):
+
+    """hello Event"""
+
+
+class App(Component):
+
+    def init(self):
+        self.flag = Flag()
+
+    def hello(self):
+        self.flag.set()
+
+
+def pytest_generate_tests(metafunc):
+    pollers = [Select]
+    if hasattr(select, "poll"):
+        pollers.append(Poll)
+    if hasattr(select, "epoll"):
+        pollers.append(EPoll)
+    if hasattr(select, "kqueue"):
+        pollers.append(KQueue)
+    if selectors is not None:
+        pollers.append(Selector)
+    metafunc.parametrize("Poller", pollers)
+
+
+def poll(poller, timeout):
+    start = time()
+    poller._generate_events(generate_events(Lock(), timeout))
+    return time() - start
+
+
+def test_channel(Poller):
+    poller = Poller()
+
+    if hasattr(os, "eventfd"):
+        # No TCP connection to wake the poller up
+        assert poller._ctrl_recv == poller._ctrl_send
+        assert isinstance(poller._ctrl_recv, int)
+
+
+def test_coalesce(Poller):
+    poller = Poller()
+
+    poller.resume()
+    assert poller._ctrl_pending
+    poller.resume()
+    poller.resume()
+
+    assert poll(poller, 5) < 1
+    assert not poller._ctrl_pending
+
+    # All wakeups have been read
+    assert poll(poller, 0.2) >= 0.1
+
+    poller.resume()
+    assert poll(poller, 5) < 1
+
+
+def test_resume_while_reading(Poller):
+    poller = Poller()
+
+    poller.resume()
+    # Another thread's resume() right before the wakeup is read finds it
+    # pending, the flag is cleared once it has been read.
+    poller.resume()
+    poller._read_ctrl()
+    assert not poller._ctrl_pending
+
+    # Nothing to read, the next resume() must wake the poller up
+    assert poll(poller, 0.2) >= 0.1
+    poller.resume()
+    assert poll(poller, 5) < 1
+
+
+def test_fire_from_thread(Poller):
+    app = App() + Poller()
+    app.start()
+
+    try:
+        # Waits for events with an infinite timeout in between
+        for i in range(3):
+            app.flag.clear()
+            app.fire(hello())
+            assert app.flag.wait(5)
+    finally:
+        app.stop()
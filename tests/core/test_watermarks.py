@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+from circuits import Component, Event, handler
+
+
+class read(Event):
+
+    """read Event"""
+
+
+class other(Event):
+
+    """other Event"""
+
+
+class App(Component):
+
+    channel = "app"
+
+    def init(self):
+        self.marks = []
+
+    @handler("high_watermark", "low_watermark", channel="*")
+    def _on_watermark(self, event, channel, name, depth):
+        self.marks.append((event.name, channel, name, depth))
+
+
+def flush(app):
+    while len(app):
+        app.flush()
+
+
+def test_watermarks():
+    app = App()
+    app.setWatermark(4, 1, channel="app", name="read")
+    flush(app)
+
+    for i in range(5):
+        app.fire(read())
+        app.fire(other())
+    app.fire(read(), "elsewhere")
+
+    assert app.getWatermarks()[0]["depth"] == 5
+    assert app.getWatermarks()[0]["paused"]
+
+    flush(app)
+
+    assert app.marks == [
+        ("high_watermark", "app", "read", 4),
+        ("low_watermark", "app", "read", 1),
+    ]
+
+    mark = app.getWatermarks()[0]
+    assert mark["depth"] == 0
+    assert not mark["paused"]
+    assert mark["pauses"] == 1
+
+
+def test_remove_watermark():
+    app = App()
+    app.setWatermark(2)
+    assert app.getWatermarks()[0]["low"] == 1
+
+    app.setWatermark(None)
+    assert app.getWatermarks() == []
+    assert not app._watermarks
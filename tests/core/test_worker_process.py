@@ -71,3 +71,29 @@ def test_args(manager, watcher, worker):
     assert watcher.wait("task_success")
 
     assert x.value == 3
+
+
+def unpicklable():
+    return lambda: None
+
+
+def test_unpicklable_result(manager, watcher):
+    worker = Worker(process=True, workers=1, channel="process").register(manager)
+    assert watcher.wait("registered")
+
+    try:
+        x = worker.fire(task(unpicklable))
+        assert watcher.wait("task_failure", channel="process")
+        assert x.errors
+        assert pytest.wait_for(
+            worker, "stats", lambda w, a: w.stats["pending"] == 0
+        )
+        assert worker.stats["failed"] == 1
+
+        # The slot has been freed
+        x = worker.fire(task(add, 1, 2))
+        assert watcher.wait("task_success", channel="process")
+        assert x.value == 3
+    finally:
+        worker.unregister()
+        assert watcher.wait("unregistered")
@@ -49,3 +49,58 @@ def test_args(manager, watcher, worker):
 
     assert x.result
     assert x.value == 3
+
+
+def test_queue(manager, watcher):
+    from threading import Event as Flag
+
+    flag = Flag()
+    worker = Worker(workers=1, queue=1, channel="bounded").register(manager)
+    assert watcher.wait("registered")
+
+    xs = [manager.fire(task(flag.wait), "bounded")]
+    xs.extend(manager.fire(task(add, i, i), "bounded") for i in range(3))
+
+    assert pytest.wait_for(worker, "stats", lambda w, a: w.stats["queued"] == 3)
+    assert worker.stats["pending"] == 1
+
+    flag.set()
+    assert pytest.wait_for(worker, "stats", lambda w, a: w.stats["completed"] == 4)
+    assert [x.value for x in xs[1:]] == [0, 2, 4]
+
+    stats = worker.stats
+    assert stats["submitted"] == 4
+    assert stats["failed"] == 0
+    assert stats["pending"] == stats["queued"] == 0
+    assert 0 < stats["utilization"] <= 1
+
+    worker.unregister()
+    assert watcher.wait("unregistered")
+
+
+def test_backlog(manager, watcher):
+    from threading import Event as Flag
+
+    from circuits.core.workers import BacklogFull
+
+    flag = Flag()
+    worker = Worker(
+        workers=1, queue=1, backlog=1, channel="bounded"
+    ).register(manager)
+    assert watcher.wait("registered")
+
+    xs = [manager.fire(task(flag.wait), "bounded")]
+    xs.extend(manager.fire(task(add, i, i), "bounded") for i in range(2))
+
+    # The third task doesn't fit in the backlog
+    assert watcher.wait("task_failure", channel="bounded")
+    assert xs[2].errors
+    assert isinstance(xs[2].value[1], BacklogFull)
+    assert worker.stats["queued"] == 1
+
+    flag.set()
+    assert pytest.wait_for(worker, "stats", lambda w, a: w.stats["completed"] == 2)
+    assert xs[1].value == 0
+
+    worker.unregister()
+    assert watcher.wait("unregistered")
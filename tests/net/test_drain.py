@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+import select
+from socket import socketpair
+
+import pytest
+
+from circuits import Component, Manager
+from circuits.core.pollers import EPoll, Poller
+from circuits.net.events import close, connect, write
+from circuits.net.sockets import TCPClient, TCPServer, UDPClient, UDPServer
+
+CHUNK = b"".join(bytes(bytearray([i])) * 1024 for i in range(64))  # 64KB
+DATA = CHUNK * 16  # 1MB
+
+
+def pollers():
+    pollers = [Poller]
+    if hasattr(select, "epoll"):
+        pollers.append(lambda: EPoll(edge=True))
+    return pollers
+
+
+class Receiver(Component):
+
+    def init(self, channel):
+        self.received = bytearray()
+        self.port = None
+        self.sock = None
+        self.connected = False
+
+    def ready(self, component, bind=None):
+        if bind is not None:
+            self.port = bind[1]
+
+    def connect(self, sock, *args):
+        self.sock = sock
+
+    def connected(self, host, port):
+        self.connected = True
+
+    def read(self, *args):
+        self.received += args[-1]
+
+
+def is_set(obj, attr):
+    return getattr(obj, attr) is not None
+
+
+def complete(obj, attr):
+    return len(getattr(obj, attr)) == len(DATA)
+
+
+@pytest.mark.parametrize("poller", pollers(), ids=["default", "edge"])
+def test_tcp(poller):
+    m = Manager() + poller()
+
+    # Small budgets, so that most wakeups use them up
+    options = {"drain_bytes": 8192, "drain_reads": 2}
+    server = Receiver(channel="server") + TCPServer(
+        ("127.0.0.1", 0), channel="server", **options
+    )
+    client = Receiver(channel="client") + TCPClient(
+        channel="client", **options
+    )
+    server.register(m)
+    client.register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(server, "port", is_set)
+        client.fire(connect("127.0.0.1", server.port))
+        assert pytest.wait_for(client, "connected")
+        assert pytest.wait_for(server, "sock", is_set)
+
+        for i in range(len(DATA) // len(CHUNK)):
+            server.fire(write(server.sock, CHUNK))
+        assert pytest.wait_for(client, "received", complete)
+        assert client.received == DATA
+
+        for i in range(len(DATA) // len(CHUNK)):
+            client.fire(write(CHUNK))
+        assert pytest.wait_for(server, "received", complete)
+        assert server.received == DATA
+
+        client.fire(close())
+    finally:
+        m.stop()
+
+
+@pytest.mark.parametrize("poller", pollers(), ids=["default", "edge"])
+def test_udp(poller):
+    m = Manager() + poller()
+
+    server = Receiver(channel="server") + UDPServer(
+        ("127.0.0.1", 0), channel="server", drain_reads=2
+    )
+    client = Receiver(channel="client") + UDPClient(
+        ("127.0.0.1", 0), channel="client"
+    )
+    server.register(m)
+    client.register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(server, "port", is_set)
+
+        # More datagrams than read per wakeup
+        data = [bytes(bytearray([i])) * 100 for i in range(10)]
+        for datagram in data:
+            client.fire(write(("127.0.0.1", server.port), datagram))
+
+        def received(obj, attr):
+            return len(getattr(obj, attr)) == 1000
+
+        assert pytest.wait_for(server, "received", received)
+        assert server.received == b"".join(data)
+    finally:
+        m.stop()
+
+
+class Calls(object):
+
+    def __init__(self, poller):
+        self.poller = poller
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(self.poller, name)
+
+
+@pytest.mark.skipif(not hasattr(select, "epoll"), reason="No epoll support")
+def test_rearm():
+    poller = EPoll(edge=True)
+    a, b = socketpair()
+
+    try:
+        poller.addReader(poller, a)
+        b.send(b"x")
+
+        fileno = a.fileno()
+        assert [fd for fd, _ in poller._poller.poll(1)] == [fileno]
+        assert poller._poller.poll(0) == []
+
+        # Still readable, reported again after one epoll_ctl() call
+        poller._poller = calls = Calls(poller._poller)
+        poller.rearm(a)
+        assert calls.calls == ["modify"]
+        assert [fd for fd, _ in calls.poller.poll(0)] == [fileno]
+    finally:
+        a.close()
+        b.close()
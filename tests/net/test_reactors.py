@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+from socket import create_connection
+
+import pytest
+
+from circuits import Component, Manager
+from circuits.net.reactors import (
+    LEAST_LOADED, PROCESSES, Reactor, Reactors,
+)
+from circuits.net.sockets import TCPServer
+
+
+class Echo(Component):
+
+    channel = "server"
+
+    def read(self, sock, data):
+        return data
+
+
+def echo(sock):
+    return Echo() + TCPServer(sock, accept=False)
+
+
+def pytest_generate_tests(metafunc):
+    if "process" not in metafunc.fixturenames:
+        return
+
+    process = [False]
+    if PROCESSES:
+        process.append(True)
+    metafunc.parametrize("process", process)
+
+
+def start(n, process, **kwargs):
+    m = Manager()
+    reactors = Reactors(
+        ("127.0.0.1", 0), echo, n=n, process=process, **kwargs
+    ).register(m)
+    m.start()
+    # Once the processes have been forked (they would inherit our sockets)
+    assert pytest.wait_for(reactors, "_started")
+    return m, reactors
+
+
+def roundtrip(sock, data):
+    sock.settimeout(10)
+    sock.sendall(data)
+    received = b""
+    while len(received) < len(data):
+        received += sock.recv(4096)
+    return received
+
+
+def loaded(reactor, load):
+    return lambda obj, attr: reactor.load == load
+
+
+def test_round_robin(process):
+    m, reactors = start(2, process)
+
+    socks = []
+    try:
+        for i in range(4):
+            sock = create_connection(("127.0.0.1", reactors.port))
+            socks.append(sock)
+            assert roundtrip(sock, b"hello") == b"hello"
+
+        assert [reactor.given for reactor in reactors.reactors] == [2, 2]
+        for reactor in reactors.reactors:
+            assert isinstance(reactor, Reactor)
+            assert reactor.root is not m
+            assert reactor.load == 2
+
+        socks[0].close()
+        reactor = reactors.reactors[0]
+        assert pytest.wait_for(reactor, "load", loaded(reactor, 1))
+    finally:
+        for sock in socks:
+            sock.close()
+        m.stop()
+
+
+def test_least_loaded(process):
+    m, reactors = start(3, process, balance=LEAST_LOADED)
+
+    socks = []
+    try:
+        for i in range(3):
+            sock = create_connection(("127.0.0.1", reactors.port))
+            socks.append(sock)
+            assert roundtrip(sock, b"hello") == b"hello"
+        assert [reactor.load for reactor in reactors.reactors] == [1, 1, 1]
+
+        socks[1].close()
+        reactor = reactors.reactors[1]
+        assert pytest.wait_for(reactor, "load", loaded(reactor, 0))
+
+        # Round-robin would pick the first one
+        sock = create_connection(("127.0.0.1", reactors.port))
+        socks.append(sock)
+        assert roundtrip(sock, b"hello") == b"hello"
+        assert [reactor.given for reactor in reactors.reactors] == [1, 2, 1]
+    finally:
+        for sock in socks:
+            sock.close()
+        m.stop()
+
+
+def test_factory():
+    with pytest.raises(TypeError):
+        Reactors(("127.0.0.1", 0), lambda sock: Echo(), n=1, process=False)
+
+    with pytest.raises(ValueError):
+        Reactors(("127.0.0.1", 0), echo, balance="random")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+import os
+
+import pytest
+
+from circuits import Manager
+from circuits.core.pollers import Select
+from circuits.net.events import close, write
+from circuits.net.ring import AVAILABLE, RingPipe, _Ring
+
+from .client import Client
+
+pytestmark = pytest.mark.skipif(not AVAILABLE, reason='Unsupported Platform')
+
+
+class Receiver(Client):
+
+    def init(self, *args, **kwargs):
+        self.received = bytearray()
+
+    def read(self, data):
+        self.received += data
+
+
+def test_ring():
+    ring = _Ring(16)
+
+    assert ring.read() == b""
+    assert ring.write(b"0123456789") == 10
+    assert ring.read() == b"0123456789"
+
+    # Wraps around the end of the buffer
+    assert ring.write(b"abcdefghij") == 10
+    assert ring.read() == b"abcdefghij"
+
+    # Only writes what fits
+    assert ring.write(b"x" * 20) == 16
+    assert ring.write(b"y") == 0
+    assert ring.read() == b"x" * 16
+
+    with pytest.raises(ValueError):
+        _Ring(10)
+
+
+def test_ring_pipe():
+    m = Manager() + Select()
+
+    a, b = RingPipe("a", "b")
+    a.register(m)
+    b.register(m)
+
+    a = Client(channel=a.channel).register(m)
+    b = Client(channel=b.channel).register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(a, "ready")
+        assert pytest.wait_for(b, "ready")
+
+        a.fire(write(b"foo"))
+        assert pytest.wait_for(b, "data", b"foo")
+
+        b.fire(write(b"foo"))
+        assert pytest.wait_for(a, "data", b"foo")
+
+        a.fire(close())
+        assert pytest.wait_for(a, "disconnected")
+        assert pytest.wait_for(b, "disconnected")
+    finally:
+        m.stop()
+
+
+def test_ring_pipe_full():
+    m = Manager() + Select()
+
+    a, b = RingPipe("a", "b", size=1024)
+    a.register(m)
+    b.register(m)
+
+    a = Client(channel=a.channel).register(m)
+    b = Receiver(channel=b.channel).register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(a, "ready")
+
+        # Takes many rounds of waiting for space in the ring
+        data = bytes(bytearray(range(256))) * 64
+        a.fire(write(data))
+
+        def complete(obj, attr):
+            return len(getattr(obj, attr)) == len(data)
+
+        assert pytest.wait_for(b, "received", complete)
+        assert b.received == data
+    finally:
+        m.stop()
+
+
+def test_ring_pipe_fork():
+    a, b = RingPipe("a", "b")
+
+    pid = os.fork()
+    if not pid:
+        # Exits without closing its end, after releasing the parent's
+        try:
+            m = Manager() + Select()
+            b.register(m)
+            m.tick()
+            os.fstat(a._rfd)
+        except OSError:
+            os._exit(0)
+        os._exit(1)
+
+    b.release()
+    assert os.waitpid(pid, 0)[1] == 0
+
+    m = Manager() + Select()
+    a.register(m)
+    a = Client(channel=a.channel).register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(a, "disconnected")
+    finally:
+        m.stop()
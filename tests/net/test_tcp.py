@@ -11,7 +11,10 @@ import pytest
 from tests.conftest import WaitEvent
 
 from circuits import Debugger, Manager
-from circuits.core.pollers import EPoll, KQueue, Poll, Select
+from circuits.core.events import high_watermark, low_watermark
+from circuits.core.pollers import (
+    EPoll, KQueue, Poll, Select, Selector, selectors,
+)
 from circuits.net.events import close, connect, write
 from circuits.net.sockets import TCP6Client, TCP6Server, TCPClient, TCPServer
 
@@ -95,6 +98,9 @@ def pytest_generate_tests(metafunc):
         if hasattr(select, "kqueue"):
             poller.append((KQueue, ipv6))
 
+        if selectors is not None:
+            poller.append((Selector, ipv6))
+
     metafunc.parametrize('Poller,ipv6', poller)
 
 
@@ -139,6 +145,97 @@ def test_tcp_basic(Poller, ipv6):
         m.stop()
 
 
+def test_tcp_direct(Poller, ipv6):
+    poller = Poller()
+    m = Manager() + poller
+
+    if ipv6:
+        tcp_server = TCP6Server(("::1", 0), direct=True)
+        tcp_client = TCP6Client(direct=True)
+    else:
+        tcp_server = TCPServer(0, direct=True)
+        tcp_client = TCPClient(direct=True)
+    server = Server() + tcp_server
+    client = Client() + tcp_client
+
+    server.register(m)
+    client.register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(client, "ready")
+        assert pytest.wait_for(server, "ready")
+        wait_host(server)
+
+        client.fire(connect(server.host, server.port))
+        assert pytest.wait_for(client, "connected")
+        assert pytest.wait_for(server, "connected")
+        assert pytest.wait_for(client, "data", b"Ready")
+
+        # Both connected sockets are handled by callbacks
+        assert len(poller._callbacks) == 2
+
+        client.fire(write(b"foo"))
+        assert pytest.wait_for(server, "data", b"foo")
+        assert pytest.wait_for(client, "data", b"foo")
+
+        client.fire(close())
+        assert pytest.wait_for(client, "disconnected")
+        assert pytest.wait_for(server, "disconnected")
+        assert not poller._callbacks
+
+        server.fire(close())
+        assert pytest.wait_for(server, "closed")
+    finally:
+        m.stop()
+
+
+def test_tcp_pause_reading(Poller, ipv6):
+    m = Manager() + Poller()
+
+    if ipv6:
+        tcp_server = TCP6Server(("::1", 0))
+        tcp_client = TCP6Client()
+    else:
+        tcp_server = TCPServer(0)
+        tcp_client = TCPClient()
+    server = Server() + tcp_server
+    client = Client() + tcp_client
+
+    server.register(m)
+    client.register(m)
+
+    m.start()
+
+    try:
+        assert pytest.wait_for(client, "ready")
+        assert pytest.wait_for(server, "ready")
+        wait_host(server)
+
+        client.fire(connect(server.host, server.port))
+        assert pytest.wait_for(client, "connected")
+        assert pytest.wait_for(server, "connected")
+        assert pytest.wait_for(client, "data", b"Ready")
+
+        server.fire(high_watermark("server", "read", 1))
+        assert pytest.wait_for(
+            tcp_server, "_paused", lambda obj, attr: getattr(obj, attr) is not None
+        )
+
+        client.fire(write(b"foo"))
+        assert not pytest.wait_for(server, "data", b"foo", timeout=0.5)
+
+        server.fire(low_watermark("server", "read", 0))
+        assert pytest.wait_for(server, "data", b"foo")
+        assert tcp_server._paused is None
+
+        client.fire(close())
+        assert pytest.wait_for(server, "disconnected")
+    finally:
+        m.stop()
+
+
 def test_tcps_basic(manager, watcher, client, Poller, ipv6):
     poller = Poller().register(manager)
 
@@ -5,7 +5,9 @@ import socket
 import pytest
 
 from circuits import Manager
-from circuits.core.pollers import EPoll, KQueue, Poll, Select
+from circuits.core.pollers import (
+    EPoll, KQueue, Poll, Select, Selector, selectors,
+)
 from circuits.net.events import close, write
 from circuits.net.sockets import UDP6Client, UDP6Server, UDPClient, UDPServer
 
@@ -36,6 +38,9 @@ def pytest_generate_tests(metafunc):
         if hasattr(select, "kqueue"):
             poller.append((KQueue, ipv6))
 
+        if selectors is not None:
+            poller.append((Selector, ipv6))
+
     metafunc.parametrize('Poller,ipv6', poller)
 
 
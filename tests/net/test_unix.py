@@ -8,7 +8,9 @@ import pytest
 from pytest import fixture
 
 from circuits import Manager
-from circuits.core.pollers import EPoll, KQueue, Poll, Select
+from circuits.core.pollers import (
+    EPoll, KQueue, Poll, Select, Selector, selectors,
+)
 from circuits.net.sockets import UNIXClient, UNIXServer, close, connect, write
 
 from .client import Client
@@ -37,6 +39,9 @@ def pytest_generate_tests(metafunc):
 
     if hasattr(select, "kqueue"):
         poller.append(KQueue)
+
+    if selectors is not None:
+        poller.append(Selector)
     metafunc.parametrize('Poller', poller)
 
 
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+from json import loads
+
+from circuits import Metrics
+from circuits.web import MetricsController
+
+from .helpers import HTTPError, urlopen
+
+
+def test(webapp, watcher):
+    MetricsController().register(webapp)
+    assert watcher.wait("registered")
+    metrics = Metrics().register(webapp)
+
+    try:
+        urlopen(webapp.server.http.base)
+    except HTTPError:
+        pass
+
+    f = urlopen("%s/metrics" % webapp.server.http.base)
+    d = loads(f.read().decode("utf-8"))
+    assert d["ticks"] > 0
+    assert d["events"]["request"]["count"] >= 1
+
+    metrics.unregister()
+
+
+def test_disabled(webapp, watcher):
+    MetricsController().register(webapp)
+    assert watcher.wait("registered")
+
+    try:
+        urlopen("%s/metrics" % webapp.server.http.base)
+    except HTTPError as e:
+        assert e.code == 404
+    else:
+        assert False
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+import pytest
+
+from circuits import Manager
+from circuits.net.reactors import PROCESSES, Reactors
+from circuits.web import Controller, Server
+
+from .helpers import urlopen
+
+
+class Root(Controller):
+
+    def index(self):
+        return "Hello World!"
+
+
+def reactor(sock):
+    return Server(sock, accept=False) + Root()
+
+
+@pytest.mark.parametrize("process", [False, True])
+def test(process):
+    if process and not PROCESSES:
+        pytest.skip("Reactor processes are not available")
+
+    m = Manager()
+    reactors = Reactors(
+        ("127.0.0.1", 0), reactor, n=2, process=process
+    ).register(m)
+    m.start()
+
+    try:
+        assert pytest.wait_for(reactors, "_started")
+
+        url = "http://127.0.0.1:{0:d}/".format(reactors.port)
+        for i in range(4):
+            f = urlopen(url)
+            assert f.read() == b"Hello World!"
+            f.close()
+
+        assert [r.given for r in reactors.reactors] == [2, 2]
+    finally:
+        m.stop()